@@ -117,7 +117,7 @@ def authenticate() -> bool:
     """
     logger.info("Starting authentication flow...")
 
-    auth_manager = AuthManager()
+    auth_manager = AuthManager.instance()
     session_manager = SessionManager()
 
     # Check if valid session exists
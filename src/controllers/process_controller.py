@@ -9,6 +9,7 @@ Responsabilidades:
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Tuple, Optional, List
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -28,6 +29,11 @@ class ProcessController(QObject):
 
     # Signal emitted when a process is activated/deactivated
     process_state_changed = pyqtSignal(int, bool)  # process_id, is_active
+    # Signal emitted once per bulk update
+    process_states_changed = pyqtSignal(list)  # [(process_id, is_active), ...]
+
+    # Seconds a cached Process stays valid (absorbs rapid UI toggles)
+    _CACHE_TTL = 2.0
 
     def __init__(self, db_manager: DBManager, config_manager=None, clipboard_manager=None, list_controller=None):
         """
@@ -50,8 +56,39 @@ class ProcessController(QObject):
         self.process_manager = ProcessManager(db_manager)
         self.process_executor = ProcessExecutor(db_manager, clipboard_manager)
 
+        # Short-lived cache of single-process lookups: {process_id: (Process, timestamp)}
+        self._process_cache: dict = {}
+
         logger.info("ProcessController initialized")
 
+    # ==================== CACHE ====================
+
+    def _get_cached(self, process_id: int) -> Optional[Process]:
+        """
+        Get process by ID, reusing a recent lookup if still within TTL
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            Process object or None
+        """
+        cached = self._process_cache.get(process_id)
+        now = time.monotonic()
+        if cached and now - cached[1] < self._CACHE_TTL:
+            return cached[0]
+
+        process = self.process_manager.get_process(process_id)
+        if process:
+            self._process_cache[process_id] = (process, now)
+        else:
+            self._process_cache.pop(process_id, None)
+        return process
+
+    def _invalidate_cache(self, process_id: int):
+        """Drop a cached process after it has been written"""
+        self._process_cache.pop(process_id, None)
+
     # ==================== PROCESS CRUD ====================
 
     def create_process(self, process: Process) -> Tuple[bool, str, Optional[int]]:
@@ -76,7 +113,10 @@ class ProcessController(QObject):
         Returns:
             Tuple of (success, message)
         """
-        return self.process_manager.update_process(process)
+        success, msg = self.process_manager.update_process(process)
+        if success and process.id:
+            self._invalidate_cache(process.id)
+        return success, msg
 
     def get_process(self, process_id: int) -> Optional[Process]:
         """Get process by ID"""
@@ -84,7 +124,7 @@ class ProcessController(QObject):
 
     def get_process_steps(self, process_id: int) -> List:
         """Get all steps for a process"""
-        process = self.process_manager.get_process(process_id)
+        process = self._get_cached(process_id)
         if process:
             return process.steps
         return []
@@ -98,7 +138,10 @@ class ProcessController(QObject):
 
     def delete_process(self, process_id: int) -> Tuple[bool, str]:
         """Delete a process"""
-        return self.process_manager.delete_process(process_id)
+        success, msg = self.process_manager.delete_process(process_id)
+        if success:
+            self._invalidate_cache(process_id)
+        return success, msg
 
     # ==================== EXECUTION ====================
 
@@ -113,7 +156,7 @@ class ProcessController(QObject):
             Success status
         """
         # Get process
-        process = self.process_manager.get_process(process_id)
+        process = self._get_cached(process_id)
         if not process:
             logger.error(f"Process {process_id} not found")
             return False
@@ -137,19 +180,10 @@ class ProcessController(QObject):
             Success status
         """
         try:
-            # Get process
-            process = self.process_manager.get_process(process_id)
-            if not process:
-                logger.error(f"Process {process_id} not found")
-                return False
-
-            # Update pin state
-            process.is_pinned = is_pinned
-
-            # Save to database
-            success, msg = self.process_manager.update_process(process)
+            success, msg = self.process_manager.set_pin(process_id, is_pinned)
 
             if success:
+                self._invalidate_cache(process_id)
                 logger.info(f"Process {process_id} pin state updated to {is_pinned}")
             else:
                 logger.error(f"Failed to update pin state: {msg}")
@@ -170,26 +204,16 @@ class ProcessController(QObject):
             Success status
         """
         try:
-            # Get process
-            process = self.process_manager.get_process(process_id)
-            if not process:
+            is_active = self.process_manager.toggle_active(process_id)
+            if is_active is None:
                 logger.error(f"Process {process_id} not found")
                 return False
 
-            # Toggle is_active
-            process.is_active = not process.is_active
-
-            # Save to database
-            success, msg = self.process_manager.update_process(process)
-
-            if success:
-                logger.info(f"Process {process_id} active state updated to {process.is_active}")
-                # Emit signal for UI refresh
-                self.process_state_changed.emit(process_id, process.is_active)
-            else:
-                logger.error(f"Failed to update active state: {msg}")
-
-            return success
+            self._invalidate_cache(process_id)
+            logger.info(f"Process {process_id} active state updated to {is_active}")
+            # Emit signal for UI refresh
+            self.process_state_changed.emit(process_id, is_active)
+            return True
         except Exception as e:
             logger.error(f"Exception toggling active state: {e}")
             return False
@@ -206,31 +230,52 @@ class ProcessController(QObject):
             Success status
         """
         try:
-            # Get process
-            process = self.process_manager.get_process(process_id)
-            if not process:
-                logger.error(f"Process {process_id} not found")
+            success, msg, changed = self.process_manager.set_active(process_id, is_active)
+
+            if not success:
+                logger.error(f"Failed to update active state: {msg}")
                 return False
 
-            # Check if state is already set
-            if process.is_active == is_active:
+            # Check if state was already set
+            if not changed:
                 logger.info(f"Process {process_id} already has is_active={is_active}")
                 return True
 
-            # Update is_active
-            process.is_active = is_active
+            self._invalidate_cache(process_id)
+            logger.info(f"Process {process_id} active state updated to {is_active}")
+            # Emit signal for UI refresh
+            self.process_state_changed.emit(process_id, is_active)
+            return True
+        except Exception as e:
+            logger.error(f"Exception setting active state: {e}")
+            return False
 
-            # Save to database
-            success, msg = self.process_manager.update_process(process)
+    def set_processes_active(self, process_ids: List[int], is_active: bool) -> bool:
+        """
+        Set active state of several processes at once
 
-            if success:
-                logger.info(f"Process {process_id} active state updated to {is_active}")
-                # Emit signal for UI refresh
-                self.process_state_changed.emit(process_id, is_active)
-            else:
+        Args:
+            process_ids: Process IDs
+            is_active: New active state
+
+        Returns:
+            Success status
+        """
+        try:
+            success, msg, changed_ids = self.process_manager.set_active_bulk(process_ids, is_active)
+
+            if not success:
                 logger.error(f"Failed to update active state: {msg}")
+                return False
 
-            return success
+            for process_id in changed_ids:
+                self._invalidate_cache(process_id)
+
+            logger.info(f"{len(changed_ids)} processes active state updated to {is_active}")
+            # Emit a single signal so the UI refreshes once
+            if changed_ids:
+                self.process_states_changed.emit([(process_id, is_active) for process_id in changed_ids])
+            return True
         except Exception as e:
             logger.error(f"Exception setting active state: {e}")
             return False
@@ -3,6 +3,7 @@ Authentication Manager
 Manages password hashing, verification, and account locking
 """
 import hashlib
+import hmac
 import secrets
 import time
 from pathlib import Path
@@ -18,6 +19,9 @@ class AuthManager:
     MAX_ATTEMPTS = 5  # Maximum failed login attempts
     LOCK_DURATION = 300  # Lock duration in seconds (5 minutes)
 
+    # Shared instance (see instance())
+    _instance = None
+
     def __init__(self, env_file: str = ".env"):
         """
         Initialize AuthManager
@@ -34,6 +38,33 @@ class AuthManager:
         # Load environment variables
         load_dotenv(self.env_file)
 
+        # Cached (password_hash, salt) read from the environment
+        self._credentials: Optional[Tuple[str, str]] = None
+
+    @classmethod
+    def instance(cls) -> "AuthManager":
+        """
+        Get the shared AuthManager for the default .env file
+
+        Reusing one instance avoids re-reading the .env file and keeps the
+        stored hash and salt cached between verifications.
+
+        Returns:
+            Shared AuthManager instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _get_credentials(self) -> Optional[Tuple[str, str]]:
+        """Get stored (password_hash, salt), cached after the first complete read"""
+        if self._credentials is None:
+            stored_hash = self._get_env("PASSWORD_HASH")
+            stored_salt = self._get_env("PASSWORD_SALT")
+            if stored_hash and stored_salt:
+                self._credentials = (stored_hash, stored_salt)
+        return self._credentials
+
     def _get_env(self, key: str, default: str = "") -> str:
         """Get environment variable value"""
         return os.getenv(key, default)
@@ -78,16 +109,16 @@ class AuthManager:
         Returns:
             True if password is correct, False otherwise
         """
-        stored_hash = self._get_env("PASSWORD_HASH")
-        stored_salt = self._get_env("PASSWORD_SALT")
-
-        if not stored_hash or not stored_salt:
+        credentials = self._get_credentials()
+        if credentials is None:
             return False
+        stored_hash, stored_salt = credentials
 
         # Hash the provided password with stored salt
         new_hash, _ = self.hash_password(password, stored_salt)
 
-        return new_hash == stored_hash
+        # Constant-time comparison
+        return hmac.compare_digest(new_hash, stored_hash)
 
     def is_first_time(self) -> bool:
         """
@@ -111,6 +142,7 @@ class AuthManager:
         # Save to .env
         self._set_env("PASSWORD_HASH", password_hash)
         self._set_env("PASSWORD_SALT", salt)
+        self._credentials = (password_hash, salt)
 
         # Reset failed attempts
         self.reset_failed_attempts()
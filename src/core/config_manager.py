@@ -14,6 +14,43 @@ from src.models.item import Item, ItemType
 from src.database.db_manager import DBManager
 from src.core.encryption_manager import EncryptionManager
 
+# orjson (optional): 2-10x faster JSON encode/decode for config export/import
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson (optional): streaming parse for large config imports
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Buffer size for config export/import file I/O
+_JSON_IO_BUFFER = 64 * 1024
+
+# Import files at least this large are parsed incrementally (when ijson is available)
+_STREAMING_IMPORT_THRESHOLD = 1024 * 1024
+
+
+def _dumps_json_bytes(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Type orjson cannot serialize: fall back to stdlib json
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_json_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ConfigManager:
     """Manages application configuration using SQLite"""
@@ -322,6 +359,18 @@ class ConfigManager:
         """
         return self.db.get_setting(key, default)
 
+    def get_settings_bulk(self, keys: tuple) -> Dict[str, Any]:
+        """
+        Get several settings with a single database query
+
+        Args:
+            keys: Setting keys to read
+
+        Returns:
+            Dict[str, Any]: Values of the keys that exist (missing keys are omitted)
+        """
+        return self.db.get_settings_bulk(keys)
+
     def set_setting(self, key: str, value: Any) -> bool:
         """
         Set a specific setting
@@ -333,6 +382,8 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
+        # Unchanged values are detected by the database against the stored
+        # JSON (see DBManager.set_setting), so they hold across instances
         try:
             self.db.set_setting(key, value)
             return True
@@ -391,8 +442,8 @@ class ConfigManager:
                 "categories": [cat.to_dict() for cat in categories]
             }
 
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(export_path, 'wb', buffering=_JSON_IO_BUFFER) as f:
+                f.write(_dumps_json_bytes(export_data))
 
             return True
 
@@ -400,31 +451,42 @@ class ConfigManager:
             print(f"Error exporting config: {e}")
             return False
 
-    def import_config(self, import_path: Path) -> bool:
+    def import_config(self, import_path: Path, streaming: Optional[bool] = None) -> bool:
         """
         Import configuration from JSON file
 
         Args:
             import_path: Path to import file
+            streaming: Parse incrementally with ijson instead of loading the whole
+                document (default: only for files of 1 MB or more). Falls back to
+                a full parse when ijson is not installed.
 
         Returns:
             bool: True if successful
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if streaming is None:
+                streaming = Path(import_path).stat().st_size >= _STREAMING_IMPORT_THRESHOLD
+
+            with open(import_path, 'rb', buffering=_JSON_IO_BUFFER) as f:
+                if streaming and IJSON_AVAILABLE:
+                    # Import settings, one key/value in memory at a time
+                    for key, value in ijson.kvitems(f, 'settings', use_float=True):
+                        self.db.set_setting(key, value)
+
+                    # Second pass over the file for the categories array
+                    f.seek(0)
+                    self._import_categories(ijson.items(f, 'categories.item', use_float=True))
+                else:
+                    data = _loads_json_bytes(f.read())
 
-            # Import settings
-            settings = data.get('settings', {})
-            for key, value in settings.items():
-                self.db.set_setting(key, value)
+                    # Import settings
+                    settings = data.get('settings', {})
+                    for key, value in settings.items():
+                        self.db.set_setting(key, value)
 
-            # Import categories
-            categories_data = data.get('categories', [])
-            for cat_data in categories_data:
-                category = Category.from_dict(cat_data)
-                if category.validate():
-                    self.add_category(category)
+                    # Import categories
+                    self._import_categories(data.get('categories', []))
 
             # Clear cache
             self._categories_cache = None
@@ -472,6 +534,18 @@ class ConfigManager:
 
     # ========== PRIVATE HELPER METHODS ==========
 
+    def _import_categories(self, categories_data) -> None:
+        """
+        Add imported categories that pass validation
+
+        Args:
+            categories_data: Iterable of category dicts (list or ijson stream)
+        """
+        for cat_data in categories_data:
+            category = Category.from_dict(cat_data)
+            if category.validate():
+                self.add_category(category)
+
     def _dict_to_category(self, data: Dict) -> Category:
         """
         Convert database dict to Category object
@@ -246,6 +246,86 @@ class ProcessManager:
             logger.error(f"Error deleting process {process_id}: {e}", exc_info=True)
             return False, f"Error deleting process: {str(e)}"
 
+    def set_pin(self, process_id: int, is_pinned: bool) -> Tuple[bool, str]:
+        """
+        Update only the pin state of a process (no step rewrite)
+
+        Args:
+            process_id: Process ID
+            is_pinned: New pin state
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            if not self.db.set_process_pinned(process_id, is_pinned):
+                return False, "Process not found"
+
+            logger.debug(f"Process {process_id} is_pinned set to {is_pinned}")
+            return True, "Pin state updated"
+
+        except Exception as e:
+            logger.error(f"Error updating pin state of process {process_id}: {e}", exc_info=True)
+            return False, f"Error updating pin state: {str(e)}"
+
+    def set_active(self, process_id: int, is_active: bool) -> Tuple[bool, str, bool]:
+        """
+        Update only the active state of a process (no step rewrite)
+
+        Args:
+            process_id: Process ID
+            is_active: New active state
+
+        Returns:
+            Tuple of (success, message, changed)
+        """
+        try:
+            changed = self.db.set_process_active(process_id, is_active)
+            if changed is None:
+                return False, "Process not found", False
+
+            logger.debug(f"Process {process_id} is_active set to {is_active} (changed={changed})")
+            return True, "Active state updated", changed
+
+        except Exception as e:
+            logger.error(f"Error updating active state of process {process_id}: {e}", exc_info=True)
+            return False, f"Error updating active state: {str(e)}", False
+
+    def set_active_bulk(self, process_ids: List[int], is_active: bool) -> Tuple[bool, str, List[int]]:
+        """
+        Update the active state of several processes in one transaction
+
+        Args:
+            process_ids: Process IDs
+            is_active: New active state
+
+        Returns:
+            Tuple of (success, message, changed_ids)
+        """
+        try:
+            changed_ids = self.db.set_processes_active(process_ids, is_active)
+            return True, f"{len(changed_ids)} processes updated", changed_ids
+
+        except Exception as e:
+            logger.error(f"Error bulk updating active state: {e}", exc_info=True)
+            return False, f"Error updating active state: {str(e)}", []
+
+    def toggle_active(self, process_id: int) -> Optional[bool]:
+        """
+        Toggle the active state of a process (no step rewrite)
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            New active state, or None if not found / on error
+        """
+        try:
+            return self.db.toggle_process_active(process_id)
+        except Exception as e:
+            logger.error(f"Error toggling active state of process {process_id}: {e}", exc_info=True)
+            return None
+
     # ==================== STEP MANAGEMENT ====================
 
     def add_step(self, process_id: int, item_id: int, step_order: int = None,
@@ -0,0 +1,149 @@
+"""
+Thumbnail Loader
+Decodifica miniaturas de imágenes en un pool de hilos propio y acotado
+"""
+
+import logging
+import os
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+logger = logging.getLogger(__name__)
+
+# Decodificar es sobre todo E/S de disco: más hilos solo compiten por el mismo disco
+_THUMBNAIL_POOL_MAX_THREADS = min(4, os.cpu_count() or 1)
+
+
+class _ThumbnailSignals(QObject):
+    """Señales de un ThumbnailRequest (QRunnable no hereda de QObject)"""
+    finished = pyqtSignal(QImage, int, int)  # miniatura, ancho y alto originales
+
+
+class ThumbnailRequest:
+    """
+    Miniatura pedida a ThumbnailLoader
+
+    Handle cancelable: si se cancela antes de decodificar, el trabajo se
+    descarta sin leer la imagen y no se emite ninguna señal.
+    """
+
+    def __init__(self, image_path: str, size: int):
+        self.image_path = image_path
+        self.size = size
+        self.signals = _ThumbnailSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Cancelar la petición (sin efecto si ya se entregó)"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Verificar si la petición fue cancelada"""
+        return self._cancelled
+
+
+class _ThumbnailTask(QRunnable):
+    """
+    Decodifica una imagen a tamaño de miniatura en un hilo del pool
+
+    Usa QImageReader.setScaledSize para no decodificar la imagen completa.
+    Trabaja con QImage (seguro fuera del hilo de la GUI); el QPixmap se crea
+    en el hilo de la GUI al recibir la señal. Si la imagen no se puede leer
+    se emite un QImage nulo.
+    """
+
+    def __init__(self, request: ThumbnailRequest):
+        super().__init__()
+        self.request = request
+
+    def run(self):
+        request = self.request
+        if request.is_cancelled():
+            return
+
+        size = request.size
+        try:
+            reader = QImageReader(request.image_path)
+            reader.setAutoTransform(True)
+
+            # Dimensiones originales desde la cabecera (sin decodificar píxeles)
+            original_size = reader.size()
+            width, height = original_size.width(), original_size.height()
+
+            # Última oportunidad de evitar la decodificación
+            if request.is_cancelled():
+                return
+
+            if original_size.isValid():
+                # Decodificar directamente al tamaño de la miniatura, manteniendo
+                # aspect ratio (JPEG escala durante la decodificación)
+                reader.setScaledSize(
+                    original_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio)
+                )
+                image = reader.read()
+            else:
+                # Formato sin tamaño en cabecera: decodificar completa y escalar
+                image = reader.read()
+                width, height = image.width(), image.height()
+                if not image.isNull():
+                    image = image.scaled(
+                        size, size,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+        except Exception as e:
+            logger.error(f"Error decodificando miniatura {request.image_path}: {e}")
+            image, width, height = QImage(), 0, 0
+
+        if not request.is_cancelled():
+            request.signals.finished.emit(image, width, height)
+
+
+class ThumbnailLoader:
+    """
+    Servicio único de carga de miniaturas
+
+    Todas las peticiones pasan por un QThreadPool propio con pocos hilos y cola
+    FIFO, en vez de inundar el pool global con una tarea por imagen.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(_THUMBNAIL_POOL_MAX_THREADS)
+
+    @classmethod
+    def instance(cls) -> "ThumbnailLoader":
+        """
+        Obtener la instancia compartida
+
+        Returns:
+            ThumbnailLoader único del proceso
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def request(self, image_path: str, callback: Callable[[QImage, int, int], None],
+                size: int = 100) -> ThumbnailRequest:
+        """
+        Encolar la decodificación de una miniatura
+
+        El callback se invoca en el hilo de la GUI con (miniatura, ancho, alto);
+        la miniatura es un QImage nulo si la imagen no se pudo leer.
+
+        Args:
+            image_path: Ruta de la imagen
+            callback: Slot que recibe el resultado
+            size: Lado máximo de la miniatura en píxeles
+
+        Returns:
+            ThumbnailRequest para cancelar la petición
+        """
+        request = ThumbnailRequest(image_path, size)
+        request.signals.finished.connect(callback)
+        self._pool.start(_ThumbnailTask(request))
+        return request
@@ -4,12 +4,56 @@ Coordina búsquedas globales de items y tags mostrando todas sus relaciones
 """
 
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Set
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, Set, Callable, Sequence
 from enum import Enum
 
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
 logger = logging.getLogger(__name__)
 
+# Valor compartido para relaciones vacías (inmutable, evita crear una lista por campo)
+_EMPTY: Sequence[str] = ()
+
+# SQLite serializa las escrituras; más de 2 workers no aporta nada
+_SEARCH_POOL_MAX_THREADS = 2
+_search_pool: Optional[QThreadPool] = None
+
+
+def _get_search_pool() -> QThreadPool:
+    """Devuelve el pool de hilos compartido para búsquedas en segundo plano"""
+    global _search_pool
+    if _search_pool is None:
+        _search_pool = QThreadPool()
+        _search_pool.setMaxThreadCount(_SEARCH_POOL_MAX_THREADS)
+    return _search_pool
+
+
+class _SearchTaskSignals(QObject):
+    """Señales de un _SearchTask (QRunnable no hereda de QObject)"""
+    finished = pyqtSignal(object)
+
+
+class _SearchTask(QRunnable):
+    """Ejecuta una búsqueda síncrona en un hilo del pool"""
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _SearchTaskSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Error in background search: {e}", exc_info=True)
+            result = None
+        self.signals.finished.emit(result)
+
 
 class SearchResultType(Enum):
     """Tipos de resultados de búsqueda"""
@@ -20,6 +64,55 @@ class SearchResultType(Enum):
     AREA_TAG = "area_tag"
 
 
+# Columna tag_type de universal_search_tags -> tipo de resultado
+_TAG_TYPE_MAP = {
+    'item_tag': SearchResultType.TAG,
+    'category_tag': SearchResultType.CATEGORY_TAG,
+    'project_tag': SearchResultType.PROJECT_TAG,
+    'area_tag': SearchResultType.AREA_TAG,
+}
+
+
+# Columnas de una fila de item, en el orden posicional de los campos de SearchResult
+_ITEM_ROW_KEYS = (
+    'id', 'label', 'content', 'icon', 'color', 'description',
+    'proyectos', 'areas', 'categoria_name', 'tabla_name', 'procesos', 'lista_name', 'tags',
+    'use_count', 'created_at', 'updated_at', 'last_used', 'is_sensitive', 'is_favorite'
+)
+_get_item_row = itemgetter(*_ITEM_ROW_KEYS)
+_ITEM_TYPE = SearchResultType.ITEM
+
+
+# Bit de cada filtro de entidad en SearchResult.presence_mask
+ENTITY_FILTER_BITS = {
+    'proyectos': 1 << 0,
+    'areas': 1 << 1,
+    'categorias': 1 << 2,
+    'tablas': 1 << 3,
+    'procesos': 1 << 4,
+}
+
+
+def entity_filter_mask(entity_filters: Optional[Dict[str, bool]]) -> int:
+    """
+    Convierte un dict de filtros de entidad en una máscara de bits
+
+    Args:
+        entity_filters: Dict con keys de ENTITY_FILTER_BITS y valores booleanos
+
+    Returns:
+        Máscara con los bits de los filtros activos (0 si no hay ninguno)
+    """
+    # Caso habitual: ningún filtro marcado
+    if not entity_filters or not any(entity_filters.values()):
+        return 0
+    mask = 0
+    for key, bit in ENTITY_FILTER_BITS.items():
+        if entity_filters.get(key, False):
+            mask |= bit
+    return mask
+
+
 class EntityType(Enum):
     """Tipos de entidades que pueden contener items/tags"""
     PROYECTO = "proyecto"
@@ -30,14 +123,14 @@ class EntityType(Enum):
     LISTA = "lista"
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemRelationships:
     """Estructura de datos para relaciones de un item"""
-    proyectos: List[str] = field(default_factory=list)
-    areas: List[str] = field(default_factory=list)
+    proyectos: Sequence[str] = _EMPTY
+    areas: Sequence[str] = _EMPTY
     categoria: Optional[str] = None
     tabla: Optional[str] = None
-    procesos: List[str] = field(default_factory=list)
+    procesos: Sequence[str] = _EMPTY
     lista: Optional[str] = None
 
     def has_any_relationship(self) -> bool:
@@ -59,7 +152,7 @@ class ItemRelationships:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Resultado de búsqueda universal"""
     result_type: SearchResultType
@@ -71,15 +164,15 @@ class SearchResult:
     description: str = ""
 
     # Relaciones - pueden ser múltiples
-    proyectos: List[str] = field(default_factory=list)
-    areas: List[str] = field(default_factory=list)
+    proyectos: Sequence[str] = _EMPTY
+    areas: Sequence[str] = _EMPTY
     categoria: Optional[str] = None
     tabla: Optional[str] = None
-    procesos: List[str] = field(default_factory=list)
+    procesos: Sequence[str] = _EMPTY
     lista: Optional[str] = None
 
     # Tags asociados
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = _EMPTY
 
     # Metadata adicional
     use_count: int = 0
@@ -89,6 +182,22 @@ class SearchResult:
     is_sensitive: bool = False
     is_favorite: bool = False
 
+    # Máscara de relaciones presentes (ver ENTITY_FILTER_BITS), calculada al construir
+    presence_mask: int = field(default=0, init=False, repr=False, compare=False)
+    # Tags en minúsculas para filtros case-insensitive, calculados al construir
+    tags_lower: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.tags:
+            self.tags_lower = frozenset(tag.lower() for tag in self.tags)
+        self.presence_mask = (
+            (ENTITY_FILTER_BITS['proyectos'] if self.proyectos else 0) |
+            (ENTITY_FILTER_BITS['areas'] if self.areas else 0) |
+            (ENTITY_FILTER_BITS['categorias'] if self.categoria else 0) |
+            (ENTITY_FILTER_BITS['tablas'] if self.tabla else 0) |
+            (ENTITY_FILTER_BITS['procesos'] if self.procesos else 0)
+        )
+
     def matches_entity_filter(self, entity_filters: Dict[str, bool]) -> bool:
         """
         Verifica si el resultado coincide con los filtros de entidad activos
@@ -100,25 +209,13 @@ class SearchResult:
         Returns:
             True si el resultado debe mostrarse según los filtros
         """
+        filter_mask = entity_filter_mask(entity_filters)
+
         # Si no hay filtros activos, mostrar todo
-        if not any(entity_filters.values()):
+        if not filter_mask:
             return True
 
-        # Verificar cada tipo de entidad
-        has_match = False
-
-        if entity_filters.get('proyectos', False) and self.proyectos:
-            has_match = True
-        if entity_filters.get('areas', False) and self.areas:
-            has_match = True
-        if entity_filters.get('categorias', False) and self.categoria:
-            has_match = True
-        if entity_filters.get('tablas', False) and self.tabla:
-            has_match = True
-        if entity_filters.get('procesos', False) and self.procesos:
-            has_match = True
-
-        return has_match
+        return bool(self.presence_mask & filter_mask)
 
     def has_all_tags(self, required_tags: List[str]) -> bool:
         """
@@ -133,8 +230,8 @@ class SearchResult:
         if not required_tags:
             return True
 
-        result_tags_lower = {tag.lower() for tag in self.tags}
-        return all(tag.lower() in result_tags_lower for tag in required_tags)
+        tags_lower = self.tags_lower
+        return all(tag.lower() in tags_lower for tag in required_tags)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convierte a diccionario para serialización"""
@@ -176,8 +273,33 @@ class UniversalSearchEngine:
             db_manager: Instancia de DBManager para acceso a base de datos
         """
         self.db = db_manager
+        # Señales de tareas en curso (evita que se destruyan antes de entregar el resultado)
+        self._pending_signals: Set[_SearchTaskSignals] = set()
         logger.info("UniversalSearchEngine initialized")
 
+    def run_async(self, func: Callable, callback: Callable[[Any], None], *args, **kwargs):
+        """
+        Ejecuta func(*args, **kwargs) en un hilo del pool de búsqueda
+
+        El callback se invoca en el hilo que hizo la llamada (normalmente el hilo
+        de UI) con el valor devuelto, o None si func lanzó una excepción.
+        El debounce debe hacerse en el llamador, no aquí.
+
+        Args:
+            func: Función síncrona a ejecutar (p.ej. self.search_items)
+            callback: Función que recibe el resultado
+        """
+        task = _SearchTask(func, args, kwargs)
+        signals = task.signals
+        self._pending_signals.add(signals)
+
+        def deliver(result):
+            self._pending_signals.discard(signals)
+            callback(result)
+
+        signals.finished.connect(deliver)
+        _get_search_pool().start(task)
+
     def search_all(
         self,
         query: str,
@@ -197,6 +319,10 @@ class UniversalSearchEngine:
         Returns:
             Lista de SearchResult con todas las relaciones
         """
+        # Nada que buscar: evitar el viaje a la BD
+        if not (query or '').strip() or not (search_items or search_tags):
+            return []
+
         results = []
 
         if search_items:
@@ -222,42 +348,14 @@ class UniversalSearchEngine:
         Returns:
             Lista de SearchResult para items
         """
+        if not (query or '').strip():
+            return []
+
         try:
             # Obtener items usando búsqueda FTS5 del DBManager
             raw_items = self.db.universal_search_items(query, limit=limit, offset=offset)
 
-            results = []
-            for item_data in raw_items:
-                # Crear SearchResult con todas las relaciones
-                result = SearchResult(
-                    result_type=SearchResultType.ITEM,
-                    id=item_data['id'],
-                    name=item_data['label'],
-                    content=item_data.get('content', ''),
-                    icon=item_data.get('icon', ''),
-                    color=item_data.get('color', ''),
-                    description=item_data.get('description', ''),
-
-                    # Relaciones (vienen del query SQL)
-                    proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                    areas=self._parse_comma_separated(item_data.get('areas')),
-                    categoria=item_data.get('categoria_name'),
-                    tabla=item_data.get('tabla_name'),
-                    procesos=self._parse_comma_separated(item_data.get('procesos')),
-                    lista=item_data.get('lista_name'),
-
-                    # Tags del item
-                    tags=self._parse_comma_separated(item_data.get('tags')),
-
-                    # Metadata
-                    use_count=item_data.get('use_count', 0),
-                    created_at=item_data.get('created_at', ''),
-                    updated_at=item_data.get('updated_at', ''),
-                    last_used=item_data.get('last_used', ''),
-                    is_sensitive=bool(item_data.get('is_sensitive', False)),
-                    is_favorite=bool(item_data.get('is_favorite', False))
-                )
-                results.append(result)
+            results = [self._row_to_item_result(item_data) for item_data in raw_items]
 
             logger.debug(f"Found {len(results)} items for query '{query}'")
             return results
@@ -277,6 +375,9 @@ class UniversalSearchEngine:
         Returns:
             Lista de SearchResult para tags
         """
+        if not (query or '').strip():
+            return []
+
         try:
             # Obtener tags de todas las tablas
             raw_tags = self.db.universal_search_tags(query, limit=limit)
@@ -284,17 +385,9 @@ class UniversalSearchEngine:
             results = []
             for tag_data in raw_tags:
                 # Determinar tipo de tag
-                tag_type_str = tag_data.get('tag_type', 'item_tag')
-                if tag_type_str == 'item_tag':
-                    result_type = SearchResultType.TAG
-                elif tag_type_str == 'category_tag':
-                    result_type = SearchResultType.CATEGORY_TAG
-                elif tag_type_str == 'project_tag':
-                    result_type = SearchResultType.PROJECT_TAG
-                elif tag_type_str == 'area_tag':
-                    result_type = SearchResultType.AREA_TAG
-                else:
-                    result_type = SearchResultType.TAG
+                result_type = _TAG_TYPE_MAP.get(
+                    tag_data.get('tag_type', 'item_tag'), SearchResultType.TAG
+                )
 
                 result = SearchResult(
                     result_type=result_type,
@@ -369,21 +462,22 @@ class UniversalSearchEngine:
         Returns:
             Lista filtrada de SearchResult
         """
-        filtered = results
+        # Normalizar filtros una sola vez
+        filter_mask = entity_filter_mask(entity_filters)
+        required_tags = frozenset(tag.lower() for tag in tag_filters) if tag_filters else None
 
-        # Aplicar filtro de entidades
-        if entity_filters:
+        # Una sola pasada con ambos predicados
+        if filter_mask and required_tags:
             filtered = [
-                r for r in filtered
-                if r.matches_entity_filter(entity_filters)
-            ]
-
-        # Aplicar filtro de tags
-        if tag_filters:
-            filtered = [
-                r for r in filtered
-                if r.has_all_tags(tag_filters)
+                r for r in results
+                if r.presence_mask & filter_mask and required_tags <= r.tags_lower
             ]
+        elif filter_mask:
+            filtered = [r for r in results if r.presence_mask & filter_mask]
+        elif required_tags:
+            filtered = [r for r in results if required_tags <= r.tags_lower]
+        else:
+            filtered = results
 
         logger.debug(f"Applied filters: {len(results)} -> {len(filtered)} results")
         return filtered
@@ -401,34 +495,7 @@ class UniversalSearchEngine:
         try:
             raw_items = self.db.get_most_used_items(limit=limit)
 
-            results = []
-            for item_data in raw_items:
-                result = SearchResult(
-                    result_type=SearchResultType.ITEM,
-                    id=item_data['id'],
-                    name=item_data['label'],
-                    content=item_data.get('content', ''),
-                    icon=item_data.get('icon', ''),
-                    color=item_data.get('color', ''),
-                    description=item_data.get('description', ''),
-
-                    proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                    areas=self._parse_comma_separated(item_data.get('areas')),
-                    categoria=item_data.get('categoria_name'),
-                    tabla=item_data.get('tabla_name'),
-                    procesos=self._parse_comma_separated(item_data.get('procesos')),
-                    lista=item_data.get('lista_name'),
-
-                    tags=self._parse_comma_separated(item_data.get('tags')),
-
-                    use_count=item_data.get('use_count', 0),
-                    created_at=item_data.get('created_at', ''),
-                    updated_at=item_data.get('updated_at', ''),
-                    last_used=item_data.get('last_used', ''),
-                    is_sensitive=bool(item_data.get('is_sensitive', False)),
-                    is_favorite=bool(item_data.get('is_favorite', False))
-                )
-                results.append(result)
+            results = [self._row_to_item_result(item_data) for item_data in raw_items]
 
             return results
 
@@ -449,34 +516,7 @@ class UniversalSearchEngine:
         try:
             raw_items = self.db.get_items_with_tags(limit=limit)
 
-            results = []
-            for item_data in raw_items:
-                result = SearchResult(
-                    result_type=SearchResultType.ITEM,
-                    id=item_data['id'],
-                    name=item_data['label'],
-                    content=item_data.get('content', ''),
-                    icon=item_data.get('icon', ''),
-                    color=item_data.get('color', ''),
-                    description=item_data.get('description', ''),
-
-                    proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                    areas=self._parse_comma_separated(item_data.get('areas')),
-                    categoria=item_data.get('categoria_name'),
-                    tabla=item_data.get('tabla_name'),
-                    procesos=self._parse_comma_separated(item_data.get('procesos')),
-                    lista=item_data.get('lista_name'),
-
-                    tags=self._parse_comma_separated(item_data.get('tags')),
-
-                    use_count=item_data.get('use_count', 0),
-                    created_at=item_data.get('created_at', ''),
-                    updated_at=item_data.get('updated_at', ''),
-                    last_used=item_data.get('last_used', ''),
-                    is_sensitive=bool(item_data.get('is_sensitive', False)),
-                    is_favorite=bool(item_data.get('is_favorite', False))
-                )
-                results.append(result)
+            results = [self._row_to_item_result(item_data) for item_data in raw_items]
 
             return results
 
@@ -497,34 +537,7 @@ class UniversalSearchEngine:
         try:
             raw_items = self.db.get_recent_items(limit=limit)
 
-            results = []
-            for item_data in raw_items:
-                result = SearchResult(
-                    result_type=SearchResultType.ITEM,
-                    id=item_data['id'],
-                    name=item_data['label'],
-                    content=item_data.get('content', ''),
-                    icon=item_data.get('icon', ''),
-                    color=item_data.get('color', ''),
-                    description=item_data.get('description', ''),
-
-                    proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                    areas=self._parse_comma_separated(item_data.get('areas')),
-                    categoria=item_data.get('categoria_name'),
-                    tabla=item_data.get('tabla_name'),
-                    procesos=self._parse_comma_separated(item_data.get('procesos')),
-                    lista=item_data.get('lista_name'),
-
-                    tags=self._parse_comma_separated(item_data.get('tags')),
-
-                    use_count=item_data.get('use_count', 0),
-                    created_at=item_data.get('created_at', ''),
-                    updated_at=item_data.get('updated_at', ''),
-                    last_used=item_data.get('last_used', ''),
-                    is_sensitive=bool(item_data.get('is_sensitive', False)),
-                    is_favorite=bool(item_data.get('is_favorite', False))
-                )
-                results.append(result)
+            results = [self._row_to_item_result(item_data) for item_data in raw_items]
 
             return results
 
@@ -532,33 +545,102 @@ class UniversalSearchEngine:
             logger.error(f"Error getting recent items: {e}", exc_info=True)
             return []
 
-    def extract_unique_tags(self, results: List[SearchResult]) -> List[tuple]:
+    def _row_to_item_result(self, item_data: Dict[str, Any]) -> SearchResult:
+        """
+        Construye un SearchResult de tipo ITEM a partir de una fila de la BD
+
+        Las consultas de DBManager devuelven todas las columnas de _ITEM_ROW_KEYS,
+        así que se extraen con un único itemgetter y se construye por posición.
+        Si falta alguna columna se usa el camino lento con valores por defecto.
+
+        Args:
+            item_data: Dict con las columnas del item y sus relaciones
+
+        Returns:
+            SearchResult con todas las relaciones
+        """
+        try:
+            (item_id, label, content, icon, color, description,
+             proyectos, areas, categoria, tabla, procesos, lista, tags,
+             use_count, created_at, updated_at, last_used,
+             is_sensitive, is_favorite) = _get_item_row(item_data)
+        except KeyError:
+            return self._row_to_item_result_with_defaults(item_data)
+
+        parse = self._parse_comma_separated
+
+        return SearchResult(
+            _ITEM_TYPE, item_id, label, content, icon, color, description,
+            parse(proyectos), parse(areas), categoria, tabla, parse(procesos), lista,
+            parse(tags),
+            use_count, created_at, updated_at, last_used,
+            bool(is_sensitive), bool(is_favorite)
+        )
+
+    def _row_to_item_result_with_defaults(self, item_data: Dict[str, Any]) -> SearchResult:
+        """Igual que _row_to_item_result, tolerando columnas ausentes"""
+        get = item_data.get
+        parse = self._parse_comma_separated
+
+        return SearchResult(
+            result_type=SearchResultType.ITEM,
+            id=item_data['id'],
+            name=item_data['label'],
+            content=get('content', ''),
+            icon=get('icon', ''),
+            color=get('color', ''),
+            description=get('description', ''),
+
+            # Relaciones (vienen del query SQL)
+            proyectos=parse(get('proyectos')),
+            areas=parse(get('areas')),
+            categoria=get('categoria_name'),
+            tabla=get('tabla_name'),
+            procesos=parse(get('procesos')),
+            lista=get('lista_name'),
+
+            # Tags del item
+            tags=parse(get('tags')),
+
+            # Metadata
+            use_count=get('use_count', 0),
+            created_at=get('created_at', ''),
+            updated_at=get('updated_at', ''),
+            last_used=get('last_used', ''),
+            is_sensitive=bool(get('is_sensitive', False)),
+            is_favorite=bool(get('is_favorite', False))
+        )
+
+    def extract_unique_tags(
+        self,
+        results: List[SearchResult],
+        tag_counts: Optional[Dict[str, int]] = None
+    ) -> List[tuple]:
         """
         Extrae tags únicos de los resultados con conteo
 
         Args:
             results: Lista de resultados
+            tag_counts: Conteo ya calculado {tag_lower: count}; si se pasa,
+                        no se recorre results
+
+        Note:
+            Cada tag cuenta una vez por resultado (tags_lower ya viene sin duplicados)
 
         Returns:
             Lista de tuplas (tag_name, count) ordenada por count descendente
         """
-        tag_counts: Dict[str, int] = {}
-
-        for result in results:
-            for tag in result.tags:
-                tag_lower = tag.lower()
-                tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
+        if tag_counts is None:
+            tag_counts = Counter()
+            for result in results:
+                tag_counts.update(result.tags_lower)
+        elif not isinstance(tag_counts, Counter):
+            tag_counts = Counter(tag_counts)
 
         # Ordenar por count descendente
-        sorted_tags = sorted(
-            tag_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        return sorted_tags
+        return tag_counts.most_common()
 
-    def _parse_comma_separated(self, value: Optional[str]) -> List[str]:
+    def _parse_comma_separated(self, value: Optional[str]) -> Sequence[str]:
         """
         Parsea string separado por comas a lista
 
@@ -566,18 +648,19 @@ class UniversalSearchEngine:
             value: String con valores separados por comas
 
         Returns:
-            Lista de strings
+            Lista de strings (tupla vacía compartida si no hay valores)
         """
         if not value:
-            return []
+            return _EMPTY
 
         # Manejar tanto strings como listas
         if isinstance(value, list):
             return value
 
         # Split por coma y limpiar espacios
-        items = [item.strip() for item in str(value).split(',') if item.strip()]
-        return items
+        if not isinstance(value, str):
+            value = str(value)
+        return [item for item in map(str.strip, value.split(',')) if item]
 
     def get_statistics(self, results: List[SearchResult]) -> Dict[str, Any]:
         """
@@ -589,19 +672,47 @@ class UniversalSearchEngine:
         Returns:
             Dict con estadísticas
         """
+        n_items = n_listas = n_favorites = n_sensitive = 0
+        # Histograma de presence_mask: como mucho 32 combinaciones de relaciones
+        mask_counts: Dict[int, int] = {}
+        unique_tags: Set[str] = set()
+        item_type = SearchResultType.ITEM
+
+        # Una sola pasada sobre los resultados
+        for r in results:
+            if r.result_type is item_type:
+                n_items += 1
+            mask = r.presence_mask
+            mask_counts[mask] = mask_counts.get(mask, 0) + 1
+            if r.lista:
+                n_listas += 1
+            if r.is_favorite:
+                n_favorites += 1
+            if r.is_sensitive:
+                n_sensitive += 1
+            if r.tags_lower:
+                unique_tags.update(r.tags_lower)
+
+        # Conteos por relación a partir del histograma (no de cada resultado)
+        relation_counts = {
+            key: sum(count for mask, count in mask_counts.items() if mask & bit)
+            for key, bit in ENTITY_FILTER_BITS.items()
+        }
+
+        total = len(results)
         stats = {
-            'total': len(results),
-            'items': sum(1 for r in results if r.result_type == SearchResultType.ITEM),
-            'tags': sum(1 for r in results if r.result_type != SearchResultType.ITEM),
-            'with_proyectos': sum(1 for r in results if r.proyectos),
-            'with_areas': sum(1 for r in results if r.areas),
-            'with_categorias': sum(1 for r in results if r.categoria),
-            'with_tablas': sum(1 for r in results if r.tabla),
-            'with_procesos': sum(1 for r in results if r.procesos),
-            'with_listas': sum(1 for r in results if r.lista),
-            'unique_tags': len(self.extract_unique_tags(results)),
-            'favorites': sum(1 for r in results if r.is_favorite),
-            'sensitive': sum(1 for r in results if r.is_sensitive)
+            'total': total,
+            'items': n_items,
+            'tags': total - n_items,
+            'with_proyectos': relation_counts['proyectos'],
+            'with_areas': relation_counts['areas'],
+            'with_categorias': relation_counts['categorias'],
+            'with_tablas': relation_counts['tablas'],
+            'with_procesos': relation_counts['procesos'],
+            'with_listas': n_listas,
+            'unique_tags': len(unique_tags),
+            'favorites': n_favorites,
+            'sensitive': n_sensitive
         }
 
         return stats
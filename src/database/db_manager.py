@@ -6,6 +6,8 @@ Manages SQLite database operations for settings, categories, items, and clipboar
 import sqlite3
 import json
 import logging
+import queue
+import threading
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
+    # Read-only connections available for concurrent searches (see read_conn)
+    READ_POOL_SIZE = 4
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """
         Initialize database manager
@@ -31,6 +36,9 @@ class DBManager:
         self.db_path = Path(db_path)
         self.connection = None
         self._fts5_available = None  # Caché para verificación de FTS5
+        self._read_pool = None  # queue.Queue of read-only connections, created lazily
+        self._read_pool_created = 0
+        self._read_pool_lock = threading.Lock()
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -63,11 +71,74 @@ class DBManager:
 
     def close(self):
         """Close database connection"""
+        if self._read_pool is not None:
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._read_pool = None
+            self._read_pool_created = 0
+
         if self.connection:
             self.connection.close()
             self.connection = None
             logger.info("Database connection closed")
 
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a read-only connection for the read pool"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = 1")
+        return conn
+
+    @contextmanager
+    def read_conn(self):
+        """
+        Context manager yielding a read-only connection from a small pool
+
+        Lets searches running on worker threads read in parallel instead of
+        serializing on the single writer connection. Writes must keep using
+        connect()/transaction(). In-memory databases cannot be shared between
+        connections, so they fall back to the main connection.
+
+        Usage:
+            with db.read_conn() as conn:
+                conn.execute(...)
+        """
+        if str(self.db_path) == ":memory:":
+            yield self.connect()
+            return
+
+        with self._read_pool_lock:
+            if self._read_pool is None:
+                # WAL lets readers proceed while the writer connection commits
+                try:
+                    self.connect().execute("PRAGMA journal_mode = WAL")
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not enable WAL mode: {e}")
+                self._read_pool = queue.Queue()
+            pool = self._read_pool
+
+            conn = None
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                if self._read_pool_created < self.READ_POOL_SIZE:
+                    conn = self._open_read_connection()
+                    self._read_pool_created += 1
+
+        if conn is None:
+            conn = pool.get()
+
+        try:
+            yield conn
+        finally:
+            if pool is self._read_pool:
+                pool.put(conn)
+            else:
+                conn.close()
+
     @contextmanager
     def transaction(self):
         """
@@ -1108,6 +1179,9 @@ class DBManager:
         """
         Save or update configuration setting
 
+        Rows whose stored JSON already equals the new value are left untouched
+        (no write, updated_at kept).
+
         Args:
             key: Setting key
             value: Setting value (will be JSON encoded)
@@ -1119,10 +1193,35 @@ class DBManager:
             ON CONFLICT(key) DO UPDATE SET
                 value = excluded.value,
                 updated_at = CURRENT_TIMESTAMP
+            WHERE settings.value IS NOT excluded.value
         """
         self.execute_update(query, (key, value_json))
         logger.debug(f"Setting saved: {key} = {value}")
 
+    def get_settings_bulk(self, keys) -> Dict[str, Any]:
+        """
+        Get several configuration settings in a single query
+
+        Args:
+            keys: Iterable of setting keys
+
+        Returns:
+            Dict[str, Any]: Values of the keys that exist (missing keys are omitted)
+        """
+        keys = tuple(keys)
+        if not keys:
+            return {}
+
+        placeholders = ','.join('?' * len(keys))
+        query = f"SELECT key, value FROM settings WHERE key IN ({placeholders})"
+        settings = {}
+        for row in self.execute_query(query, keys):
+            try:
+                settings[row['key']] = json.loads(row['value'])
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse setting '{row['key']}': {e}")
+        return settings
+
     def get_all_settings(self) -> Dict[str, Any]:
         """
         Get all configuration settings
@@ -6059,6 +6158,118 @@ class DBManager:
         logger.info(f"Process {process_id} deleted")
         return True
 
+    def set_process_pinned(self, process_id: int, is_pinned: bool) -> bool:
+        """
+        Set pin state of a process with a single targeted UPDATE
+
+        Args:
+            process_id: Process ID
+            is_pinned: New pin state
+
+        Returns:
+            bool: True if the process exists, False otherwise
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE processes SET is_pinned = ?, updated_at = ? WHERE id = ?
+            """, (int(is_pinned), datetime.now().isoformat(), process_id))
+
+        return cursor.rowcount > 0
+
+    def set_process_active(self, process_id: int, is_active: bool) -> Optional[bool]:
+        """
+        Set active state of a process with a single targeted UPDATE
+
+        Args:
+            process_id: Process ID
+            is_active: New active state
+
+        Returns:
+            True if the state changed, False if it was already set,
+            None if the process does not exist
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE processes SET is_active = ?, updated_at = ?
+                WHERE id = ? AND is_active != ?
+            """, (int(is_active), datetime.now().isoformat(), process_id, int(is_active)))
+
+            if cursor.rowcount > 0:
+                return True
+
+            exists = conn.execute(
+                "SELECT 1 FROM processes WHERE id = ?", (process_id,)
+            ).fetchone()
+
+        return False if exists else None
+
+    def set_processes_active(self, process_ids: List[int], is_active: bool) -> List[int]:
+        """
+        Set active state of several processes in a single transaction
+
+        Args:
+            process_ids: Process IDs to update
+            is_active: New active state
+
+        Returns:
+            List of process IDs whose state actually changed
+        """
+        changed_ids = []
+        if not process_ids:
+            return changed_ids
+
+        ids = list(dict.fromkeys(process_ids))
+        timestamp = datetime.now().isoformat()
+        chunk_size = 500  # Stay below SQLITE_MAX_VARIABLE_NUMBER
+
+        with self.transaction() as conn:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ', '.join('?' * len(chunk))
+
+                cursor = conn.execute(f"""
+                    SELECT id FROM processes
+                    WHERE id IN ({placeholders}) AND is_active != ?
+                """, (*chunk, int(is_active)))
+                pending = [row[0] for row in cursor.fetchall()]
+                if not pending:
+                    continue
+
+                placeholders = ', '.join('?' * len(pending))
+                conn.execute(f"""
+                    UPDATE processes SET is_active = ?, updated_at = ?
+                    WHERE id IN ({placeholders})
+                """, (int(is_active), timestamp, *pending))
+                changed_ids.extend(pending)
+
+        logger.info(f"Bulk is_active={is_active}: {len(changed_ids)}/{len(ids)} processes changed")
+        return changed_ids
+
+    def toggle_process_active(self, process_id: int) -> Optional[bool]:
+        """
+        Flip active state of a process without loading the full row
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            New active state, or None if the process does not exist
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE processes SET is_active = NOT is_active, updated_at = ?
+                WHERE id = ?
+            """, (datetime.now().isoformat(), process_id))
+
+            if cursor.rowcount == 0:
+                return None
+
+            row = conn.execute(
+                "SELECT is_active FROM processes WHERE id = ?", (process_id,)
+            ).fetchone()
+
+        return bool(row[0])
+
     def search_processes(self, query: str) -> List[Dict[str, Any]]:
         """
         Search processes by name, description, or tags
@@ -9291,157 +9502,157 @@ class DBManager:
             List[Dict]: Items con todas sus relaciones (proyectos, areas, categorias, etc.)
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
+            with self.read_conn() as conn:
+                cursor = conn.cursor()
 
-            # Verificar si existe FTS5 (con caché)
-            has_fts = self._check_fts5_available()
-
-            if has_fts and query.strip():
-                # Usar FTS5 para búsqueda rápida
-                # Usar búsqueda sin comillas para permitir coincidencias parciales
-                search_query = f'{query}*'  # Búsqueda flexible (sin comillas)
-
-                query_sql = """
-                WITH item_results AS (
-                    SELECT DISTINCT
-                        i.id,
-                        i.label,
-                        i.content,
-                        i.icon,
-                        i.type,
-                        i.use_count,
-                        i.created_at,
-                        i.updated_at,
-                        i.last_used,
-                        i.tags,
-                        i.description,
-                        i.color,
-                        i.is_sensitive,
-                        i.is_favorite,
-                        -- Relación directa con categoría
-                        c.name as categoria_name,
-                        c.id as categoria_id,
-                        -- Relación directa con lista
-                        l.name as lista_name,
-                        l.id as lista_id,
-                        -- Relación directa con tabla
-                        t.name as tabla_name,
-                        t.id as tabla_id
-                    FROM items i
-                    LEFT JOIN categories c ON i.category_id = c.id
-                    LEFT JOIN listas l ON i.list_id = l.id
-                    LEFT JOIN tables t ON i.table_id = t.id
-                    WHERE i.id IN (
-                        SELECT item_id FROM items_fts
-                        WHERE items_fts MATCH ?
+                # Verificar si existe FTS5 (con caché)
+                has_fts = self._check_fts5_available()
+
+                if has_fts and query.strip():
+                    # Usar FTS5 para búsqueda rápida
+                    # Usar búsqueda sin comillas para permitir coincidencias parciales
+                    search_query = f'{query}*'  # Búsqueda flexible (sin comillas)
+
+                    query_sql = """
+                    WITH item_results AS (
+                        SELECT DISTINCT
+                            i.id,
+                            i.label,
+                            i.content,
+                            i.icon,
+                            i.type,
+                            i.use_count,
+                            i.created_at,
+                            i.updated_at,
+                            i.last_used,
+                            i.tags,
+                            i.description,
+                            i.color,
+                            i.is_sensitive,
+                            i.is_favorite,
+                            -- Relación directa con categoría
+                            c.name as categoria_name,
+                            c.id as categoria_id,
+                            -- Relación directa con lista
+                            l.name as lista_name,
+                            l.id as lista_id,
+                            -- Relación directa con tabla
+                            t.name as tabla_name,
+                            t.id as tabla_id
+                        FROM items i
+                        LEFT JOIN categories c ON i.category_id = c.id
+                        LEFT JOIN listas l ON i.list_id = l.id
+                        LEFT JOIN tables t ON i.table_id = t.id
+                        WHERE i.id IN (
+                            SELECT item_id FROM items_fts
+                            WHERE items_fts MATCH ?
+                        )
+                        AND i.is_active = 1
                     )
-                    AND i.is_active = 1
-                )
-                SELECT
-                    ir.*,
-                    -- Proyectos vinculados
-                    GROUP_CONCAT(DISTINCT p.name) as proyectos,
-                    -- Áreas vinculadas
-                    GROUP_CONCAT(DISTINCT a.name) as areas,
-                    -- Procesos vinculados
-                    GROUP_CONCAT(DISTINCT proc.name) as procesos
-                FROM item_results ir
-                -- Join con proyectos vía project_relations
-                LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
-                LEFT JOIN proyectos p ON pr.project_id = p.id
-                -- Join con áreas vía area_relations
-                LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
-                LEFT JOIN areas a ON ar.area_id = a.id
-                -- Join con procesos vía process_items
-                LEFT JOIN process_items pi ON pi.item_id = ir.id
-                LEFT JOIN processes proc ON pi.process_id = proc.id
-                GROUP BY ir.id
-                ORDER BY ir.use_count DESC, ir.updated_at DESC
-                LIMIT ? OFFSET ?
-                """
-                try:
-                    cursor.execute(query_sql, (search_query, limit, offset))
-                    # Verificar si hay resultados inmediatamente
-                    rows = cursor.fetchall()
-                    if rows:
-                        columns = [desc[0] for desc in cursor.description]
-                        results = []
-                        for row in rows:
-                            results.append(dict(zip(columns, row)))
-                        logger.debug(f"Universal search (FTS5) found {len(results)} items")
-                        return results
+                    SELECT
+                        ir.*,
+                        -- Proyectos vinculados
+                        GROUP_CONCAT(DISTINCT p.name) as proyectos,
+                        -- Áreas vinculadas
+                        GROUP_CONCAT(DISTINCT a.name) as areas,
+                        -- Procesos vinculados
+                        GROUP_CONCAT(DISTINCT proc.name) as procesos
+                    FROM item_results ir
+                    -- Join con proyectos vía project_relations
+                    LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
+                    LEFT JOIN proyectos p ON pr.project_id = p.id
+                    -- Join con áreas vía area_relations
+                    LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
+                    LEFT JOIN areas a ON ar.area_id = a.id
+                    -- Join con procesos vía process_items
+                    LEFT JOIN process_items pi ON pi.item_id = ir.id
+                    LEFT JOIN processes proc ON pi.process_id = proc.id
+                    GROUP BY ir.id
+                    ORDER BY ir.use_count DESC, ir.updated_at DESC
+                    LIMIT ? OFFSET ?
+                    """
+                    try:
+                        cursor.execute(query_sql, (search_query, limit, offset))
+                        # Verificar si hay resultados inmediatamente
+                        rows = cursor.fetchall()
+                        if rows:
+                            columns = [desc[0] for desc in cursor.description]
+                            results = []
+                            for row in rows:
+                                results.append(dict(zip(columns, row)))
+                            logger.debug(f"Universal search (FTS5) found {len(results)} items")
+                            return results
                     
-                    # Si no hay resultados FTS, indicamos que continúe al fallback
-                    logger.debug("FTS5 search yielded 0 results, falling back to LIKE")
+                        # Si no hay resultados FTS, indicamos que continúe al fallback
+                        logger.debug("FTS5 search yielded 0 results, falling back to LIKE")
                     
-                except sqlite3.OperationalError as e:
-                    # Si hay error de sintaxis FTS5, hacer fallback a LIKE
-                    logger.warning(f"FTS5 query error, fallback to LIKE: {e}")
-                    has_fts = False  # Forzar uso de LIKE
-
-            # Si llegamos aquí, es porque FTS estaba deshabilitado, falló, o no dio resultados
-            # Ejecutar búsqueda LIKE (Fallback)
-            if query.strip():
-                search_pattern = f"%{query}%" if query.strip() else "%"
-
-                query_sql = """
-                WITH item_results AS (
-                    SELECT DISTINCT
-                        i.id,
-                        i.label,
-                        i.content,
-                        i.icon,
-                        i.type,
-                        i.use_count,
-                        i.created_at,
-                        i.updated_at,
-                        i.last_used,
-                        i.tags,
-                        i.description,
-                        i.color,
-                        i.is_sensitive,
-                        i.is_favorite,
-                        c.name as categoria_name,
-                        c.id as categoria_id,
-                        l.name as lista_name,
-                        l.id as lista_id,
-                        t.name as tabla_name,
-                        t.id as tabla_id
-                    FROM items i
-                    LEFT JOIN categories c ON i.category_id = c.id
-                    LEFT JOIN listas l ON i.list_id = l.id
-                    LEFT JOIN tables t ON i.table_id = t.id
-                    WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
-                    AND i.is_active = 1
-                )
-                SELECT
-                    ir.*,
-                    GROUP_CONCAT(DISTINCT p.name) as proyectos,
-                    GROUP_CONCAT(DISTINCT a.name) as areas,
-                    GROUP_CONCAT(DISTINCT proc.name) as procesos
-                FROM item_results ir
-                LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
-                LEFT JOIN proyectos p ON pr.project_id = p.id
-                LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
-                LEFT JOIN areas a ON ar.area_id = a.id
-                LEFT JOIN process_items pi ON pi.item_id = ir.id
-                LEFT JOIN processes proc ON pi.process_id = proc.id
-                GROUP BY ir.id
-                ORDER BY ir.use_count DESC, ir.updated_at DESC
-                LIMIT ? OFFSET ?
-                """
-                cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern, limit, offset))
-
-            # Convertir a dict
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                item_dict = dict(zip(columns, row))
-                results.append(item_dict)
+                    except sqlite3.OperationalError as e:
+                        # Si hay error de sintaxis FTS5, hacer fallback a LIKE
+                        logger.warning(f"FTS5 query error, fallback to LIKE: {e}")
+                        has_fts = False  # Forzar uso de LIKE
+
+                # Si llegamos aquí, es porque FTS estaba deshabilitado, falló, o no dio resultados
+                # Ejecutar búsqueda LIKE (Fallback)
+                if query.strip():
+                    search_pattern = f"%{query}%" if query.strip() else "%"
+
+                    query_sql = """
+                    WITH item_results AS (
+                        SELECT DISTINCT
+                            i.id,
+                            i.label,
+                            i.content,
+                            i.icon,
+                            i.type,
+                            i.use_count,
+                            i.created_at,
+                            i.updated_at,
+                            i.last_used,
+                            i.tags,
+                            i.description,
+                            i.color,
+                            i.is_sensitive,
+                            i.is_favorite,
+                            c.name as categoria_name,
+                            c.id as categoria_id,
+                            l.name as lista_name,
+                            l.id as lista_id,
+                            t.name as tabla_name,
+                            t.id as tabla_id
+                        FROM items i
+                        LEFT JOIN categories c ON i.category_id = c.id
+                        LEFT JOIN listas l ON i.list_id = l.id
+                        LEFT JOIN tables t ON i.table_id = t.id
+                        WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
+                        AND i.is_active = 1
+                    )
+                    SELECT
+                        ir.*,
+                        GROUP_CONCAT(DISTINCT p.name) as proyectos,
+                        GROUP_CONCAT(DISTINCT a.name) as areas,
+                        GROUP_CONCAT(DISTINCT proc.name) as procesos
+                    FROM item_results ir
+                    LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
+                    LEFT JOIN proyectos p ON pr.project_id = p.id
+                    LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
+                    LEFT JOIN areas a ON ar.area_id = a.id
+                    LEFT JOIN process_items pi ON pi.item_id = ir.id
+                    LEFT JOIN processes proc ON pi.process_id = proc.id
+                    GROUP BY ir.id
+                    ORDER BY ir.use_count DESC, ir.updated_at DESC
+                    LIMIT ? OFFSET ?
+                    """
+                    cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern, limit, offset))
+
+                # Convertir a dict
+                columns = [desc[0] for desc in cursor.description]
+                results = []
+                for row in cursor.fetchall():
+                    item_dict = dict(zip(columns, row))
+                    results.append(item_dict)
 
-            logger.debug(f"Universal search found {len(results)} items for query '{query}'")
-            return results
+                logger.debug(f"Universal search found {len(results)} items for query '{query}'")
+                return results
 
         except Exception as e:
             logger.error(f"Error en universal_search_items: {e}", exc_info=True)
@@ -9458,43 +9669,43 @@ class DBManager:
             int: Número total de items encontrados
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
+            with self.read_conn() as conn:
+                cursor = conn.cursor()
 
-            # Verificar si existe FTS5 (con caché)
-            has_fts = self._check_fts5_available()
+                # Verificar si existe FTS5 (con caché)
+                has_fts = self._check_fts5_available()
 
-            if has_fts and query.strip():
-                # Usar FTS5 para búsqueda rápida
-                # Usar búsqueda sin comillas para permitir coincidencias parciales
-                search_query = f'{query}*'
+                if has_fts and query.strip():
+                    # Usar FTS5 para búsqueda rápida
+                    # Usar búsqueda sin comillas para permitir coincidencias parciales
+                    search_query = f'{query}*'
 
-                query_sql = """
-                SELECT COUNT(DISTINCT i.id)
-                FROM items i
-                WHERE i.id IN (
-                    SELECT item_id FROM items_fts
-                    WHERE items_fts MATCH ?
-                )
-                AND i.is_active = 1
-                """
-                cursor.execute(query_sql, (search_query,))
-            else:
-                # Fallback a LIKE
-                search_pattern = f"%{query}%" if query.strip() else "%"
+                    query_sql = """
+                    SELECT COUNT(DISTINCT i.id)
+                    FROM items i
+                    WHERE i.id IN (
+                        SELECT item_id FROM items_fts
+                        WHERE items_fts MATCH ?
+                    )
+                    AND i.is_active = 1
+                    """
+                    cursor.execute(query_sql, (search_query,))
+                else:
+                    # Fallback a LIKE
+                    search_pattern = f"%{query}%" if query.strip() else "%"
 
-                query_sql = """
-                SELECT COUNT(DISTINCT i.id)
-                FROM items i
-                WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
-                AND i.is_active = 1
-                """
-                cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern))
+                    query_sql = """
+                    SELECT COUNT(DISTINCT i.id)
+                    FROM items i
+                    WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
+                    AND i.is_active = 1
+                    """
+                    cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern))
 
-            result = cursor.fetchone()
-            count = result[0] if result else 0
-            logger.debug(f"Universal search count: {count} items for query '{query}'")
-            return count
+                result = cursor.fetchone()
+                count = result[0] if result else 0
+                logger.debug(f"Universal search count: {count} items for query '{query}'")
+                return count
 
         except Exception as e:
             logger.error(f"Error en universal_search_items_count: {e}", exc_info=True)
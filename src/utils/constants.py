@@ -15,15 +15,52 @@ ITEM_TYPES = ['CODE', 'URL', 'PATH', 'TEXT', 'WEB_STATIC']
 WEB_STATIC_SIZE_SOFT_LIMIT = 100 * 1024  # 100 KB - advertencia
 WEB_STATIC_SIZE_HARD_LIMIT = 500 * 1024  # 500 KB - rechazo
 
+# Profundidad máxima de anidamiento de tags en WEB_STATIC (mismo límite que WebKit)
+MAX_TAG_DEPTH = 512
+
+
+def _run_without(word: str, stop: str, tail: str = '') -> str:
+    """
+    Expresión para un tramo sin caracteres de stop que no contiene otro inicio del patrón
+
+    El inicio prohibido es word (seguido de un carácter de tail si se indica).
+    Si el tramo lo contuviera, ese inicio posterior produce la misma coincidencia,
+    así que detecta lo mismo que un [^stop]* pero cada carácter se escanea desde
+    un solo inicio: la búsqueda es lineal. El primer carácter de word no puede
+    repetirse dentro de word.
+    """
+    first, rest = word[0], word[1:]
+    assert first not in rest
+    # first ya está excluido si es un carácter de stop (p.ej. '<')
+    excluded = stop if first in stop else stop + first
+    partials = [rest[:k] for k in range(1, len(rest))]
+    exits = [f'{rest[:k]}[^{excluded}{rest[k]}]' for k in range(len(rest))]
+    if tail:
+        partials.append(rest)
+        exits.append(f'{rest}[^{excluded}{tail}]')
+    # Prefijos del inicio prohibido; el siguiente trozo vuelve a empezar por first
+    pending = f'(?:{first}(?:{"|".join(partials)})?)'
+    return f'(?:[^{excluded}]|{pending}*{first}(?:{"|".join(exits)}))*{pending}*'
+
+
+_IMPORT_PATTERN = r'import\s(?:\s*\n)?' + _run_without('import', r'\n', r'\s') + 'from'
+_SCRIPT_SRC_PATTERN = '<script' + _run_without('<script', '<>') + 'src='
+_LINK_HREF_PATTERN = '<link' + _run_without('<link', '<>') + r'href=["\']https?://'
+_IMG_SRC_PATTERN = '<img' + _run_without('<img', '<>') + r'src=["\']https?://'
+
 # Patrones peligrosos para validación de seguridad
+# Los tramos intermedios no cruzan el delimitador ('>' o salto de línea) ni otro
+# inicio del mismo patrón, para que el escaneo sea lineal incluso con HTML
+# malicioso sin dejar de detectar lo mismo que [^>]* / .*
+# Sin lookarounds: deben seguir siendo compatibles con RE2.
 DANGEROUS_PATTERNS = [
     r'<iframe',                          # Iframes
     r'fetch\s*\(',                       # Llamadas fetch
     r'XMLHttpRequest',                   # AJAX
-    r'import\s+.*from',                  # ES6 imports externos
-    r'<script[^>]*src=',                 # Scripts externos
-    r'<link[^>]*href=["\']https?://',   # CSS externos
-    r'<img[^>]*src=["\']https?://',     # Imágenes externas
+    _IMPORT_PATTERN,                     # ES6 imports externos
+    _SCRIPT_SRC_PATTERN,                 # Scripts externos
+    _LINK_HREF_PATTERN,                  # CSS externos
+    _IMG_SRC_PATTERN,                    # Imágenes externas
     r'eval\s*\(',                        # eval()
     r'Function\s*\(',                    # Constructor Function
     r'localStorage',                     # localStorage
@@ -31,6 +68,25 @@ DANGEROUS_PATTERNS = [
     r'document\.cookie',                 # Acceso a cookies
 ]
 
+# Forma legible (equivalente) de los patrones generados, para los mensajes al usuario
+DANGEROUS_PATTERN_LABELS = {
+    _IMPORT_PATTERN: r'import\s+.*from',
+    _SCRIPT_SRC_PATTERN: r'<script[^>]*src=',
+    _LINK_HREF_PATTERN: r'<link[^>]*href=["\']https?://',
+    _IMG_SRC_PATTERN: r'<img[^>]*src=["\']https?://',
+}
+
+# Todos los patrones peligrosos en una sola expresión (una pasada sobre el texto)
+DANGEROUS_REGEX = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in DANGEROUS_PATTERNS),
+    re.IGNORECASE
+)
+
+
+def find_dangerous(text: str):
+    """Devuelve la primera coincidencia de cualquier patrón peligroso, o None"""
+    return DANGEROUS_REGEX.search(text)
+
 # Íconos para tipos de items
 ITEM_TYPE_ICONS = {
     'CODE': '💻',
@@ -3,15 +3,56 @@ Validador de contenido HTML para items WEB_STATIC.
 Incluye validación de sintaxis, tamaño y patrones peligrosos.
 """
 
+import hashlib
 import re
+from collections import Counter, OrderedDict
 from html.parser import HTMLParser
 from typing import Tuple, List
 from src.utils.constants import (
     WEB_STATIC_SIZE_SOFT_LIMIT,
     WEB_STATIC_SIZE_HARD_LIMIT,
-    DANGEROUS_PATTERNS
+    MAX_TAG_DEPTH,
+    DANGEROUS_PATTERNS,
+    DANGEROUS_PATTERN_LABELS,
+    find_dangerous
 )
 
+# Patrones peligrosos compilados una sola vez: (patrón legible, regex compilada)
+_COMPILED_DANGEROUS = tuple(
+    (DANGEROUS_PATTERN_LABELS.get(pattern, pattern), re.compile(pattern, re.IGNORECASE))
+    for pattern in DANGEROUS_PATTERNS
+)
+
+# RE2 (opcional): compila todos los patrones en un único autómata lineal
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _build_dangerous_set():
+    """Compila DANGEROUS_PATTERNS en un re2.Set; None si RE2 no está disponible"""
+    if not RE2_AVAILABLE:
+        return None
+    try:
+        options = re2.Options()
+        options.case_sensitive = False
+        pattern_set = re2.Set.SearchSet(options)
+        for pattern in DANGEROUS_PATTERNS:
+            pattern_set.Add(pattern)
+        pattern_set.Compile()
+        return pattern_set
+    except Exception:
+        return None
+
+
+_DANGEROUS_SET = _build_dangerous_set()
+
+
+class _AbortParse(Exception):
+    """Interrumpe el parseo cuando el contenido excede los límites de seguridad"""
+
 
 class HTMLSyntaxValidator(HTMLParser):
     """Parser HTML para validación de sintaxis básica mejorado"""
@@ -20,6 +61,10 @@ class HTMLSyntaxValidator(HTMLParser):
         super().__init__()
         self.errors = []
         self.tag_stack = []
+        # Número de aperturas pendientes por tag (pertenencia O(1) al stack)
+        self.open_counts = Counter()
+        # Tags abiertos que no son de cierre opcional (anidamiento real)
+        self.depth = 0
         # Tags que pueden auto-cerrarse (void elements HTML5)
         self.void_elements = {
             'area', 'base', 'br', 'col', 'embed', 'hr', 'img',
@@ -36,7 +81,14 @@ class HTMLSyntaxValidator(HTMLParser):
         if tag in self.void_elements:
             return
 
+        if tag not in self.optional_close:
+            if self.depth >= MAX_TAG_DEPTH:
+                self.errors.append(f"Anidamiento excesivo de tags (más de {MAX_TAG_DEPTH} niveles)")
+                raise _AbortParse()
+            self.depth += 1
+
         self.tag_stack.append(tag)
+        self.open_counts[tag] += 1
 
     def handle_startendtag(self, tag, attrs):
         """Maneja tags auto-cerrados como <img />, <meta />"""
@@ -60,10 +112,10 @@ class HTMLSyntaxValidator(HTMLParser):
             return
 
         # Buscar el tag en el stack (permite HTML5 con tags opcionales)
-        if tag in self.tag_stack:
+        if self.open_counts[tag] > 0:
             # Encontrar la posición del tag
             idx = len(self.tag_stack) - 1
-            while idx >= 0 and self.tag_stack[idx] != tag:
+            while self.tag_stack[idx] != tag:
                 # Si hay tags con cierre opcional entre medio, auto-cerrarlos silenciosamente
                 if self.tag_stack[idx] not in self.optional_close:
                     # Solo reportar error si no es un tag opcional común
@@ -74,8 +126,11 @@ class HTMLSyntaxValidator(HTMLParser):
                 idx -= 1
 
             # Remover el tag y todos los opcionales antes (pop desde idx)
-            if idx >= 0:
-                self.tag_stack = self.tag_stack[:idx]
+            while len(self.tag_stack) > idx:
+                popped = self.tag_stack.pop()
+                self.open_counts[popped] -= 1
+                if popped not in self.optional_close:
+                    self.depth -= 1
         else:
             # Tag no encontrado en el stack - solo reportar si no es opcional
             if tag not in self.optional_close:
@@ -88,6 +143,11 @@ class HTMLSyntaxValidator(HTMLParser):
             self.errors.append(f"Error de sintaxis: {message}")
 
 
+# Tamaño de bloque al alimentar HTMLSyntaxValidator y máximo de errores antes de abortar
+_FEED_CHUNK_SIZE = 16 * 1024
+_MAX_SYNTAX_ERRORS = 50
+
+
 def validate_html_syntax(html_content: str) -> Tuple[bool, List[str]]:
     """
     Valida sintaxis HTML básica.
@@ -104,7 +164,15 @@ def validate_html_syntax(html_content: str) -> Tuple[bool, List[str]]:
     parser = HTMLSyntaxValidator()
 
     try:
-        parser.feed(html_content)
+        # Alimentar por bloques: corta en cuanto se alcanza el máximo de errores
+        for start in range(0, len(html_content), _FEED_CHUNK_SIZE):
+            parser.feed(html_content[start:start + _FEED_CHUNK_SIZE])
+            if len(parser.errors) > _MAX_SYNTAX_ERRORS:
+                del parser.errors[_MAX_SYNTAX_ERRORS:]
+                return False, parser.errors
+        parser.close()
+    except _AbortParse:
+        return False, parser.errors
     except Exception as e:
         return False, [f"Error al parsear HTML: {str(e)}"]
 
@@ -128,7 +196,16 @@ def validate_html_size(content: str) -> Tuple[bool, str, str]:
         Tupla de (es_válido, nivel_advertencia, mensaje)
         nivel_advertencia: 'ok' | 'warning' | 'error'
     """
-    size_bytes = len(content.encode('utf-8'))
+    # ASCII puro (caso habitual): bytes UTF-8 == caracteres, sin copiar el contenido
+    if content.isascii():
+        size_bytes = len(content)
+    else:
+        size_bytes = len(content.encode('utf-8'))
+    return _size_result(size_bytes)
+
+
+def _size_result(size_bytes: int) -> Tuple[bool, str, str]:
+    """Clasifica un tamaño en bytes según los límites de WEB_STATIC"""
     size_kb = size_bytes / 1024
 
     if size_bytes > WEB_STATIC_SIZE_HARD_LIMIT:
@@ -150,28 +227,36 @@ def scan_dangerous_patterns(html: str) -> Tuple[bool, List[str]]:
     Returns:
         Tupla de (es_seguro, lista_de_advertencias)
     """
+    if _DANGEROUS_SET is not None:
+        # Una sola pasada lineal (RE2) indica qué patrones aparecen
+        matched = sorted(_DANGEROUS_SET.Match(html) or ())
+        if not matched:
+            return True, []
+        candidates = [_COMPILED_DANGEROUS[i] for i in matched]
+    else:
+        # Caso común: ningún patrón coincide, basta una sola pasada combinada
+        if find_dangerous(html) is None:
+            return True, []
+        candidates = _COMPILED_DANGEROUS
+
     warnings = []
 
-    for pattern in DANGEROUS_PATTERNS:
-        matches = re.findall(pattern, html, re.IGNORECASE)
-        if matches:
-            warnings.append(f"⚠️ Patrón sospechoso detectado: {pattern} ({len(matches)} coincidencias)")
+    # Contar coincidencias solo de los patrones candidatos (sin construir la lista)
+    for pattern, compiled in candidates:
+        count = sum(1 for _ in compiled.finditer(html))
+        if count:
+            warnings.append(f"⚠️ Patrón sospechoso detectado: {pattern} ({count} coincidencias)")
 
     is_safe = len(warnings) == 0
     return is_safe, warnings
 
 
-def sanitize_html_for_rendering(html_content: str) -> str:
-    """
-    Inyecta Content Security Policy (CSP) en HTML para renderizado seguro.
-
-    Args:
-        html_content: HTML original del usuario
+# Etiquetas de apertura donde se inyecta la CSP (admiten atributos, p.ej. <html lang="es">)
+_HEAD_OPEN_RE = re.compile(r'<head\b[^>]*>', re.IGNORECASE)
+_HTML_OPEN_RE = re.compile(r'<html\b[^>]*>', re.IGNORECASE)
 
-    Returns:
-        HTML con CSP meta tag inyectado
-    """
-    csp_meta = '''<meta http-equiv="Content-Security-Policy"
+# Meta tag CSP inyectado antes de cada render (constante de módulo, no se reconstruye por llamada)
+_CSP_META = '''<meta http-equiv="Content-Security-Policy"
           content="default-src 'self';
                    script-src 'unsafe-inline' 'unsafe-eval';
                    style-src 'unsafe-inline';
@@ -182,24 +267,51 @@ def sanitize_html_for_rendering(html_content: str) -> str:
                    media-src 'none';
                    frame-src 'none';">'''
 
-    # Insertar CSP después de <head> o al inicio
-    html_lower = html_content.lower()
-
-    if '<head>' in html_lower:
-        # Buscar posición case-insensitive
-        head_pos = html_lower.find('<head>')
-        head_tag = html_content[head_pos:head_pos+6]
-        html_content = html_content.replace(head_tag, f'{head_tag}\n{csp_meta}', 1)
-    elif '<html>' in html_lower:
-        # Buscar posición case-insensitive
-        html_pos = html_lower.find('<html>')
-        html_tag = html_content[html_pos:html_pos+6]
-        html_content = html_content.replace(html_tag, f'{html_tag}\n<head>\n{csp_meta}\n</head>', 1)
-    else:
-        # Si no hay estructura HTML, envolver todo
-        html_content = f'<!DOCTYPE html>\n<html>\n<head>\n{csp_meta}\n</head>\n<body>\n{html_content}\n</body>\n</html>'
+# Fragmentos precalculados a insertar tras <head> o tras <html> (sin <head>)
+_CSP_HEAD_INSERT = '\n' + _CSP_META
+_CSP_HTML_INSERT = f'\n<head>\n{_CSP_META}\n</head>'
+
+# Mitades precalculadas para envolver contenido sin estructura HTML
+_CSP_PRE = f'<!DOCTYPE html>\n<html>\n<head>\n{_CSP_META}\n</head>\n<body>\n'
+_CSP_POST = '\n</body>\n</html>'
 
-    return html_content
+
+def sanitize_html_for_rendering(html_content: str) -> str:
+    """
+    Inyecta Content Security Policy (CSP) en HTML para renderizado seguro.
+
+    Args:
+        html_content: HTML original del usuario
+
+    Returns:
+        HTML con CSP meta tag inyectado
+    """
+    # Insertar CSP después de <head> o al inicio (una sola pasada, sin copia en minúsculas)
+    match = _HEAD_OPEN_RE.search(html_content)
+    if match:
+        pos = match.end()
+        return ''.join((html_content[:pos], _CSP_HEAD_INSERT, html_content[pos:]))
+
+    match = _HTML_OPEN_RE.search(html_content)
+    if match:
+        pos = match.end()
+        return ''.join((html_content[:pos], _CSP_HTML_INSERT, html_content[pos:]))
+
+    # Si no hay estructura HTML, envolver todo
+    return ''.join((_CSP_PRE, html_content, _CSP_POST))
+
+
+# Resultados recientes de validate_web_static_content: {blake2b(contenido): resultado}
+_VALIDATION_CACHE_SIZE = 32
+_validation_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+
+
+def _copy_validation_result(result: dict) -> dict:
+    """Copia el resultado para que el llamador pueda modificarlo sin tocar la caché"""
+    copy = dict(result)
+    copy['syntax_errors'] = list(result['syntax_errors'])
+    copy['security_warnings'] = list(result['security_warnings'])
+    return copy
 
 
 def validate_web_static_content(html_content: str) -> dict:
@@ -223,11 +335,21 @@ def validate_web_static_content(html_content: str) -> dict:
             'can_save': bool            # True si puede guardarse (sintaxis válida + tamaño OK)
         }
     """
+    # Codificar una sola vez: los bytes sirven para el hash de caché y el tamaño
+    content_bytes = html_content.encode('utf-8')
+
+    # El mismo contenido suele validarse varias veces (validar, luego guardar)
+    cache_key = hashlib.blake2b(content_bytes, digest_size=16).digest()
+    cached = _validation_cache.get(cache_key)
+    if cached is not None:
+        _validation_cache.move_to_end(cache_key)
+        return _copy_validation_result(cached)
+
     # Validación de sintaxis
     syntax_valid, syntax_errors = validate_html_syntax(html_content)
 
     # Validación de tamaño
-    size_valid, size_level, size_message = validate_html_size(html_content)
+    size_valid, size_level, size_message = _size_result(len(content_bytes))
 
     # Escaneo de seguridad
     security_safe, security_warnings = scan_dangerous_patterns(html_content)
@@ -238,7 +360,7 @@ def validate_web_static_content(html_content: str) -> dict:
     # Es completamente válido si pasa todas las validaciones sin warnings
     is_valid = syntax_valid and size_level == 'ok' and security_safe
 
-    return {
+    result = {
         'is_valid': is_valid,
         'syntax_valid': syntax_valid,
         'syntax_errors': syntax_errors,
@@ -249,3 +371,9 @@ def validate_web_static_content(html_content: str) -> dict:
         'security_warnings': security_warnings,
         'can_save': can_save
     }
+
+    _validation_cache[cache_key] = result
+    if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+
+    return _copy_validation_result(result)
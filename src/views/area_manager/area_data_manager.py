@@ -18,6 +18,7 @@ class AreaDataManager:
             'area_icon': '🏢',
             'tags': [],
             'unclassified_elements': [],
+            'unclassified_total_items': 0,
             'ungrouped_items': []
         }
 
@@ -121,7 +122,9 @@ class AreaDataManager:
                     tags_data.append({
                         'tag_name': tag_name,
                         'tag_color': tag_color,
-                        'groups': groups_data
+                        'groups': groups_data,
+                        # Precalculado una vez: la vista lo usa en cada render/filtro
+                        'total_items': sum(len(group['items']) for group in groups_data)
                     })
 
             unclassified_items = self._get_unclassified_elements(area_id)
@@ -133,6 +136,7 @@ class AreaDataManager:
                 'area_icon': area.get('icon', '🏢'),
                 'tags': tags_data,
                 'unclassified_elements': unclassified_items,
+                'unclassified_total_items': sum(len(elem['items']) for elem in unclassified_items),
                 'ungrouped_items': ungrouped_items
             }
 
@@ -12,6 +12,11 @@ class AreaFullViewPanel(QWidget):
     item_copied = pyqtSignal(dict)
     item_clicked = pyqtSignal(dict)
 
+    # Altura estimada por item para reservar espacio en secciones aún no creadas
+    _ESTIMATED_ITEM_HEIGHT = 60
+    # Máximo de combinaciones de filtros memoizadas por área
+    _FILTER_CACHE_SIZE = 16
+
     def __init__(self, db_manager=None, parent=None):
         super().__init__(parent)
 
@@ -22,9 +27,18 @@ class AreaFullViewPanel(QWidget):
         self.area_data = None
         self.current_filters = []
         self.current_area_id = None
+        self._filter_cache = {}  # (tuple(tag_filters), match_mode) -> datos filtrados
         self.tag_headers = []  # Lista para trackear los headers de tags
         self.all_collapsed = False  # Estado del botón de colapsar todo
 
+        # Pools de widgets reciclables entre renders (filtros, cambio de área)
+        self._tag_header_pool = []  # ProjectTagHeaderWidget libres
+        self._group_widget_pool = {}  # group_type -> [ItemGroupWidget libres]
+        self._active_group_widgets = []  # ItemGroupWidget en uso en la vista actual
+
+        # Secciones cuyos items aún no se han creado: [(tag_container, groups)]
+        self._pending_sections = []
+
         # Estado de búsqueda
         self.search_results = []  # Lista de widgets de items que coinciden
         self.current_result_index = -1  # Índice del resultado actual
@@ -128,6 +142,7 @@ class AreaFullViewPanel(QWidget):
         self.content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         self.scroll_area.setWidget(self.content_widget)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._populate_visible_sections)
         main_layout.addWidget(self.scroll_area)
 
         self.show_empty_state()
@@ -152,6 +167,7 @@ class AreaFullViewPanel(QWidget):
     def load_area(self, area_id: int):
         self.current_area_id = area_id
         self.area_data = self.data_manager.get_area_full_data(area_id)
+        self._filter_cache.clear()
 
         if not self.area_data:
             self.show_empty_state()
@@ -159,37 +175,52 @@ class AreaFullViewPanel(QWidget):
 
         self.render_view()
 
-    def render_view(self):
-        if not self.area_data:
+    def render_view(self, data: dict = None):
+        """
+        Renderizar la vista completa
+
+        Args:
+            data: Datos a renderizar (p.ej. filtrados); por defecto self.area_data
+        """
+        data = data or self.area_data
+        if not data:
             return
 
         self.clear_view()
 
         area_header = ProjectHeaderWidget()
         area_header.set_project_info(
-            self.area_data['area_name'],
-            self.area_data['area_icon']
+            data['area_name'],
+            data['area_icon']
         )
         self.content_layout.addWidget(area_header)
 
-        for tag_data in self.area_data['tags']:
+        for tag_data in data['tags']:
             self._render_tag_section(tag_data)
 
-        if self.area_data.get('unclassified_elements'):
-            self._render_unclassified_section(self.area_data['unclassified_elements'])
+        if data.get('unclassified_elements'):
+            self._render_unclassified_section(
+                data['unclassified_elements'],
+                data.get('unclassified_total_items')
+            )
 
-        if self.area_data['ungrouped_items']:
-            self._render_ungrouped_section(self.area_data['ungrouped_items'])
+        if data['ungrouped_items']:
+            self._render_ungrouped_section(data['ungrouped_items'])
 
         self.content_layout.addStretch()
 
+        # Materializar las secciones visibles una vez calculada la geometría
+        QTimer.singleShot(0, self._populate_visible_sections)
+
     def _render_tag_section(self, tag_data: dict):
-        total_items = sum(
-            len(group['items'])
-            for group in tag_data['groups']
-        )
+        total_items = tag_data.get('total_items')
+        if total_items is None:
+            total_items = sum(
+                len(group['items'])
+                for group in tag_data['groups']
+            )
 
-        tag_header = ProjectTagHeaderWidget()
+        tag_header = self._acquire_tag_header()
         tag_header.set_tag_info(
             tag_data['tag_name'],
             tag_data['tag_color'],
@@ -205,27 +236,16 @@ class AreaFullViewPanel(QWidget):
         tag_container_layout.setContentsMargins(0, 0, 0, 0)
         tag_container_layout.setSpacing(8)
 
-        for group in tag_data['groups']:
-            group_widget = ItemGroupWidget(
-                group['name'],
-                group['type'],
-                db_manager=self.db_manager
-            )
-
-            for item_data in group['items']:
-                group_widget.add_item(item_data)
-
-            tag_container_layout.addWidget(group_widget)
-
+        self._defer_section(tag_container, tag_data['groups'], total_items)
         self.content_layout.addWidget(tag_container)
 
-        tag_header.toggle_collapsed.connect(
-            lambda collapsed: tag_container.setVisible(not collapsed)
-        )
+        tag_header.setProperty('collapse_target', tag_container)
+        tag_header.toggle_collapsed.connect(self._on_tag_collapsed)
 
-    def _render_unclassified_section(self, elements: list):
-        tag_header = ProjectTagHeaderWidget()
-        total_items = sum(len(elem['items']) for elem in elements)
+    def _render_unclassified_section(self, elements: list, total_items: int = None):
+        tag_header = self._acquire_tag_header()
+        if total_items is None:
+            total_items = sum(len(elem['items']) for elem in elements)
         tag_header.set_tag_info("Sin Clasificar", "#808080", total_items)
         self.content_layout.addWidget(tag_header)
 
@@ -237,20 +257,14 @@ class AreaFullViewPanel(QWidget):
         tag_container_layout.setContentsMargins(0, 0, 0, 0)
         tag_container_layout.setSpacing(8)
 
-        for elem in elements:
-            group_widget = ItemGroupWidget(elem['name'], elem['type'], db_manager=self.db_manager)
-            for item_data in elem['items']:
-                group_widget.add_item(item_data)
-            tag_container_layout.addWidget(group_widget)
-
+        self._defer_section(tag_container, elements, total_items)
         self.content_layout.addWidget(tag_container)
 
-        tag_header.toggle_collapsed.connect(
-            lambda collapsed: tag_container.setVisible(not collapsed)
-        )
+        tag_header.setProperty('collapse_target', tag_container)
+        tag_header.toggle_collapsed.connect(self._on_tag_collapsed)
 
     def _render_ungrouped_section(self, items: list):
-        tag_header = ProjectTagHeaderWidget()
+        tag_header = self._acquire_tag_header()
         tag_header.set_tag_info("Otros Items", "#808080", len(items))
         self.content_layout.addWidget(tag_header)
 
@@ -263,17 +277,133 @@ class AreaFullViewPanel(QWidget):
         tag_container_layout.setContentsMargins(0, 0, 0, 0)
         tag_container_layout.setSpacing(8)
 
-        group_widget = ItemGroupWidget("Sin clasificar", "other", db_manager=self.db_manager)
-        for item_data in items:
-            group_widget.add_item(item_data)
-
-        tag_container_layout.addWidget(group_widget)
+        groups = [{'name': "Sin clasificar", 'type': "other", 'items': items}]
+        self._defer_section(tag_container, groups, len(items))
         self.content_layout.addWidget(tag_container)
 
         # Conectar colapso/expansión
-        tag_header.toggle_collapsed.connect(
-            lambda collapsed: tag_container.setVisible(not collapsed)
-        )
+        tag_header.setProperty('collapse_target', tag_container)
+        tag_header.toggle_collapsed.connect(self._on_tag_collapsed)
+
+    def _defer_section(self, tag_container: QWidget, groups: list, total_items: int):
+        """
+        Registrar una sección cuyos ItemGroupWidget se crearán al entrar en pantalla
+
+        Mientras tanto el contenedor reserva una altura estimada para que el
+        scroll y las posiciones de las secciones siguientes sean coherentes.
+        """
+        tag_container.setMinimumHeight(total_items * self._ESTIMATED_ITEM_HEIGHT)
+        self._pending_sections.append((tag_container, groups))
+
+    def _populate_section(self, tag_container: QWidget, groups: list):
+        """Crear los ItemGroupWidget de una sección diferida"""
+        tag_container_layout = tag_container.layout()
+
+        for group in groups:
+            group_widget = self._acquire_group_widget(group['name'], group['type'])
+
+            for item_data in group['items']:
+                group_widget.add_item(item_data)
+
+            tag_container_layout.addWidget(group_widget)
+
+        tag_container.setMinimumHeight(0)
+
+    def _populate_visible_sections(self):
+        """Materializar las secciones pendientes que intersectan el viewport (+1 pantalla)"""
+        if not self._pending_sections or not self.isVisible():
+            return
+
+        viewport_height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value() - viewport_height
+        bottom = top + 3 * viewport_height
+
+        remaining = []
+        populated = False
+        for tag_container, groups in self._pending_sections:
+            # Secciones colapsadas se materializan al expandirse
+            if not tag_container.isHidden():
+                y = tag_container.y()
+                if y <= bottom and y + tag_container.height() >= top:
+                    self._populate_section(tag_container, groups)
+                    populated = True
+                    continue
+            remaining.append((tag_container, groups))
+        self._pending_sections = remaining
+
+        # Las alturas reales pueden diferir de la estimada: revisar de nuevo
+        if populated and remaining:
+            QTimer.singleShot(0, self._populate_visible_sections)
+
+    def _on_tag_collapsed(self, collapsed: bool):
+        """
+        Mostrar u ocultar el contenedor asociado al header que emitió la señal
+
+        El contenedor se guarda como propiedad 'collapse_target' del header
+        (sin closures por sección que lo mantengan vivo tras clear_view).
+        """
+        container = self.sender().property('collapse_target')
+        if container is None:
+            return
+
+        container.setVisible(not collapsed)
+
+        # Al expandir puede quedar contenido diferido en pantalla
+        if not collapsed:
+            QTimer.singleShot(0, self._populate_visible_sections)
+
+    def showEvent(self, event):
+        """Override: materializar secciones visibles al mostrar el panel"""
+        super().showEvent(event)
+        QTimer.singleShot(0, self._populate_visible_sections)
+
+    def resizeEvent(self, event):
+        """Override: un viewport más alto puede dejar secciones diferidas a la vista"""
+        super().resizeEvent(event)
+        self._populate_visible_sections()
+
+    def _populate_all_sections(self):
+        """Materializar todas las secciones pendientes (necesario para buscar)"""
+        pending = self._pending_sections
+        self._pending_sections = []
+        for tag_container, groups in pending:
+            self._populate_section(tag_container, groups)
+
+    def _acquire_tag_header(self) -> ProjectTagHeaderWidget:
+        """Obtener un header de tag del pool o crear uno nuevo"""
+        if self._tag_header_pool:
+            return self._tag_header_pool.pop()
+        return ProjectTagHeaderWidget()
+
+    def _release_tag_header(self, tag_header: ProjectTagHeaderWidget):
+        """Desconectar, expandir y devolver un header de tag al pool"""
+        try:
+            tag_header.toggle_collapsed.disconnect(self._on_tag_collapsed)
+        except TypeError:
+            pass  # Sin conexiones
+        tag_header.setProperty('collapse_target', None)
+        tag_header.set_collapsed(False)
+        # setParent(None) oculta sin marcar hide() explícito: addWidget lo vuelve a mostrar
+        tag_header.setParent(None)
+        self._tag_header_pool.append(tag_header)
+
+    def _acquire_group_widget(self, group_name: str, group_type: str) -> ItemGroupWidget:
+        """Obtener un ItemGroupWidget del pool (mismo tipo) o crear uno nuevo"""
+        pool = self._group_widget_pool.get(group_type)
+        if pool:
+            group_widget = pool.pop()
+            group_widget.reset_group(group_name)
+        else:
+            group_widget = ItemGroupWidget(group_name, group_type, db_manager=self.db_manager)
+
+        self._active_group_widgets.append(group_widget)
+        return group_widget
+
+    def _release_group_widget(self, group_widget: ItemGroupWidget):
+        """Vaciar y devolver un ItemGroupWidget al pool de su tipo"""
+        group_widget.clear_items()
+        group_widget.setParent(None)
+        self._group_widget_pool.setdefault(group_widget.get_group_type(), []).append(group_widget)
 
     def apply_filters(self, tag_filters: list[str], match_mode: str = 'OR'):
         self.current_filters = tag_filters
@@ -285,16 +415,20 @@ class AreaFullViewPanel(QWidget):
             self.render_view()
             return
 
-        filtered_data = self.data_manager.filter_by_area_tags(
-            self.area_data,
-            tag_filters,
-            match_mode
-        )
+        # Memoizar por combinación de filtros (el cache se vacía al cargar otra área)
+        cache_key = (tuple(tag_filters), match_mode)
+        filtered_data = self._filter_cache.get(cache_key)
+        if filtered_data is None:
+            filtered_data = self.data_manager.filter_by_area_tags(
+                self.area_data,
+                tag_filters,
+                match_mode
+            )
+            if len(self._filter_cache) >= self._FILTER_CACHE_SIZE:
+                self._filter_cache.pop(next(iter(self._filter_cache)))
+            self._filter_cache[cache_key] = filtered_data
 
-        original_data = self.area_data
-        self.area_data = filtered_data
-        self.render_view()
-        self.area_data = original_data
+        self.render_view(filtered_data)
 
         visible_tags = [tag['tag_name'] for tag in filtered_data['tags']]
         print(f"✓ Filtros aplicados ({match_mode}): {tag_filters}")
@@ -356,7 +490,8 @@ class AreaFullViewPanel(QWidget):
             self.search_bar.update_results(0, 0)
             return
 
-        # Buscar en todos los widgets de items
+        # Buscar en todos los widgets de items (crear antes los de secciones diferidas)
+        self._populate_all_sections()
         from ..project_manager.widgets.items.base_item_widget import BaseItemWidget
 
         all_item_widgets = self.content_widget.findChildren(BaseItemWidget)
@@ -459,13 +594,30 @@ class AreaFullViewPanel(QWidget):
         if self.search_bar and self.search_bar.isVisible():
             self._on_search_closed()
 
-        # Limpiar lista de headers
-        self.tag_headers.clear()
-
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Desacoplar todos los widgets con repintado suspendido (un solo repaint al final)
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Devolver headers y grupos a sus pools antes de destruir los contenedores
+            for tag_header in self.tag_headers:
+                self._release_tag_header(tag_header)
+            self.tag_headers.clear()
+
+            for group_widget in self._active_group_widgets:
+                self._release_group_widget(group_widget)
+            self._active_group_widgets.clear()
+            self._pending_sections.clear()
+
+            children = []
+            while self.content_layout.count():
+                children.append(self.content_layout.takeAt(0))
+
+            for child in children:
+                widget = child.widget()
+                if widget is not None:
+                    widget.setParent(None)
+                    widget.deleteLater()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
 
     def get_current_area_id(self) -> int:
         return self.current_area_id
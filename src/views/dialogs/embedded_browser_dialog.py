@@ -10,11 +10,11 @@ from pathlib import Path
 import logging
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QWidget
 )
-from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtCore import Qt, QUrl, QByteArray
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -23,6 +23,66 @@ from src.utils.html_validator import sanitize_html_for_rendering
 logger = logging.getLogger(__name__)
 
 
+# Perfil off-the-record compartido por todos los diálogos WEB_STATIC (se crea una sola vez)
+_sandbox_profile = None
+
+
+def _get_sandbox_profile() -> QWebEngineProfile:
+    """
+    Obtiene el perfil sandbox compartido, creándolo y configurándolo la primera vez.
+
+    Las páginas creadas con este perfil heredan sus QWebEngineSettings, así que
+    la configuración de seguridad se aplica una sola vez por proceso.
+    """
+    global _sandbox_profile
+    if _sandbox_profile is not None:
+        return _sandbox_profile
+
+    # Sin storageName => off-the-record; el padre QApplication lo libera tras las páginas
+    profile = QWebEngineProfile(QApplication.instance())
+    profile.setPersistentCookiesPolicy(
+        QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies
+    )
+    settings = profile.settings()
+
+    # === CAPA 1: QWebEngineSettings Sandboxing ===
+
+    # Deshabilitar almacenamiento local
+    settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, False)
+
+    # Deshabilitar acceso a archivos locales desde contenido local
+    settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, False)
+
+    # Deshabilitar acceso a URLs remotas desde contenido local
+    settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, False)
+
+    # Deshabilitar contenido inseguro
+    settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, False)
+
+    # JavaScript habilitado pero sandboxed (necesario para calculadoras/apps)
+    settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+
+    # Deshabilitar plugins (Flash, Java, etc.)
+    settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
+
+    # Deshabilitar geolocalización
+    settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, False)
+
+    # Deshabilitar acceso a clipboard desde JavaScript (si está disponible)
+    # settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, False)
+
+    logger.info("Perfil sandbox compartido configurado para WEB_STATIC:")
+    logger.info("  - LocalStorage: DESHABILITADO")
+    logger.info("  - Acceso a archivos locales: BLOQUEADO")
+    logger.info("  - Acceso a URLs remotas: BLOQUEADO")
+    logger.info("  - Contenido inseguro: BLOQUEADO")
+    logger.info("  - JavaScript: HABILITADO (pero sandboxed)")
+    logger.info("  - Plugins: DESHABILITADO")
+
+    _sandbox_profile = profile
+    return profile
+
+
 class EmbeddedBrowserDialog(QDialog):
     """
     Diálogo con navegador embebido para renderizar items WEB_STATIC.
@@ -54,10 +114,6 @@ class EmbeddedBrowserDialog(QDialog):
 
         self._init_ui()
 
-        # Si es HTML estático, configurar sandboxing
-        if html_content:
-            self._setup_sandboxing()
-
         logger.info(f"EmbeddedBrowserDialog initialized (html_content={bool(html_content)}, url={bool(url)})")
 
     def _init_ui(self):
@@ -97,9 +153,12 @@ class EmbeddedBrowserDialog(QDialog):
             header_widget = self._create_security_header()
             layout.addWidget(header_widget)
 
-        # Navegador embebido
-        self.browser = QWebEngineView()
-        layout.addWidget(self.browser)
+        # Navegador embebido: se crea en el primer showEvent (arrancar Chromium
+        # es costoso); mientras tanto un placeholder ocupa su lugar
+        self.browser = None
+        self._browser_placeholder = QWidget()
+        self._main_layout = layout
+        layout.addWidget(self._browser_placeholder, 1)
 
         # Footer con botón de cerrar
         footer_layout = QHBoxLayout()
@@ -114,10 +173,29 @@ class EmbeddedBrowserDialog(QDialog):
 
         layout.addLayout(footer_layout)
 
+    def _ensure_browser(self) -> bool:
+        """
+        Crea el QWebEngineView si aún no existe, reemplazando el placeholder.
+
+        Returns:
+            True si el navegador se creó en esta llamada
+        """
+        if self.browser is not None:
+            return False
+
+        self.browser = QWebEngineView()
+        self._main_layout.replaceWidget(self._browser_placeholder, self.browser)
+        self._browser_placeholder.deleteLater()
+        self._browser_placeholder = None
+
+        # Si es HTML estático, configurar sandboxing
+        if self.html_content:
+            self._setup_sandboxing()
+
+        return True
+
     def _create_security_header(self):
         """Crea header con indicadores de seguridad"""
-        from PyQt6.QtWidgets import QWidget
-
         header = QWidget()
         header.setStyleSheet("""
             QWidget {
@@ -154,45 +232,13 @@ class EmbeddedBrowserDialog(QDialog):
         Configura sandboxing de seguridad para contenido WEB_STATIC.
 
         Implementa 3 capas de seguridad:
-        1. QWebEngineSettings: Deshabilita características peligrosas
+        1. QWebEngineSettings: Deshabilita características peligrosas (perfil compartido)
         2. CSP: Inyectado automáticamente en HTML
         3. Aislamiento: Sin acceso a red, archivos o almacenamiento
         """
-        settings = self.browser.settings()
-
-        # === CAPA 1: QWebEngineSettings Sandboxing ===
-
-        # Deshabilitar almacenamiento local
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, False)
-
-        # Deshabilitar acceso a archivos locales desde contenido local
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, False)
-
-        # Deshabilitar acceso a URLs remotas desde contenido local
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, False)
-
-        # Deshabilitar contenido inseguro
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, False)
-
-        # JavaScript habilitado pero sandboxed (necesario para calculadoras/apps)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-
-        # Deshabilitar plugins (Flash, Java, etc.)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-
-        # Deshabilitar geolocalización
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, False)
-
-        # Deshabilitar acceso a clipboard desde JavaScript (si está disponible)
-        # settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, False)
-
-        logger.info("Sandboxing de seguridad configurado para WEB_STATIC:")
-        logger.info("  - LocalStorage: DESHABILITADO")
-        logger.info("  - Acceso a archivos locales: BLOQUEADO")
-        logger.info("  - Acceso a URLs remotas: BLOQUEADO")
-        logger.info("  - Contenido inseguro: BLOQUEADO")
-        logger.info("  - JavaScript: HABILITADO (pero sandboxed)")
-        logger.info("  - Plugins: DESHABILITADO")
+        # === CAPA 1: página sobre el perfil sandbox compartido ===
+        page = QWebEnginePage(_get_sandbox_profile(), self.browser)
+        self.browser.setPage(page)
 
     def load_static_html(self, html_content: str):
         """
@@ -201,14 +247,19 @@ class EmbeddedBrowserDialog(QDialog):
         Args:
             html_content: HTML crudo del item WEB_STATIC
         """
+        self._ensure_browser()
+
         # === CAPA 2: Sanitización e inyección de CSP ===
         sanitized_html = sanitize_html_for_rendering(html_content)
 
+        # Codificar una sola vez y entregar bytes a Chromium (setHtml volvería a codificar)
+        sanitized_bytes = sanitized_html.encode('utf-8')
+
         # Cargar en navegador con baseUrl vacía (sin acceso a recursos externos)
-        self.browser.setHtml(sanitized_html, QUrl())
+        self.browser.setContent(QByteArray(sanitized_bytes), "text/html;charset=UTF-8", QUrl())
 
-        size_kb = len(html_content) / 1024
-        sanitized_size_kb = len(sanitized_html) / 1024
+        size_kb = len(html_content.encode('utf-8')) / 1024
+        sanitized_size_kb = len(sanitized_bytes) / 1024
 
         logger.info(f"HTML estático cargado:")
         logger.info(f"  - Tamaño original: {size_kb:.1f} KB")
@@ -222,13 +273,18 @@ class EmbeddedBrowserDialog(QDialog):
         Args:
             url: URL a cargar
         """
+        self._ensure_browser()
         logger.info(f"Loading URL: {url}")
         self.browser.setUrl(QUrl(url))
 
     def showEvent(self, event):
-        """Override: cargar HTML al mostrar si es contenido estático"""
+        """Override: crear el navegador y cargar el contenido en el primer show"""
         super().showEvent(event)
 
+        # Solo la primera vez: los showEvent posteriores conservan la página cargada
+        if not self._ensure_browser():
+            return
+
         if self.html_content:
             # Modo WEB_STATIC: cargar HTML sanitizado
             self.load_static_html(self.html_content)
@@ -20,7 +20,7 @@ class PasswordVerifyDialog(QDialog):
 
     def __init__(self, title="Verificación de Contraseña", message="Ingresa tu contraseña para continuar:", parent=None):
         super().__init__(parent)
-        self.auth_manager = AuthManager()
+        self.auth_manager = AuthManager.instance()
         self.title_text = title
         self.message_text = message
         self.password_verified = False
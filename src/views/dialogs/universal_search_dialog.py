@@ -50,6 +50,7 @@ class UniversalSearchDialog(QDialog):
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.perform_search)
+        self._search_generation = 0
 
         # Paginación
         self.current_page = 1
@@ -71,6 +72,27 @@ class UniversalSearchDialog(QDialog):
         self.apply_styles()
         self.load_initial_data()
 
+        # Si el diálogo se destruye sin cerrarse (p.ej. con su padre), los
+        # resultados pendientes tampoco deben tocar sus widgets
+        self.destroyed.connect(lambda *_: self._discard_pending_searches())
+
+    def _discard_pending_searches(self):
+        """Invalidar búsquedas en curso y detener los debounces pendientes"""
+        # on_search_finished descarta cualquier resultado de otra generación
+        self._search_generation += 1
+        self.search_timer.stop()
+        self.filter_timer.stop()
+
+    def done(self, result):
+        """Override: al cerrar (aceptar/rechazar/Esc) descartar búsquedas en curso"""
+        self._discard_pending_searches()
+        super().done(result)
+
+    def closeEvent(self, event):
+        """Override: al cerrar con la X descartar búsquedas en curso"""
+        self._discard_pending_searches()
+        super().closeEvent(event)
+
     def init_ui(self):
         """Inicializa la interfaz"""
         self.setWindowTitle("BÚSQUEDA UNIVERSAL")
@@ -511,11 +533,12 @@ class UniversalSearchDialog(QDialog):
         self.search_timer.start(300)
 
     def perform_search(self):
-        """Realiza la búsqueda con paginación y operadores"""
+        """Realiza la búsqueda con paginación y operadores (en segundo plano)"""
         query = self.search_input.text().strip()
 
         if not query:
             # Si no hay query, mostrar items recientes
+            self._search_generation += 1
             self.load_recent_items()
             return
 
@@ -534,15 +557,40 @@ class UniversalSearchDialog(QDialog):
 
             logger.info(f"Buscando con query: '{search_query}'")
 
-            # Obtener conteo total
-            self.total_items = self.db.universal_search_items_count(search_query)
-            logger.info(f"Total items encontrados: {self.total_items}")
-
             # Calcular offset
             offset = (self.current_page - 1) * self.page_size
 
-            # Buscar items con paginación
-            results = self.search_engine.search_items(search_query, limit=self.page_size, offset=offset)
+            # Descartar resultados de búsquedas anteriores que lleguen tarde
+            self._search_generation += 1
+            generation = self._search_generation
+
+            def run_search():
+                total = self.db.universal_search_items_count(search_query)
+                results = self.search_engine.search_items(search_query, limit=self.page_size, offset=offset)
+                return total, results
+
+            self.search_engine.run_async(
+                run_search,
+                lambda payload: self.on_search_finished(generation, parsed_query, payload)
+            )
+
+        except Exception as e:
+            logger.error(f"Error en búsqueda: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Error en búsqueda:\n{str(e)}")
+            self.hide_loading()
+            self.search_input.setFocus()
+
+    def on_search_finished(self, generation, parsed_query, payload):
+        """Recibe en el hilo de UI el resultado de perform_search"""
+        if generation != self._search_generation:
+            return
+
+        try:
+            if payload is None:
+                raise RuntimeError("La búsqueda no pudo completarse")
+
+            self.total_items, results = payload
+            logger.info(f"Total items encontrados: {self.total_items}")
             logger.info(f"Resultados obtenidos: {len(results)}")
 
             # Aplicar operadores de búsqueda solo si hay operadores
@@ -723,6 +771,9 @@ class UniversalSearchDialog(QDialog):
 
     def on_tab_clicked(self, tab_id):
         """Handler cuando se hace clic en una pestaña"""
+        # Cualquier búsqueda en curso queda obsoleta
+        self._search_generation += 1
+
         if tab_id == "refrescar":
             self.perform_search()
         elif tab_id == "mas_usados":
@@ -5,23 +5,144 @@ Widget for general application settings
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
-    QSpinBox, QPushButton, QGroupBox, QFormLayout, QFileDialog,
-    QMessageBox, QLineEdit
+    QSpinBox, QPushButton, QGroupBox, QFormLayout, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-import json
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRegularExpression, QSignalBlocker
+from PyQt6.QtGui import QRegularExpressionValidator, QPalette, QColor
 import sys
 import logging
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from src.views.dialogs.password_verify_dialog import PasswordVerifyDialog
-from src.core.auth_manager import AuthManager
 from src.core.master_password_manager import MasterPasswordManager
 
 logger = logging.getLogger(__name__)
 
+# Carpeta inicial de los diálogos de exportar/importar (resuelta una sola vez)
+_USER_HOME = Path.home()
+
+
+# Colores base del tema oscuro: van en la paleta (heredada por los hijos),
+# no en la hoja de estilos
+GENERAL_SETTINGS_PALETTE = {
+    QPalette.ColorRole.Window: "#2b2b2b",
+    QPalette.ColorRole.WindowText: "#cccccc",
+    QPalette.ColorRole.Base: "#2d2d2d",
+    QPalette.ColorRole.Text: "#cccccc",
+}
+
+# Hoja de estilos del widget: se aplica una sola vez; solo bordes, espaciado y
+# estados que la paleta no expresa. Los botones y etiquetas especiales se
+# seleccionan por objectName y los estados por propiedad dinámica
+GENERAL_SETTINGS_QSS = """
+    QGroupBox {
+        font-weight: bold;
+        font-size: 11pt;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QCheckBox {
+        spacing: 5px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        background-color: #2d2d2d;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #007acc;
+        border-color: #007acc;
+    }
+    QCheckBox::indicator:hover {
+        border-color: #007acc;
+    }
+    QSpinBox {
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 5px;
+        min-width: 100px;
+    }
+    QSpinBox:focus {
+        border: 1px solid #007acc;
+    }
+    QLineEdit {
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px;
+        min-width: 200px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #007acc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #007acc;
+    }
+    QPushButton#changePasswordBtn {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton#changePasswordBtn:hover {
+        background-color: #005a9e;
+    }
+    QPushButton#changePasswordBtn:pressed {
+        background-color: #004578;
+    }
+    QPushButton#masterPasswordBtn {
+        background-color: #00aa55;
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton#masterPasswordBtn:hover {
+        background-color: #008844;
+    }
+    QPushButton#masterPasswordBtn:pressed {
+        background-color: #006633;
+    }
+    QLabel#masterDescLabel {
+        color: #aaaaaa;
+        font-size: 9pt;
+        padding: 5px;
+    }
+    QLabel#masterStatusLabel {
+        padding: 5px;
+        font-weight: bold;
+        border-radius: 3px;
+    }
+    QLabel#masterStatusLabel[state="pending"] {
+        color: #ff9900;
+        background-color: #2d2d00;
+    }
+    QLabel#masterStatusLabel[state="configured"] {
+        color: #00ff88;
+        background-color: #002d1a;
+    }
+    QLabel#aboutLabel {
+        font-size: 10pt;
+    }
+"""
+
 
 class GeneralSettings(QWidget):
     """
@@ -43,6 +164,13 @@ class GeneralSettings(QWidget):
         super().__init__(parent)
         self.config_manager = config_manager
 
+        # Coalesce bursts of control changes (spinbox drag, rapid toggles) into
+        # a single settings_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(200)
+        self._emit_timer.timeout.connect(self.settings_changed)
+
         self.init_ui()
         self.load_settings()
 
@@ -61,13 +189,13 @@ class GeneralSettings(QWidget):
         # Minimize to tray checkbox
         self.minimize_tray_check = QCheckBox("Minimizar a tray al cerrar ventana")
         self.minimize_tray_check.setChecked(True)
-        self.minimize_tray_check.stateChanged.connect(self.settings_changed)
+        self.minimize_tray_check.stateChanged.connect(self._schedule_settings_changed)
         behavior_layout.addWidget(self.minimize_tray_check)
 
         # Always on top checkbox
         self.always_on_top_check = QCheckBox("Mantener ventana siempre visible")
         self.always_on_top_check.setChecked(True)
-        self.always_on_top_check.stateChanged.connect(self.settings_changed)
+        self.always_on_top_check.stateChanged.connect(self._schedule_settings_changed)
         behavior_layout.addWidget(self.always_on_top_check)
 
         # Start with Windows checkbox
@@ -90,12 +218,43 @@ class GeneralSettings(QWidget):
         self.max_history_spin.setMaximum(50)
         self.max_history_spin.setValue(20)
         self.max_history_spin.setSuffix(" items")
-        self.max_history_spin.valueChanged.connect(self.settings_changed)
+        self.max_history_spin.valueChanged.connect(self._schedule_settings_changed)
         clipboard_layout.addRow("Máximo items historial:", self.max_history_spin)
 
         clipboard_group.setLayout(clipboard_layout)
         main_layout.addWidget(clipboard_group)
 
+        # Security, master password, import/export and about groups are built
+        # on first show (see _build_deferred_groups)
+        self._deferred_groups_built = False
+        self._deferred_container = QWidget()
+        self._deferred_layout = QVBoxLayout(self._deferred_container)
+        self._deferred_layout.setSpacing(20)
+        self._deferred_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self._deferred_container)
+
+        # Spacer
+        main_layout.addStretch()
+
+        # Base colours through the palette, then the (reduced) widget style sheet
+        palette = self.palette()
+        for role, color in GENERAL_SETTINGS_PALETTE.items():
+            palette.setColor(role, QColor(color))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
+        self.setStyleSheet(GENERAL_SETTINGS_QSS)
+
+    def showEvent(self, event):
+        """Build the deferred groups the first time the widget is shown"""
+        super().showEvent(event)
+        if not self._deferred_groups_built:
+            self._build_deferred_groups()
+
+    def _build_deferred_groups(self):
+        """Build the groups that are only needed once the settings tab is visible"""
+        self._deferred_groups_built = True
+        main_layout = self._deferred_layout
+
         # Security group
         security_group = QGroupBox("Seguridad")
         security_layout = QFormLayout()
@@ -111,6 +270,10 @@ class GeneralSettings(QWidget):
         self.new_password_input = QLineEdit()
         self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.new_password_input.setPlaceholderText("Ingresa tu nueva contraseña")
+        # Minimum length enforced by the validator: input is only acceptable from 4 chars
+        self.new_password_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r".{4,}"), self.new_password_input)
+        )
         security_layout.addRow("Nueva contraseña:", self.new_password_input)
 
         # Confirm password
@@ -124,21 +287,10 @@ class GeneralSettings(QWidget):
         change_password_btn_layout.addStretch()
         self.change_password_btn = QPushButton("Cambiar Contraseña")
         self.change_password_btn.clicked.connect(self.change_password)
-        self.change_password_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-        """)
+        self.change_password_btn.setObjectName("changePasswordBtn")
+        # Disabled until the new password passes the validator
+        self.change_password_btn.setEnabled(False)
+        self.new_password_input.textChanged.connect(self._update_change_password_btn)
         change_password_btn_layout.addWidget(self.change_password_btn)
         security_layout.addRow("", change_password_btn_layout)
 
@@ -156,13 +308,13 @@ class GeneralSettings(QWidget):
             "Si no la configuras, los items sensibles serán accesibles sin protección adicional."
         )
         master_desc.setWordWrap(True)
-        master_desc.setStyleSheet("color: #aaaaaa; font-size: 9pt; padding: 5px;")
+        master_desc.setObjectName("masterDescLabel")
         master_password_layout.addWidget(master_desc)
 
         # Status indicator
         self.master_status_label = QLabel()
         self.master_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.master_status_label.setStyleSheet("padding: 5px; font-weight: bold;")
+        self.master_status_label.setObjectName("masterStatusLabel")
         master_password_layout.addWidget(self.master_status_label)
 
         # Form layout for inputs
@@ -194,21 +346,7 @@ class GeneralSettings(QWidget):
         master_btn_layout.addStretch()
         self.master_password_btn = QPushButton()
         self.master_password_btn.clicked.connect(self.create_or_change_master_password)
-        self.master_password_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00aa55;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #008844;
-            }
-            QPushButton:pressed {
-                background-color: #006633;
-            }
-        """)
+        self.master_password_btn.setObjectName("masterPasswordBtn")
         master_btn_layout.addWidget(self.master_password_btn)
         master_password_layout.addLayout(master_btn_layout)
 
@@ -258,113 +396,42 @@ class GeneralSettings(QWidget):
             "Architecture: MVC<br><br>"
             "Gestor avanzado de portapapeles para Windows"
         )
-        about_text.setStyleSheet("font-size: 10pt;")
+        about_text.setObjectName("aboutLabel")
         about_layout.addWidget(about_text)
 
         about_group.setLayout(about_layout)
         main_layout.addWidget(about_group)
 
-        # Spacer
-        main_layout.addStretch()
-
-        # Apply widget styles
-        self.setStyleSheet("""
-            GeneralSettings {
-                background-color: #2b2b2b;
-            }
-            QLabel {
-                color: #cccccc;
-                background-color: transparent;
-            }
-            QGroupBox {
-                background-color: #2b2b2b;
-                color: #cccccc;
-                font-weight: bold;
-                font-size: 11pt;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #cccccc;
-            }
-            QCheckBox {
-                color: #cccccc;
-                spacing: 5px;
-                background-color: transparent;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border-color: #007acc;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #007acc;
-            }
-            QSpinBox {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 5px;
-                min-width: 100px;
-            }
-            QSpinBox:focus {
-                border: 1px solid #007acc;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px;
-                min-width: 200px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #007acc;
-            }
-        """)
+    def _schedule_settings_changed(self, *_):
+        """Restart the debounce timer (signal arguments are ignored)"""
+        # Not connected to QTimer.start directly: start(int) would take the
+        # state/value argument as the interval
+        self._emit_timer.start()
 
     def load_settings(self):
         """Load settings from config manager"""
         if not self.config_manager:
             return
 
+        # Single query for all general settings
+        values = self.config_manager.get_settings_bulk(
+            ("minimize_to_tray", "always_on_top", "start_with_windows", "max_history")
+        )
+
         # Load minimize to tray (default True)
-        minimize_tray = self.config_manager.get_setting("minimize_to_tray", True)
+        minimize_tray = values.get("minimize_to_tray", True)
         self.minimize_tray_check.setChecked(minimize_tray)
 
         # Load always on top
-        always_on_top = self.config_manager.get_setting("always_on_top", True)
+        always_on_top = values.get("always_on_top", True)
         self.always_on_top_check.setChecked(always_on_top)
 
         # Load start with windows
-        start_windows = self.config_manager.get_setting("start_with_windows", False)
+        start_windows = values.get("start_with_windows", False)
         self.start_windows_check.setChecked(start_windows)
 
         # Load max history
-        max_history = self.config_manager.get_setting("max_history", 20)
+        max_history = values.get("max_history", 20)
         self.max_history_spin.setValue(max_history)
 
     def _has_sensitive_items(self) -> bool:
@@ -399,6 +466,9 @@ class GeneralSettings(QWidget):
 
     def export_config(self):
         """Export configuration to JSON file"""
+        # Dialog imports are local: only needed when the user actually exports
+        from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
         if not self.config_manager:
             QMessageBox.warning(
                 self,
@@ -407,6 +477,8 @@ class GeneralSettings(QWidget):
             )
             return
 
+        from src.views.dialogs.password_verify_dialog import PasswordVerifyDialog
+
         # Verify password before exporting (security measure)
         password_verified = PasswordVerifyDialog.verify(
             title="Exportar Configuración",
@@ -445,7 +517,7 @@ class GeneralSettings(QWidget):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Exportar Configuración",
-            str(Path.home() / "widget_sidebar_config.json"),
+            str(_USER_HOME / "widget_sidebar_config.json"),
             "JSON Files (*.json)"
         )
 
@@ -476,6 +548,8 @@ class GeneralSettings(QWidget):
 
     def import_config(self):
         """Import configuration from JSON file"""
+        from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
         if not self.config_manager:
             QMessageBox.warning(
                 self,
@@ -488,7 +562,7 @@ class GeneralSettings(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Importar Configuración",
-            str(Path.home()),
+            str(_USER_HOME),
             "JSON Files (*.json)"
         )
 
@@ -522,73 +596,40 @@ class GeneralSettings(QWidget):
 
     def change_password(self):
         """Change user password"""
+        from PyQt6.QtWidgets import QMessageBox
+
         # Get values
         current_password = self.current_password_input.text()
         new_password = self.new_password_input.text()
         confirm_password = self.confirm_password_input.text()
 
-        # Validate inputs
+        # Validate everything in one pass and report all problems in a single message
+        errors = []  # (message, field to focus)
+
         if not current_password:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "Por favor ingresa tu contraseña actual"
-            )
-            self.current_password_input.setFocus()
-            return
+            errors.append(("Por favor ingresa tu contraseña actual", self.current_password_input))
 
         if not new_password:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "Por favor ingresa una nueva contraseña"
-            )
-            self.new_password_input.setFocus()
-            return
-
-        if len(new_password) < 4:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "La nueva contraseña debe tener al menos 4 caracteres"
-            )
-            self.new_password_input.setFocus()
-            return
+            errors.append(("Por favor ingresa una nueva contraseña", self.new_password_input))
+        elif len(new_password) < 4:
+            errors.append(("La nueva contraseña debe tener al menos 4 caracteres", self.new_password_input))
 
         if not confirm_password:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "Por favor confirma tu nueva contraseña"
-            )
-            self.confirm_password_input.setFocus()
-            return
+            errors.append(("Por favor confirma tu nueva contraseña", self.confirm_password_input))
+        elif new_password != confirm_password:
+            errors.append(("Las contraseñas no coinciden", self.confirm_password_input))
 
-        # Validate passwords match
-        if new_password != confirm_password:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "Las contraseñas no coinciden"
-            )
-            self.confirm_password_input.clear()
-            self.confirm_password_input.setFocus()
-            return
+        if current_password and current_password == new_password:
+            errors.append(("La nueva contraseña debe ser diferente a la actual", self.new_password_input))
 
-        # Validate current password is different from new
-        if current_password == new_password:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "La nueva contraseña debe ser diferente a la actual"
-            )
-            self.new_password_input.clear()
-            self.confirm_password_input.clear()
-            self.new_password_input.setFocus()
+        if errors:
+            QMessageBox.warning(self, "Error", "\n".join(message for message, _ in errors))
+            errors[0][1].setFocus()
             return
 
-        # Change password using AuthManager
-        auth_manager = AuthManager()
+        # Change password using AuthManager (imported on first use)
+        from src.core.auth_manager import AuthManager
+        auth_manager = AuthManager.instance()
         success = auth_manager.change_password(current_password, new_password)
 
         if success:
@@ -600,10 +641,12 @@ class GeneralSettings(QWidget):
             )
             logger.info("Password changed successfully")
 
-            # Clear fields
-            self.current_password_input.clear()
-            self.new_password_input.clear()
-            self.confirm_password_input.clear()
+            # Clear fields with signals blocked, then refresh the button state once
+            for field in (self.current_password_input, self.new_password_input,
+                          self.confirm_password_input):
+                with QSignalBlocker(field):
+                    field.clear()
+            self._update_change_password_btn()
         else:
             # Failed - incorrect current password
             QMessageBox.warning(
@@ -615,6 +658,10 @@ class GeneralSettings(QWidget):
             self.current_password_input.setFocus()
             logger.warning("Failed to change password: incorrect current password")
 
+    def _update_change_password_btn(self, *_):
+        """Enable the change password button only while the new password is acceptable"""
+        self.change_password_btn.setEnabled(self.new_password_input.hasAcceptableInput())
+
     def update_master_password_ui(self):
         """Update master password UI state (button text and status)"""
         master_mgr = MasterPasswordManager()
@@ -623,25 +670,28 @@ class GeneralSettings(QWidget):
             # No master password configured
             self.master_password_btn.setText("Crear Contraseña Maestra")
             self.master_status_label.setText("⚠ No configurada")
-            self.master_status_label.setStyleSheet(
-                "color: #ff9900; background-color: #2d2d00; "
-                "padding: 5px; font-weight: bold; border-radius: 3px;"
-            )
+            self._set_master_status_state("pending")
             # Make current password field optional (show hint)
             self.master_current_input.setPlaceholderText("Déjalo vacío (primera vez)")
         else:
             # Master password already configured
             self.master_password_btn.setText("Cambiar Contraseña Maestra")
             self.master_status_label.setText("✓ Configurada")
-            self.master_status_label.setStyleSheet(
-                "color: #00ff88; background-color: #002d1a; "
-                "padding: 5px; font-weight: bold; border-radius: 3px;"
-            )
+            self._set_master_status_state("configured")
             # Current password is required
             self.master_current_input.setPlaceholderText("Ingresa tu contraseña maestra actual")
 
+    def _set_master_status_state(self, state: str):
+        """Switch the master status label style via its dynamic 'state' property"""
+        label = self.master_status_label
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
     def create_or_change_master_password(self):
         """Create or change master password"""
+        from PyQt6.QtWidgets import QMessageBox
+
         master_mgr = MasterPasswordManager()
 
         current_password = self.master_current_input.text()
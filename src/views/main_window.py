@@ -127,6 +127,9 @@ class MainWindow(QMainWindow):
             self.controller.process_controller.process_state_changed.connect(
                 self.on_process_state_changed
             )
+            self.controller.process_controller.process_states_changed.connect(
+                self.on_process_states_changed
+            )
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -2078,6 +2081,11 @@ class MainWindow(QMainWindow):
         # Refresh sidebar to show/hide process button
         self.load_processes_to_sidebar()
 
+    def on_process_states_changed(self, changes: list):
+        """Handle bulk process state change - refresh sidebar once"""
+        logger.info(f"Process states changed: {len(changes)} processes")
+        self.load_processes_to_sidebar()
+
     def position_process_panel(self, panel):
         """Position process panel near sidebar with offset for pinned panels"""
         # Position to the left of sidebar
@@ -591,6 +591,10 @@ class ProjectAreaViewerPanel(QWidget):
         # Limpiar lista de headers de tags
         self.tag_headers.clear()
 
+        # Recuperar los headers de grupo antes de destruir sus contenedores
+        for group_widget in self.content_widget.findChildren(ItemGroupWidget):
+            group_widget.release_header()
+
         # Eliminar todos los widgets del layout
         while self.content_layout.count():
             item = self.content_layout.takeAt(0)
@@ -1563,7 +1567,7 @@ class ProjectAreaViewerPanel(QWidget):
             self._reload_projects_and_areas()
 
             # Auto-seleccionar el proyecto recién creado
-            self.context_selector.project_combo.setCurrentText(name)
+            self.context_selector.set_context(project_id=project_id)
 
             QMessageBox.information(
                 self,
@@ -1607,7 +1611,7 @@ class ProjectAreaViewerPanel(QWidget):
             self._reload_projects_and_areas()
 
             # Auto-seleccionar el área recién creada
-            self.context_selector.area_combo.setCurrentText(name)
+            self.context_selector.set_context(area_id=area_id)
 
             QMessageBox.information(
                 self,
@@ -553,6 +553,10 @@ class ProjectFullViewPanel(QWidget):
         # Limpiar lista de headers
         self.tag_headers.clear()
 
+        # Recuperar los headers de grupo antes de destruir sus contenedores
+        for group_widget in self.content_widget.findChildren(ItemGroupWidget):
+            group_widget.release_header()
+
         # Eliminar todos los widgets del layout
         while self.content_layout.count():
             child = self.content_layout.takeAt(0)
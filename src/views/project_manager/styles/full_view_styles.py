@@ -10,6 +10,25 @@ Versión: 1.0
 from .color_palette import FullViewColorPalette as Colors
 
 
+# Plantilla de colores del botón de copiar lista: un bloque por estado,
+# cambian solo el selector y los colores
+_COPY_BTN_STATE_TEMPLATE = """
+            QPushButton#copyListBtn{selector} {{
+                background-color: {bg};
+                border-color: {border};
+            }}
+
+            QPushButton#copyListBtn{selector}:hover {{
+                background-color: {hover};
+                border-color: {hover_border};
+            }}
+
+            QPushButton#copyListBtn{selector}:pressed {{
+                background-color: {pressed};
+            }}
+"""
+
+
 class FullViewStyles:
     """
     Estilos CSS centralizados para vista completa
@@ -119,7 +138,39 @@ class FullViewStyles:
                 font-weight: 600;
                 font-family: 'Consolas', 'Courier New', monospace;
             }}
-        """
+
+            QPushButton#createListBtn {{
+                background-color: #2d5d2e;
+                color: #00ff88;
+                border: 2px solid #00ff88;
+                border-radius: 4px;
+                font-size: 16px;
+                font-weight: bold;
+            }}
+
+            QPushButton#createListBtn:hover {{
+                background-color: #3a7a3c;
+                border-color: #7CFC00;
+            }}
+
+            QPushButton#createListBtn:pressed {{
+                background-color: #1a4d2e;
+            }}
+
+            QPushButton#copyListBtn {{
+                color: #ffffff;
+                border: 1px solid #555;
+                border-radius: 4px;
+                font-size: 12px;
+                padding: 2px;
+            }}
+        """ + _COPY_BTN_STATE_TEMPLATE.format(
+            selector="", bg="#3d3d3d", border="#555",
+            hover="#4d4d4d", hover_border="#666", pressed="#2d2d2d"
+        ) + _COPY_BTN_STATE_TEMPLATE.format(
+            selector='[state="success"]', bg="#4CAF50", border="#45a049",
+            hover="#45a049", hover_border="#3d8b40", pressed="#3d8b40"
+        )
 
     @staticmethod
     def get_text_item_style():
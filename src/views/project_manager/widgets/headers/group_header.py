@@ -8,10 +8,14 @@ Autor: Widget Sidebar Team
 Versión: 1.1
 """
 
-from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from ...styles.full_view_styles import FullViewStyles
-import pyperclip
+
+
+# Headers liberados listos para reutilizar (ver GroupHeaderWidget.acquire/release)
+_HEADER_POOL: list = []
+_HEADER_POOL_MAX = 64
 
 
 class GroupHeaderWidget(QFrame):
@@ -30,6 +34,19 @@ class GroupHeaderWidget(QFrame):
     # Señales
     create_list_clicked = pyqtSignal()
 
+    # Formato del título por tipo de grupo (tipos desconocidos usan el formato por defecto)
+    _TITLE_FMT = {
+        "category": "[ Categoría: {} ]",
+        "tag": "[ Tag: {} ]",
+    }
+    _DEFAULT_TITLE_FMT = "[ {} ]"
+
+    # Largo máximo visible del nombre de una lista
+    _LIST_NAME_MAX = 20
+
+    # Hoja de estilos (incluye botones de lista) construida una sola vez al importar
+    _STYLE_SHEET = FullViewStyles.get_group_header_style()
+
     def __init__(self, parent=None):
         """
         Inicializar widget de encabezado de grupo
@@ -44,9 +61,55 @@ class GroupHeaderWidget(QFrame):
         self.create_list_btn = None  # Solo para listas
         self.copy_list_name_btn = None  # Solo para listas
 
+        # Timer único para restaurar el botón de copiar (se reinicia en cada click)
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(1500)
+        self._restore_timer.timeout.connect(self._restore_copy_button_style)
+
         self.init_ui()
         self.apply_styles()
 
+    @classmethod
+    def acquire(cls, parent=None) -> "GroupHeaderWidget":
+        """
+        Obtener un header del pool o crear uno nuevo
+
+        Args:
+            parent: Widget padre
+
+        Returns:
+            GroupHeaderWidget listo para set_group_info()
+        """
+        if _HEADER_POOL:
+            widget = _HEADER_POOL.pop()
+            widget.setParent(parent)
+            return widget
+        return cls(parent)
+
+    @classmethod
+    def release(cls, widget: "GroupHeaderWidget"):
+        """
+        Devolver un header al pool para reutilizarlo
+
+        Desconecta las señales del dueño anterior y lo saca de su padre;
+        si el pool está lleno, el widget se destruye.
+
+        Args:
+            widget: Header a liberar
+        """
+        try:
+            widget.create_list_clicked.disconnect()
+        except TypeError:
+            pass  # Sin conexiones
+
+        # setParent(None) oculta sin marcar hide() explícito: addWidget lo vuelve a mostrar
+        widget.setParent(None)
+        if len(_HEADER_POOL) < _HEADER_POOL_MAX:
+            _HEADER_POOL.append(widget)
+        else:
+            widget.deleteLater()
+
     def init_ui(self):
         """Inicializar interfaz de usuario"""
         self.layout = QHBoxLayout(self)
@@ -63,7 +126,7 @@ class GroupHeaderWidget(QFrame):
 
     def apply_styles(self):
         """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_group_header_style())
+        self.setStyleSheet(self._STYLE_SHEET)
 
     def set_group_info(self, name: str, group_type: str = "category"):
         """
@@ -76,31 +139,51 @@ class GroupHeaderWidget(QFrame):
         self.group_name = name
         self.group_type = group_type
 
-        # Remover botones anteriores si existen
-        if self.create_list_btn:
-            self.create_list_btn.deleteLater()
-            self.create_list_btn = None
-        if self.copy_list_name_btn:
-            self.copy_list_name_btn.deleteLater()
-            self.copy_list_name_btn = None
-
-        # Formato según tipo
-        if group_type == "category":
-            self.title_label.setText(f"[ Categoría: {name} ]")
-        elif group_type == "list":
-            # Limitar nombre a 20 caracteres con puntos suspensivos
-            display_name = name if len(name) <= 20 else f"{name[:20]}..."
-            self.title_label.setText(display_name)
-            # Agregar tooltip con el nombre completo
-            self.title_label.setToolTip(f"Lista: {name}")
-            # Agregar botón de copiar nombre de lista
-            self._add_copy_list_name_button()
-            # Agregar botón "+" para crear lista
-            self._add_create_list_button()
-        elif group_type == "tag":
-            self.title_label.setText(f"[ Tag: {name} ]")
-        else:
-            self.title_label.setText(f"[ {name} ]")
+        is_list = group_type == "list"
+
+        # Los botones de lista se crean una sola vez y solo se muestran/ocultan
+        self._set_list_buttons_visible(is_list)
+
+        # Formato según tipo (las listas tienen presentación propia)
+        if not is_list:
+            self.title_label.setText(
+                self._TITLE_FMT.get(group_type, self._DEFAULT_TITLE_FMT).format(name)
+            )
+            self.title_label.setToolTip("")
+            return
+
+        # Limitar nombre a 20 caracteres con puntos suspensivos
+        # (nombres cortos: el slice devuelve el mismo str, sin copias ni formateo)
+        limit = self._LIST_NAME_MAX
+        self.title_label.setText(name[:limit] + "..." if len(name) > limit else name)
+        # Agregar tooltip con el nombre completo
+        self.title_label.setToolTip(f"Lista: {name}")
+        if self.copy_list_name_btn is None or self.create_list_btn is None:
+            # Insertar ambos botones con el repintado suspendido: una sola pasada de layout
+            self.setUpdatesEnabled(False)
+            try:
+                # Agregar botón de copiar nombre de lista
+                self._add_copy_list_name_button()
+                # Agregar botón "+" para crear lista
+                self._add_create_list_button()
+            finally:
+                self.setUpdatesEnabled(True)
+            self.updateGeometry()
+        # Un botón reutilizado puede venir en estado "copiado"
+        if self.copy_list_name_btn.property("state"):
+            self._restore_timer.stop()
+            self._restore_copy_button_style()
+
+    def _set_list_buttons_visible(self, visible: bool):
+        """
+        Mostrar u ocultar los botones de lista ya creados
+
+        Args:
+            visible: True para mostrarlos (tipo 'list')
+        """
+        for button in (self.copy_list_name_btn, self.create_list_btn):
+            if button:
+                button.setVisible(visible)
 
     def _add_create_list_button(self):
         """Agregar botón '+' para crear lista (solo cuando es tipo 'list')"""
@@ -111,23 +194,7 @@ class GroupHeaderWidget(QFrame):
         self.create_list_btn.setFixedSize(24, 24)
         self.create_list_btn.setToolTip("Crear nueva lista")
         self.create_list_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.create_list_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d5d2e;
-                color: #00ff88;
-                border: 2px solid #00ff88;
-                border-radius: 4px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a7a3c;
-                border-color: #7CFC00;
-            }
-            QPushButton:pressed {
-                background-color: #1a4d2e;
-            }
-        """)
+        self.create_list_btn.setObjectName("createListBtn")
         self.create_list_btn.clicked.connect(self.create_list_clicked.emit)
 
         # Insertar botón antes del spacer
@@ -142,23 +209,7 @@ class GroupHeaderWidget(QFrame):
         self.copy_list_name_btn.setFixedSize(24, 24)
         self.copy_list_name_btn.setToolTip("Copiar nombre de lista al portapapeles")
         self.copy_list_name_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.copy_list_name_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.copy_list_name_btn.setObjectName("copyListBtn")
         self.copy_list_name_btn.clicked.connect(self._copy_list_name_to_clipboard)
 
         # Insertar botón antes del spacer
@@ -166,62 +217,37 @@ class GroupHeaderWidget(QFrame):
 
     def _copy_list_name_to_clipboard(self):
         """Copiar nombre de lista al portapapeles con feedback visual"""
-        try:
-            # Copiar al portapapeles
-            pyperclip.copy(self.group_name)
-
-            # Feedback visual: cambiar a verde temporalmente
-            success_style = """
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: #ffffff;
-                    border: 1px solid #45a049;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                    border-color: #3d8b40;
-                }
-                QPushButton:pressed {
-                    background-color: #3d8b40;
-                }
-            """
-
-            # Cambiar a verde con checkmark
-            self.copy_list_name_btn.setStyleSheet(success_style)
-            self.copy_list_name_btn.setText("✓")
-
-            # Restaurar después de 1.5 segundos
-            QTimer.singleShot(1500, self._restore_copy_button_style)
-
-        except Exception as e:
-            print(f"Error al copiar nombre de lista: {e}")
+        # Copiar al portapapeles (QClipboard de la aplicación, sin abrir el del SO por llamada)
+        QApplication.clipboard().setText(self.group_name)
+
+        # Feedback visual: cambiar a verde con checkmark (regla [state="success"])
+        self._set_copy_button_state("success")
+        self.copy_list_name_btn.setText("✓")
+
+        # Restaurar después de 1.5 segundos (clicks seguidos reinician la cuenta)
+        self._restore_timer.start()
 
     def _restore_copy_button_style(self):
         """Restaurar estilo original del botón de copiar"""
-        original_style = """
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """
         if self.copy_list_name_btn:
-            self.copy_list_name_btn.setStyleSheet(original_style)
+            self._set_copy_button_state("")
             self.copy_list_name_btn.setText("📋")
 
+    def _set_copy_button_state(self, state: str):
+        """
+        Cambiar el estado visual del botón de copiar
+
+        El estilo de cada estado vive en la hoja del header; solo se cambia
+        la propiedad dinámica y se vuelve a pulir el botón.
+
+        Args:
+            state: "success" o "" (normal)
+        """
+        button = self.copy_list_name_btn
+        button.setProperty("state", state)
+        button.style().unpolish(button)
+        button.style().polish(button)
+
     def get_group_name(self) -> str:
         """
         Obtener nombre del grupo
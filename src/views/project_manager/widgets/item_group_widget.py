@@ -64,8 +64,8 @@ class ItemGroupWidget(QWidget):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
 
-        # Header del grupo
-        self.header = GroupHeaderWidget()
+        # Header del grupo (reutilizado del pool si hay alguno libre)
+        self.header = GroupHeaderWidget.acquire(self)
         self.header.set_group_info(self.group_name, self.group_type)
         self.header.create_list_clicked.connect(self.create_list_clicked.emit)
         self.main_layout.addWidget(self.header)
@@ -335,9 +335,39 @@ class ItemGroupWidget(QWidget):
     def clear_items(self):
         """Limpiar todos los items del grupo"""
         for item in self.items:
+            # Sacar del layout ya (el widget puede reutilizarse antes del deleteLater)
+            self.items_layout.removeWidget(item)
+            item.hide()
             item.deleteLater()
         self.items.clear()
 
+    def reset_group(self, group_name: str):
+        """
+        Reutilizar el widget para otro grupo del mismo tipo
+
+        Vacía los items y actualiza el header; el tipo (y la barra de
+        herramientas de listas) se conserva.
+
+        Args:
+            group_name: Nombre del nuevo grupo
+        """
+        self.clear_items()
+        self.group_name = group_name
+        self.header.set_group_info(group_name, self.group_type)
+
+    def release_header(self):
+        """
+        Devolver el header al pool compartido
+
+        Llamar antes de destruir el grupo; después de esto el grupo
+        no debe volver a usarse.
+        """
+        if self.header is None:
+            return
+        self.main_layout.removeWidget(self.header)
+        GroupHeaderWidget.release(self.header)
+        self.header = None
+
     def get_item_count(self) -> int:
         """
         Obtener cantidad de items en el grupo
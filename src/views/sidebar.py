@@ -2,7 +2,7 @@
 Sidebar View - Vertical sidebar with category buttons and scroll navigation
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt6.QtGui import QFont
 from typing import List
 import sys
@@ -22,6 +22,10 @@ logger = logging.getLogger(__name__)
 class Sidebar(QWidget):
     """Vertical sidebar with category buttons and scroll navigation"""
 
+    # Process buttons built as soon as processes load; the rest (below the fold
+    # in a 70px-wide sidebar) are built on the next event-loop pass, after paint
+    PROCESS_BUTTONS_EAGER = 8
+
     # Signal emitted when a category button is clicked
     category_clicked = pyqtSignal(str)  # category_id
 
@@ -130,6 +134,8 @@ class Sidebar(QWidget):
         # Process buttons
         self.process_buttons = {}  # Dict: process_id -> ProcessButton
         self.active_process_button = None
+        self._deferred_process_specs = []  # (id, name, step_count) not built yet
+        self._pending_active_process_id = None  # Active process whose button is deferred
 
         self.init_ui()
 
@@ -754,41 +760,148 @@ class Sidebar(QWidget):
 
     def load_active_processes(self, processes):
         """Load and create buttons for active processes"""
-        from src.views.widgets.process_button import ProcessButton
-
-        # Clear existing process buttons
-        self.clear_process_buttons()
-
         # Filter only active processes
         active_processes = [p for p in processes if p.is_active]
 
-        # Create button for each active process
+        # Collect (id, name, step count) for each active process
+        specs = []
         for process in active_processes:
             # Get step count for this process
             step_count = 0
             if self.controller and self.controller.process_controller:
                 steps = self.controller.process_controller.get_process_steps(process.id)
                 step_count = len(steps)
+            specs.append((process.id, process.name, step_count))
 
-            button = ProcessButton(process.id, process.name, step_count, self)
-            button.clicked.connect(self.on_process_clicked)
+        # Refresh: update the existing buttons in place when possible
+        if self._update_process_buttons(specs):
+            self.update_scroll_buttons()
+            return
 
-            self.process_buttons[process.id] = button
-            # Insert before the stretch
-            self.buttons_layout.insertWidget(self.buttons_layout.count() - 1, button)
+        # Clear existing process buttons
+        self.clear_process_buttons()
+
+        # Build the first buttons now and the offscreen rest after the next paint
+        eager = self.PROCESS_BUTTONS_EAGER
+        self._add_process_buttons(specs[:eager])
+        self._deferred_process_specs = specs[eager:]
+        if self._deferred_process_specs:
+            QTimer.singleShot(0, self._build_deferred_process_buttons)
 
         # Update scroll buttons
         self.update_scroll_buttons()
 
+    def _update_process_buttons(self, specs) -> bool:
+        """
+        Apply a new process list to the existing buttons
+
+        Removes buttons of processes that are gone, creates buttons only for new
+        processes and updates name/step count of the rest in place; the active
+        button keeps its state.
+
+        Args:
+            specs: List of (process_id, process_name, step_count), in display order
+
+        Returns:
+            bool: False if a full rebuild is needed (nothing loaded yet, a
+            deferred batch pending, the kept processes were reordered or the
+            buttons are no longer right before the stretch)
+        """
+        if not self.process_buttons or self._deferred_process_specs:
+            return False
+
+        new_ids = [process_id for process_id, _, _ in specs]
+        new_id_set = set(new_ids)
+        kept_old_order = [pid for pid in self.process_buttons if pid in new_id_set]
+        kept_new_order = [pid for pid in new_ids if pid in self.process_buttons]
+        if kept_old_order != kept_new_order:
+            return False
+
+        # The process buttons must be one block right before the stretch (the
+        # last layout item). load_categories inserts before the stretch too, so
+        # after a category reload they sit above the categories: rebuild then,
+        # which appends them after the categories again.
+        layout = self.buttons_layout
+        stretch_index = layout.count() - 1
+        if stretch_index < 0 or layout.itemAt(stretch_index).spacerItem() is None:
+            return False
+        block_start = stretch_index - len(self.process_buttons)
+        positions = [layout.indexOf(button) for button in self.process_buttons.values()]
+        if positions != list(range(block_start, stretch_index)):
+            return False
+
+        from src.views.widgets.process_button import ProcessButton
+
+        # Remove buttons of processes no longer active
+        for process_id in [pid for pid in self.process_buttons if pid not in new_id_set]:
+            button = self.process_buttons.pop(process_id)
+            if button is self.active_process_button:
+                self.active_process_button = None
+            self.buttons_layout.removeWidget(button)
+            button.deleteLater()
+
+        # First row of the (now shorter) block, taken from the layout itself
+        if self.process_buttons:
+            first_index = layout.indexOf(next(iter(self.process_buttons.values())))
+        else:
+            first_index = layout.count() - 1  # Only the stretch is left after the categories
+
+        buttons = {}
+        for row, (process_id, process_name, step_count) in enumerate(specs):
+            button = self.process_buttons.get(process_id)
+            if button is not None:
+                button.set_process_info(process_name, step_count)
+            else:
+                button, = ProcessButton.build_batch(
+                    self.buttons_layout, [(process_id, process_name, step_count)],
+                    first_index + row
+                )
+                button.clicked.connect(self.on_process_clicked)
+            buttons[process_id] = button
+
+        # Keep the dict in display order
+        self.process_buttons = buttons
+        return True
+
+    def _add_process_buttons(self, specs):
+        """Create process buttons in one layout pass, inserted before the stretch"""
+        from src.views.widgets.process_button import ProcessButton
+
+        buttons = ProcessButton.build_batch(
+            self.buttons_layout, specs, self.buttons_layout.count() - 1
+        )
+        for button in buttons:
+            button.clicked.connect(self.on_process_clicked)
+            self.process_buttons[button.process_id] = button
+
+    def _build_deferred_process_buttons(self):
+        """Build the process buttons left out of the first pass"""
+        specs, self._deferred_process_specs = self._deferred_process_specs, []
+        if not specs:
+            return  # Reloaded or cleared in the meantime
+
+        self._add_process_buttons(specs)
+
+        pending_id = self._pending_active_process_id
+        if pending_id is not None:
+            self.set_active_process(pending_id)
+
+        self.update_scroll_buttons()
+
     def clear_process_buttons(self):
         """Clear all process buttons"""
         for button in self.process_buttons.values():
+            # Out of the layout now: deleteLater alone leaves it counted until deletion
+            self.buttons_layout.removeWidget(button)
             button.deleteLater()
         self.process_buttons.clear()
         self.active_process_button = None
+        self._deferred_process_specs = []
+        self._pending_active_process_id = None
 
     def on_process_clicked(self, process_id: int):
         """Handle process button click"""
+        self._pending_active_process_id = None
         # Update active button
         if self.active_process_button:
             self.active_process_button.set_active(False)
@@ -819,9 +932,14 @@ class Sidebar(QWidget):
         if button:
             button.set_active(True)
             self.active_process_button = button
+            self._pending_active_process_id = None
+        elif any(spec[0] == process_id for spec in self._deferred_process_specs):
+            # Button not built yet: activate it when the deferred batch is created
+            self._pending_active_process_id = process_id
 
     def clear_active_process(self):
         """Clear active process button"""
+        self._pending_active_process_id = None
         if self.active_process_button:
             self.active_process_button.set_active(False)
             self.active_process_button = None
@@ -21,114 +21,247 @@ Fecha: 2025-12-26
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QFrame, QPushButton,
-    QCompleter
+    QCompleter, QListView
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QObject, QEvent
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QSignalBlocker, QTimer, QStringListModel
+from PyQt6.QtGui import QFont, QStandardItemModel, QStandardItem
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Textos de la primera fila de cada combo (dato None)
+_PLACEHOLDER_PROJECT = "Seleccionar proyecto..."
+_PLACEHOLDER_AREA = "Ninguno"
 
-class PopupPositionFilter(QObject):
+# Fuente del header, compartida por todas las instancias (ver _header_font)
+_HEADER_FONT = None
+
+
+def _header_font() -> QFont:
     """
-    Event filter para ajustar la posición del popup del completer
-    cuando se muestra, asegurando que esté dentro de los límites de la pantalla
+    Obtener la fuente del header, creada una sola vez
+
+    No se construye al importar: el módulo puede cargarse antes que la QApplication.
     """
+    global _HEADER_FONT
+    if _HEADER_FONT is None:
+        _HEADER_FONT = QFont("Segoe UI", 10, QFont.Weight.Bold)
+    return _HEADER_FONT
+
+
+def _adjust_popup_position(combo, popup_widget):
+    """
+    Ajusta la posición de un popup para que quede bajo el combo y dentro de la pantalla
+
+    Args:
+        combo: ContextComboBox dueño del popup
+        popup_widget: Ventana del popup (lista del combo o del autocompletado)
+    """
+    if not popup_widget or not popup_widget.isVisible():
+        return
+
+    # Obtener la geometría del combobox en coordenadas globales
+    combo_rect = combo.rect()
+    combo_bottom_left = combo.mapToGlobal(combo_rect.bottomLeft())
+    combo_bottom_right = combo.mapToGlobal(combo_rect.bottomRight())
+
+    # Obtener el ancho del popup
+    popup_width = popup_widget.width()
+    if popup_width < 100:
+        popup_width = max(popup_widget.sizeHint().width(), combo.width())
+
+    # Obtener la geometría de la pantalla donde está el widget (cacheada por combo)
+    screen_geometry = combo.popup_screen_geometry(combo_bottom_left)
+
+    # Calcular posición X (alineado con el combo)
+    x_pos = combo_bottom_left.x()
+
+    # Si el popup se sale por la derecha, ajustarlo
+    if x_pos + popup_width > screen_geometry.right():
+        x_pos = combo_bottom_right.x() - popup_width
+
+    # Si aún se sale por la izquierda, alinearlo con el borde izquierdo de la pantalla
+    if x_pos < screen_geometry.left():
+        x_pos = screen_geometry.left()
+
+    # Posicionar el popup SOLO si es necesario
+    current_pos = popup_widget.pos()
+    new_pos_y = combo_bottom_left.y()
+
+    if current_pos.x() != x_pos or current_pos.y() != new_pos_y:
+        popup_widget.move(x_pos, new_pos_y)
+
+    # Ajustar ancho si es necesario
+    if popup_widget.width() < combo.width():
+        popup_widget.setMinimumWidth(combo.width())
 
-    def __init__(self, combo, completer=None, parent=None):
+
+class ContextComboBox(QComboBox):
+    """
+    ComboBox que reubica sus popups solo cuando se abren
+
+    La lista se ajusta una vez en showPopup(). El autocompletado no se dispara
+    en cada tecla: un timer lo lanza cuando el usuario deja de escribir y su
+    popup se ajusta en ese momento.
+    Sin event filters: Python no interviene en cada Move/Resize del popup.
+    """
+
+    # Espera tras la última tecla antes de filtrar el autocompletado (ms)
+    COMPLETION_DEBOUNCE_MS = 100
+
+    # Filas visibles en el popup del autocompletado
+    COMPLETION_MAX_VISIBLE = 15
+
+    # Hoja del popup del autocompletado, compartida por todos los combos
+    COMPLETER_POPUP_STYLE_SHEET = """
+        QAbstractItemView {
+            background-color: #3d3d3d;
+            color: #ffffff;
+            selection-background-color: #00BFFF;
+            selection-color: #ffffff;
+            border: 1px solid #555;
+            outline: 0;
+        }
+        QAbstractItemView::item:hover {
+            background-color: #4d4d4d;
+            color: #00BFFF;
+        }
+    """
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.combo = combo
-        self.completer = completer
-        self.is_combo_view = completer is None
-        self._adjusting = False  # Bandera para prevenir loops infinitos
-
-    def eventFilter(self, obj, event):
-        """Filtra eventos del popup para ajustar su posición al mostrarse o moverse"""
-        event_type = event.type()
-
-        if not self._adjusting:
-            if event_type == QEvent.Type.Show:
-                # Cuando se muestra por primera vez, ajustar posición
-                self.adjust_popup_position(obj)
-            elif event_type == QEvent.Type.Move:
-                # Interceptar el movimiento y aplicar nuestra propia posición
-                self.adjust_popup_position(obj)
-                # CRÍTICO: Prevenir que el evento Move se propague para evitar
-                # que el popup se mueva a la posición incorrecta
-                return True
-            elif event_type == QEvent.Type.Resize:
-                # Al cambiar tamaño, reajustar posición
-                self.adjust_popup_position(obj)
-
-        return super().eventFilter(obj, event)
-
-    def adjust_popup_position(self, popup_widget):
-        """Ajusta la posición del popup para que esté dentro de la ventana"""
-        # Si es el popup del completer, obtenerlo del completer
-        if not self.is_combo_view and self.completer:
-            popup_widget = self.completer.popup()
-
-        if not popup_widget or not popup_widget.isVisible():
-            return
+        self._screen_geometry = None  # Área disponible de la pantalla (cache)
+        self._watching_screen = False
+        self._search_completer = None  # Se crea en la primera búsqueda
+        self._completion_names = []
 
-        # Ajustar la posición inmediatamente
-        self._do_adjust_position(popup_widget)
+        self._completion_timer = QTimer(self)
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(self.COMPLETION_DEBOUNCE_MS)
+        self._completion_timer.timeout.connect(self._run_completion)
 
-    def _do_adjust_position(self, popup_widget):
-        """Realiza el ajuste real de posición"""
-        from PyQt6.QtGui import QGuiApplication
+    def popup_screen_geometry(self, anchor):
+        """
+        Obtener el área disponible de la pantalla del combo
 
-        if not popup_widget or not popup_widget.isVisible():
-            return
+        Se calcula en el primer uso y se invalida cuando la ventana cambia de pantalla.
 
-        # Activar bandera para prevenir loops
-        self._adjusting = True
+        Args:
+            anchor: Punto global de referencia (esquina inferior izquierda del combo)
 
-        try:
-            # Obtener la geometría del combobox en coordenadas globales
-            combo_rect = self.combo.rect()
-            combo_bottom_left = self.combo.mapToGlobal(combo_rect.bottomLeft())
-            combo_bottom_right = self.combo.mapToGlobal(combo_rect.bottomRight())
-
-            # Obtener el ancho del popup
-            popup_width = popup_widget.width()
-            if popup_width < 100:
-                popup_width = max(popup_widget.sizeHint().width(), self.combo.width())
-
-            # Obtener la geometría de la pantalla donde está el widget
-            screen = QGuiApplication.screenAt(combo_bottom_left)
-            if screen:
-                screen_geometry = screen.availableGeometry()
-            else:
+        Returns:
+            QRect con la geometría disponible
+        """
+        if self._screen_geometry is None:
+            from PyQt6.QtGui import QGuiApplication
+
+            screen = QGuiApplication.screenAt(anchor)
+            if not screen:
                 # Fallback: usar la pantalla principal
-                screen_geometry = QGuiApplication.primaryScreen().availableGeometry()
+                screen = QGuiApplication.primaryScreen()
+            self._screen_geometry = screen.availableGeometry()
+
+            # La ventana nativa existe solo tras mostrarse: conectar una vez
+            handle = self.window().windowHandle()
+            if handle is not None and not self._watching_screen:
+                handle.screenChanged.connect(self._invalidate_screen_geometry)
+                self._watching_screen = True
 
-            # Calcular posición X (alineado con el combo)
-            x_pos = combo_bottom_left.x()
+        return self._screen_geometry
 
-            # Si el popup se sale por la derecha, ajustarlo
-            if x_pos + popup_width > screen_geometry.right():
-                x_pos = combo_bottom_right.x() - popup_width
+    def _invalidate_screen_geometry(self, *_):
+        """Descartar la geometría cacheada (la ventana pasó a otra pantalla)"""
+        self._screen_geometry = None
 
-            # Si aún se sale por la izquierda, alinearlo con el borde izquierdo de la pantalla
-            if x_pos < screen_geometry.left():
-                x_pos = screen_geometry.left()
+    def showPopup(self):
+        """Override: abrir la lista y ajustar su posición una sola vez"""
+        super().showPopup()
+        _adjust_popup_position(self, self.view().window())
 
-            # Posicionar el popup SOLO si es necesario (para evitar loops)
-            current_pos = popup_widget.pos()
-            new_pos_y = combo_bottom_left.y()
+    def enable_search(self):
+        """
+        Activar la búsqueda con autocompletado (llamar tras setEditable)
 
-            if current_pos.x() != x_pos or current_pos.y() != new_pos_y:
-                popup_widget.move(x_pos, new_pos_y)
+        El completer por defecto del combo se descarta: el QLineEdit lo dispararía
+        en cada tecla. El completer de búsqueda no se construye aquí sino en la
+        primera búsqueda real (ver _ensure_search_completer).
+        """
+        default_completer = self.completer()
+        self.setCompleter(None)
+        if default_completer is not None:
+            default_completer.deleteLater()
+        self.lineEdit().textEdited.connect(self._schedule_completion)
 
-            # Ajustar ancho si es necesario
-            if popup_widget.width() < self.combo.width():
-                popup_widget.setMinimumWidth(self.combo.width())
+    def set_completion_names(self, names: list):
+        """
+        Establecer los nombres del autocompletado
 
-        finally:
-            # Desactivar bandera
-            self._adjusting = False
+        Si el completer aún no existe solo se guardan; se cargan al crearlo.
+        El modelo anterior (hijo del completer) lo libera setModel.
+
+        Args:
+            names: Nombres seleccionables, en el mismo orden que el combo
+        """
+        self._completion_names = names
+        completer = self._search_completer
+        if completer is not None:
+            completer.setModel(QStringListModel(names, completer))
+
+    def search_completer(self):
+        """Obtener el completer de búsqueda (None si aún no se usó)"""
+        return self._search_completer
+
+    def _ensure_search_completer(self) -> QCompleter:
+        """
+        Crear el completer de búsqueda en su primer uso
+
+        La mayoría de las sesiones nunca escriben en el combo: el completer, su
+        popup y la hoja de estilos del popup quedan fuera del arranque.
+
+        Returns:
+            QCompleter configurado sobre el line edit
+        """
+        completer = self._search_completer
+        if completer is None:
+            completer = QCompleter(self)
+            completer.setModel(QStringListModel(self._completion_names, completer))
+            completer.setFilterMode(Qt.MatchFlag.MatchContains)
+            completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+            completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+            completer.setMaxVisibleItems(self.COMPLETION_MAX_VISIBLE)
+
+            # Estilizar el popup para que coincida con el tema
+            # (ventana sin padre: la hoja del widget no le llega)
+            completer.popup().setStyleSheet(self.COMPLETER_POPUP_STYLE_SHEET)
+
+            completer.setWidget(self.lineEdit())
+            completer.activated[str].connect(self._on_completion_activated)
+            self._search_completer = completer
+        return completer
+
+    def _schedule_completion(self, *_):
+        """Reiniciar la espera tras cada tecla"""
+        self._completion_timer.start()
+
+    def _run_completion(self):
+        """Filtrar y mostrar el autocompletado con el texto actual"""
+        text = self.lineEdit().text()
+        if not text:
+            if self._search_completer is not None:
+                self._search_completer.popup().hide()
+            return
+
+        completer = self._ensure_search_completer()
+
+        completer.setCompletionPrefix(text)
+        completer.complete()
+        _adjust_popup_position(self, completer.popup())
+
+    def _on_completion_activated(self, text: str):
+        """Seleccionar la fila del combo que corresponde al nombre elegido"""
+        index = self.findText(text)
+        if index >= 0:
+            self.setCurrentIndex(index)
 
 
 class ContextSelectorCompact(QWidget):
@@ -150,6 +283,105 @@ class ContextSelectorCompact(QWidget):
     create_project_clicked = pyqtSignal()
     create_area_clicked = pyqtSignal()
 
+    # Hoja de estilos compartida por todas las instancias (filas, combos y botones "+")
+    _STYLE_SHEET = """
+        QFrame#contextContainer {
+            background-color: #2d2d2d;
+            border: 1px solid #444;
+            border-radius: 6px;
+        }
+
+        QLabel#contextHeader {
+            color: #00BFFF;
+            margin-bottom: 5px;
+        }
+
+        QLabel#selectorLabel {
+            color: #ffffff;
+            font-size: 11px;
+            font-weight: 500;
+        }
+
+        QPushButton#createSelectorBtn {
+            background-color: #2d5d2e;
+            color: #00ff88;
+            border: 2px solid #00ff88;
+            border-radius: 4px;
+            font-size: 18px;
+            font-weight: bold;
+        }
+
+        QPushButton#createSelectorBtn:hover {
+            background-color: #3a7a3c;
+            border-color: #7CFC00;
+        }
+
+        QPushButton#createSelectorBtn:pressed {
+            background-color: #1a4d2e;
+        }
+
+        QComboBox {
+            background-color: #3d3d3d;
+            color: #ffffff;
+            border: 1px solid #555;
+            border-radius: 4px;
+            padding: 6px 10px;
+            font-size: 11px;
+        }
+
+        QComboBox:hover {
+            border-color: #00BFFF;
+            background-color: #4d4d4d;
+        }
+
+        QComboBox:focus {
+            border-color: #00BFFF;
+        }
+
+        QComboBox::drop-down {
+            border: none;
+            width: 20px;
+        }
+
+        QComboBox::down-arrow {
+            image: none;
+            border-left: 4px solid transparent;
+            border-right: 4px solid transparent;
+            border-top: 5px solid #999;
+            margin-right: 5px;
+        }
+
+        QComboBox::down-arrow:hover {
+            border-top-color: #00BFFF;
+        }
+
+        QComboBox QAbstractItemView {
+            background-color: #3d3d3d;
+            color: #ffffff;
+            selection-background-color: #00BFFF;
+            selection-color: #ffffff;
+            border: 1px solid #555;
+            outline: 0;
+        }
+
+        QComboBox QAbstractItemView::item {
+            padding: 5px;
+        }
+
+        QComboBox QAbstractItemView::item:hover {
+            background-color: #4d4d4d;
+            color: #00BFFF;
+        }
+
+        QComboBox QLineEdit {
+            background-color: transparent;
+            color: #ffffff;
+            border: none;
+            selection-background-color: #00BFFF;
+            selection-color: #ffffff;
+        }
+    """
+
     def __init__(self, parent=None):
         """
         Inicializa el selector compacto
@@ -159,8 +391,10 @@ class ContextSelectorCompact(QWidget):
         """
         super().__init__(parent)
 
-        # Estado interno
-        self._block_signals = False  # Para evitar bucles al resetear
+        # Última carga aplicada a cada combo: combo -> [(id, name), ...]
+        self._loaded_entries = {}
+        # Fila de cada ID en su combo: combo -> {id: fila}
+        self._id_rows = {}
 
         self._setup_ui()
         self._apply_styles()
@@ -177,8 +411,8 @@ class ContextSelectorCompact(QWidget):
 
         # Header de la sección
         header = QLabel("📋 Contexto")
-        header.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        header.setStyleSheet("color: #00BFFF; margin-bottom: 5px;")
+        header.setFont(_header_font())
+        header.setObjectName("contextHeader")
         layout.addWidget(header)
 
         # Frame contenedor
@@ -190,21 +424,22 @@ class ContextSelectorCompact(QWidget):
 
         # Fila de Proyecto
         project_row_layout, self.project_combo, self.create_project_btn = self._create_selector_row(
-            "Proyecto", "Seleccionar proyecto..."
+            "Proyecto", _PLACEHOLDER_PROJECT
         )
         container_layout.addLayout(project_row_layout)
 
         # Fila de Área
         area_row_layout, self.area_combo, self.create_area_btn = self._create_selector_row(
-            "Área", "Ninguno"
+            "Área", _PLACEHOLDER_AREA
         )
         container_layout.addLayout(area_row_layout)
 
         layout.addWidget(container)
 
-        # Conectar botones de creación
-        self.create_project_btn.clicked.connect(self.create_project_clicked.emit)
-        self.create_area_btn.clicked.connect(self.create_area_clicked.emit)
+        # Conectar botones de creación (mismo hilo: conexión directa)
+        direct = Qt.ConnectionType.DirectConnection
+        self.create_project_btn.clicked.connect(self.create_project_clicked.emit, direct)
+        self.create_area_btn.clicked.connect(self.create_area_clicked.emit, direct)
 
     def _create_selector_row(self, label_text: str, placeholder: str):
         """
@@ -223,101 +458,43 @@ class ContextSelectorCompact(QWidget):
         # Etiqueta
         label = QLabel(label_text)
         label.setFixedWidth(70)
-        label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 11px;
-            font-weight: 500;
-        """)
+        label.setObjectName("selectorLabel")
 
         # ComboBox
-        combo = QComboBox()
+        combo = ContextComboBox()
         combo.setPlaceholderText(placeholder)
         combo.setMinimumHeight(32)
         combo.setEditable(True)
         combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        combo.setMaxVisibleItems(15)
+
+        # Vista de lista virtualizada: filas de alto uniforme, layout por lotes
+        view = QListView(combo)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(50)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        combo.setView(view)
 
-        # Configurar autocompletado (Buscador)
-        completer = combo.completer()
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-
-        # Estilizar el popup del autocompletado para que coincida con el tema
-        popup = completer.popup()
-        popup.setStyleSheet("""
-            QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #00BFFF;
-                selection-color: #ffffff;
-                border: 1px solid #555;
-                outline: 0;
-            }
-            QAbstractItemView::item:hover {
-                background-color: #4d4d4d;
-                color: #00BFFF;
-            }
-        """)
+        # Configurar autocompletado (Buscador): el completer se crea en la primera
+        # búsqueda; sus nombres se cargan de una vez en _rebuild_completer()
+        combo.enable_search()
 
         # Configurar el popup del QComboBox para que se muestre correctamente
+        # (su estilo viene de la hoja del widget: QComboBox QAbstractItemView)
         combo_view = combo.view()
-        combo_view.setStyleSheet("""
-            QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #00BFFF;
-                selection-color: #ffffff;
-                border: 1px solid #555;
-                outline: 0;
-            }
-            QAbstractItemView::item {
-                padding: 5px;
-            }
-            QAbstractItemView::item:hover {
-                background-color: #4d4d4d;
-                color: #00BFFF;
-            }
-        """)
 
         # Forzar que el popup se abra dentro de la ventana
         combo_view.window().setWindowFlags(
             combo_view.window().windowFlags() | Qt.WindowType.Popup
         )
 
-        # Instalar event filter para ajustar posición del popup del completer
-        popup_filter_completer = PopupPositionFilter(combo, completer, combo)
-        completer.popup().installEventFilter(popup_filter_completer)
-
-        # Instalar event filter para el popup del QComboBox también
-        popup_filter_combo = PopupPositionFilter(combo, None, combo)
-        combo_view.window().installEventFilter(popup_filter_combo)
-
-        # Guardar referencias a los filters para evitar que sean recolectados por el GC
-        combo._popup_filter_completer = popup_filter_completer
-        combo._popup_filter_combo = popup_filter_combo
-
         # Botón "+" para crear
         create_btn = QPushButton("+")
         create_btn.setFixedSize(32, 32)
         create_btn.setToolTip(f"Crear nuevo {label_text.lower()}")
         create_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d5d2e;
-                color: #00ff88;
-                border: 2px solid #00ff88;
-                border-radius: 4px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a7a3c;
-                border-color: #7CFC00;
-            }
-            QPushButton:pressed {
-                background-color: #1a4d2e;
-            }
-        """)
+        create_btn.setObjectName("createSelectorBtn")
 
         row.addWidget(label)
         row.addWidget(combo, 1)  # Stretch factor 1
@@ -327,73 +504,17 @@ class ContextSelectorCompact(QWidget):
 
     def _apply_styles(self):
         """Aplica estilos CSS al widget"""
-        self.setStyleSheet("""
-            QFrame#contextContainer {
-                background-color: #2d2d2d;
-                border: 1px solid #444;
-                border-radius: 6px;
-            }
-
-            QComboBox {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 6px 10px;
-                font-size: 11px;
-            }
-
-            QComboBox:hover {
-                border-color: #00BFFF;
-                background-color: #4d4d4d;
-            }
-
-            QComboBox:focus {
-                border-color: #00BFFF;
-            }
-
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #999;
-                margin-right: 5px;
-            }
-
-            QComboBox::down-arrow:hover {
-                border-top-color: #00BFFF;
-            }
-
-            QComboBox QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #00BFFF;
-                selection-color: #ffffff;
-                selection-color: #ffffff;
-                border: 1px solid #555;
-            }
-
-            QComboBox QLineEdit {
-                background-color: transparent;
-                color: #ffffff;
-                border: none;
-                selection-background-color: #00BFFF;
-                selection-color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(self._STYLE_SHEET)
 
     def _connect_signals(self):
-        """Conecta señales internas"""
-        self.project_combo.currentIndexChanged.connect(self._on_project_changed)
-        self.area_combo.currentIndexChanged.connect(self._on_area_changed)
+        """Conecta señales internas (todas en el hilo de la GUI: conexión directa)"""
+        direct = Qt.ConnectionType.DirectConnection
+        self.project_combo.currentIndexChanged.connect(self._on_project_changed, direct)
+        self.area_combo.currentIndexChanged.connect(self._on_area_changed, direct)
 
     # === CALLBACKS INTERNOS ===
 
+    @pyqtSlot(int)
     def _on_project_changed(self, index: int):
         """
         Callback cuando cambia la selección de proyecto
@@ -403,23 +524,19 @@ class ContextSelectorCompact(QWidget):
         Args:
             index: Índice seleccionado en el combobox
         """
-        if self._block_signals:
-            return
-
         project_id = self.project_combo.currentData()
 
         if project_id:
             # OBLIGATORIO: Resetear área cuando se selecciona proyecto
-            self.reset_area()
-            logger.info(f"Proyecto seleccionado: {project_id} - Área reseteada")
-
-            # Emitir señal
-            self.project_changed.emit(project_id)
+            # (una sola transición: sin señales intermedias del combo de área)
+            logger.info("Proyecto seleccionado: %s - Área reseteada", project_id)
+            self.set_context(project_id=project_id)
         else:
             # Se seleccionó placeholder
             logger.debug("Proyecto deseleccionado")
             self.project_changed.emit(None)
 
+    @pyqtSlot(int)
     def _on_area_changed(self, index: int):
         """
         Callback cuando cambia la selección de área
@@ -429,84 +546,158 @@ class ContextSelectorCompact(QWidget):
         Args:
             index: Índice seleccionado en el combobox
         """
-        if self._block_signals:
-            return
-
         area_id = self.area_combo.currentData()
 
         if area_id:
             # OBLIGATORIO: Resetear proyecto cuando se selecciona área
-            self.reset_project()
-            logger.info(f"Área seleccionada: {area_id} - Proyecto reseteado")
-
-            # Emitir señal
-            self.area_changed.emit(area_id)
+            # (una sola transición: sin señales intermedias del combo de proyecto)
+            logger.info("Área seleccionada: %s - Proyecto reseteado", area_id)
+            self.set_context(area_id=area_id)
         else:
             # Se seleccionó placeholder
             logger.debug("Área deseleccionada")
             self.area_changed.emit(None)
 
-    # === MÉTODOS PÚBLICOS ===
-
-    def load_projects(self, projects: list):
+    def _fill_combo(self, combo: QComboBox, placeholder: str, entries: list):
         """
-        Cargar lista de proyectos en el dropdown
+        Cargar las filas de un combo
+
+        Si la lista no cambió desde la última carga no se toca nada; si cambió
+        poco se aplican solo las diferencias (conservando la selección). En otro
+        caso se arma un modelo fuera de pantalla y se instala con un único
+        setModel (con señales bloqueadas): una sola reconstrucción de vista y completer.
 
         Args:
-            projects: Lista de tuplas [(id, name), ...]
+            combo: ComboBox destino
+            placeholder: Texto de la primera fila (dato None)
+            entries: Lista de tuplas [(id, name), ...]
         """
-        logger.debug(f"🔄 load_projects() recibió: {projects}")
-        logger.debug(f"🔄 Longitud: {len(projects)}")
+        entries = [tuple(entry) for entry in entries]
+        previous = self._loaded_entries.get(combo)
+        self._loaded_entries[combo] = entries
+        self._id_rows[combo] = {
+            entry_id: row for row, (entry_id, _) in enumerate(entries, start=1)
+        }
+
+        if previous == entries:
+            return
 
-        self._block_signals = True
-        self.project_combo.clear()
-        logger.debug("🔄 ComboBox limpiado")
+        names = [name for _, name in entries]
+        if previous is not None and self._apply_entries_diff(combo, previous, entries):
+            self._rebuild_completer(combo, names)
+            return
+
+        model = QStandardItemModel(len(entries) + 1, 1, combo)
+        model.setItem(0, QStandardItem(placeholder))
+        for row, (entry_id, name) in enumerate(entries, start=1):
+            item = QStandardItem(name)
+            item.setData(entry_id, Qt.ItemDataRole.UserRole)
+            model.setItem(row, item)
+
+        combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(combo):
+                # El modelo anterior (hijo del combo) lo libera setModel
+                combo.setModel(model)
+                combo.setCurrentIndex(0)
+        finally:
+            combo.setUpdatesEnabled(True)
 
-        # Agregar placeholder
-        self.project_combo.addItem("Seleccionar proyecto...", None)
-        logger.debug("🔄 Placeholder agregado")
+        self._rebuild_completer(combo, names)
 
-        # Agregar proyectos
-        for project_id, project_name in projects:
-            self.project_combo.addItem(project_name, project_id)
-            logger.debug(f"🔄 Agregado: {project_name} (ID: {project_id})")
+    def _apply_entries_diff(self, combo: QComboBox, previous: list, entries: list) -> bool:
+        """
+        Actualizar el modelo actual del combo solo en las filas que cambiaron
 
-        self._block_signals = False
-        logger.debug(f"✅ ComboBox tiene {self.project_combo.count()} items totales")
+        Quita las filas eliminadas, inserta las nuevas en su posición y renombra
+        las existentes. La selección se conserva si la fila sigue existiendo.
 
-        # Log de todos los items
-        for i in range(self.project_combo.count()):
-            logger.debug(f"  Item {i}: {self.project_combo.itemText(i)} -> {self.project_combo.itemData(i)}")
+        Args:
+            combo: ComboBox cargado previamente por _fill_combo
+            previous: Filas de la carga anterior
+            entries: Filas nuevas
 
-    def load_areas(self, areas: list):
+        Returns:
+            bool: False si conviene reconstruir todo (más de la mitad de filas
+            cambiadas o filas reordenadas)
         """
-        Cargar lista de áreas en el dropdown
+        old_ids = {entry_id for entry_id, _ in previous}
+        new_ids = {entry_id for entry_id, _ in entries}
+        if 2 * len(old_ids ^ new_ids) > max(len(previous), len(entries)):
+            return False
+
+        # Las filas que se conservan deben mantener su orden relativo
+        kept_old_order = [entry_id for entry_id, _ in previous if entry_id in new_ids]
+        kept_new_order = [entry_id for entry_id, _ in entries if entry_id in old_ids]
+        if kept_old_order != kept_new_order:
+            return False
+
+        model = combo.model()
+        role = Qt.ItemDataRole.UserRole
+        current_id = combo.currentData()
+
+        with QSignalBlocker(combo):
+            # Quitar filas eliminadas (de abajo hacia arriba; la fila 0 es el placeholder)
+            for row in range(model.rowCount() - 1, 0, -1):
+                if model.item(row).data(role) not in new_ids:
+                    model.removeRow(row)
+
+            # Insertar nuevas y renombrar existentes, en el orden recibido
+            for row, (entry_id, name) in enumerate(entries, start=1):
+                item = model.item(row)
+                if item is not None and item.data(role) == entry_id:
+                    if item.text() != name:
+                        item.setText(name)
+                else:
+                    new_item = QStandardItem(name)
+                    new_item.setData(entry_id, role)
+                    model.insertRow(row, new_item)
+
+            # Restaurar la selección si sigue existiendo; si no, el placeholder
+            combo.setCurrentIndex(self._id_rows[combo].get(current_id, 0))
+
+        return True
+
+    def _rebuild_completer(self, combo: ContextComboBox, names: list):
+        """
+        Cargar los nombres del autocompletado
+
+        El índice de búsqueda se construye una vez por carga y no incluye el
+        placeholder; si el completer aún no existe, lo recibe al crearse.
 
         Args:
-            areas: Lista de tuplas [(id, name), ...]
+            combo: ComboBox cuyo completer se actualiza
+            names: Nombres seleccionables, en el mismo orden que el combo
+        """
+        combo.set_completion_names(names)
+
+    # === MÉTODOS PÚBLICOS ===
+
+    def load_projects(self, projects: list):
         """
-        logger.debug(f"🔄 load_areas() recibió: {areas}")
-        logger.debug(f"🔄 Longitud: {len(areas)}")
+        Cargar lista de proyectos en el dropdown
 
-        self._block_signals = True
-        self.area_combo.clear()
-        logger.debug("🔄 ComboBox limpiado")
+        Args:
+            projects: Lista de tuplas [(id, name), ...]
+        """
+        # Placeholder + proyectos en un solo modelo
+        self._fill_combo(self.project_combo, _PLACEHOLDER_PROJECT, projects)
 
-        # Agregar placeholder
-        self.area_combo.addItem("Ninguno", None)
-        logger.debug("🔄 Placeholder agregado")
+        # Un solo resumen, formateado solo si DEBUG está activo
+        logger.debug("✅ %d proyectos cargados en el selector", len(projects))
 
-        # Agregar áreas
-        for area_id, area_name in areas:
-            self.area_combo.addItem(area_name, area_id)
-            logger.debug(f"🔄 Agregado: {area_name} (ID: {area_id})")
+    def load_areas(self, areas: list):
+        """
+        Cargar lista de áreas en el dropdown
 
-        self._block_signals = False
-        logger.debug(f"✅ ComboBox tiene {self.area_combo.count()} items totales")
+        Args:
+            areas: Lista de tuplas [(id, name), ...]
+        """
+        # Placeholder + áreas en un solo modelo
+        self._fill_combo(self.area_combo, _PLACEHOLDER_AREA, areas)
 
-        # Log de todos los items
-        for i in range(self.area_combo.count()):
-            logger.debug(f"  Item {i}: {self.area_combo.itemText(i)} -> {self.area_combo.itemData(i)}")
+        # Un solo resumen, formateado solo si DEBUG está activo
+        logger.debug("✅ %d áreas cargadas en el selector", len(areas))
 
     def get_selected_project_id(self):
         """
@@ -526,15 +717,47 @@ class ContextSelectorCompact(QWidget):
         """
         return self.area_combo.currentData()
 
+    def set_context(self, project_id=None, area_id=None):
+        """
+        Seleccionar un proyecto o un área en una sola transición
+
+        Ambos combos se escriben con señales bloqueadas y se emite una única
+        señal: area_changed si se pasó área, si no project_changed (None si
+        ambos quedan en el placeholder).
+
+        Args:
+            project_id: ID del proyecto a seleccionar (None = placeholder)
+            area_id: ID del área a seleccionar (None = placeholder)
+
+        Raises:
+            ValueError: Si se pasan proyecto y área a la vez
+        """
+        if project_id is not None and area_id is not None:
+            raise ValueError("Proyecto y Área no pueden estar seleccionados simultáneamente")
+
+        # IDs desconocidos (o None) caen en el placeholder, fila 0
+        project_row = self._id_rows.get(self.project_combo, {}).get(project_id, 0)
+        area_row = self._id_rows.get(self.area_combo, {}).get(area_id, 0)
+
+        with QSignalBlocker(self.project_combo), QSignalBlocker(self.area_combo):
+            if self.project_combo.currentIndex() != project_row:
+                self.project_combo.setCurrentIndex(project_row)
+            if self.area_combo.currentIndex() != area_row:
+                self.area_combo.setCurrentIndex(area_row)
+
+        if area_id is not None:
+            self.area_changed.emit(self.area_combo.currentData())
+        else:
+            self.project_changed.emit(self.project_combo.currentData())
+
     def reset_project(self):
         """
         Resetear selector de proyecto al placeholder
 
         Bloquea señales para evitar bucles al ser llamado desde _on_area_changed.
         """
-        self._block_signals = True
-        self.project_combo.setCurrentIndex(0)  # Placeholder
-        self._block_signals = False
+        with QSignalBlocker(self.project_combo):
+            self.project_combo.setCurrentIndex(0)  # Placeholder
         logger.debug("Proyecto reseteado a placeholder")
 
     def reset_area(self):
@@ -543,9 +766,8 @@ class ContextSelectorCompact(QWidget):
 
         Bloquea señales para evitar bucles al ser llamado desde _on_project_changed.
         """
-        self._block_signals = True
-        self.area_combo.setCurrentIndex(0)  # Placeholder
-        self._block_signals = False
+        with QSignalBlocker(self.area_combo):
+            self.area_combo.setCurrentIndex(0)  # Placeholder
         logger.debug("Área reseteada a placeholder")
 
     def has_project_selected(self) -> bool:
@@ -574,14 +796,15 @@ class ContextSelectorCompact(QWidget):
             bool: True si la validación pasa (solo uno o ninguno seleccionado)
 
         Raises:
-            AssertionError: Si ambos están seleccionados (no debería pasar)
+            AssertionError: Si ambos están seleccionados (no debería pasar; solo sin -O)
         """
-        has_project = self.has_project_selected()
-        has_area = self.has_area_selected()
-
         # CRÍTICO: Nunca deben estar ambos seleccionados
-        assert not (has_project and has_area), \
-            "ERROR: Proyecto y Área no pueden estar seleccionados simultáneamente"
+        # (solo en modo debug: con -O el bloque completo desaparece)
+        if __debug__:
+            has_project = self.project_combo.currentData() is not None
+            has_area = self.area_combo.currentData() is not None
+            assert not (has_project and has_area), \
+                "ERROR: Proyecto y Área no pueden estar seleccionados simultáneamente"
 
         return True
 
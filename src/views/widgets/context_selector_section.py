@@ -15,7 +15,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import pyqtSignal, Qt, QObject, QEvent
 from PyQt6.QtGui import QFont
-from src.views.widgets.context_selector_compact import PopupPositionFilter
+from src.views.widgets.context_selector_compact import ContextComboBox
 import logging
 
 logger = logging.getLogger(__name__)
@@ -65,11 +65,12 @@ class SelectorWithCreate(QWidget):
         self.label.setFixedWidth(80)
 
         # ComboBox con búsqueda
-        self.combo = QComboBox()
+        self.combo = ContextComboBox()
         self.combo.setPlaceholderText(placeholder)
         self.combo.setMinimumHeight(35)
         self.combo.setEditable(True)
         self.combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.combo.watch_completer_popup()
 
         # Configurar autocompletado (Buscador)
         completer = self.combo.completer()
@@ -118,17 +119,6 @@ class SelectorWithCreate(QWidget):
             combo_view.window().windowFlags() | Qt.WindowType.Popup
         )
 
-        # Instalar event filters para ajustar posición del popup
-        popup_filter_completer = PopupPositionFilter(self.combo, completer, self.combo)
-        completer.popup().installEventFilter(popup_filter_completer)
-
-        popup_filter_combo = PopupPositionFilter(self.combo, None, self.combo)
-        combo_view.window().installEventFilter(popup_filter_combo)
-
-        # Guardar referencias para evitar que sean recolectados por el GC
-        self.combo._popup_filter_completer = popup_filter_completer
-        self.combo._popup_filter_combo = popup_filter_combo
-
         # Botón crear
         self.create_btn = QPushButton("+")
         self.create_btn.setFixedSize(35, 35)
@@ -703,10 +703,11 @@ class ItemFieldsSection(QWidget):
         Returns:
             Lista de dicts con filepath y label
         """
+        # El label se lee del widget: label_changed llega con retardo (debounce)
         return [
             {
                 'filepath': s['filepath'],
-                'label': s['label']
+                'label': s['widget'].get_label()
             }
             for s in self.screenshots
         ]
@@ -730,7 +731,12 @@ class ItemFieldsSection(QWidget):
                     filepath = screenshot_data.get('filepath', '')
                     label = screenshot_data.get('label', 'Captura')
 
-                    if not filepath or not os.path.exists(filepath):
+                    # Un solo stat: comprueba existencia y lo reutiliza el preview
+                    try:
+                        file_stat = os.stat(filepath) if filepath else None
+                    except OSError:
+                        file_stat = None
+                    if file_stat is None:
                         logger.warning(f"Screenshot file not found: {filepath}")
                         continue
 
@@ -738,7 +744,8 @@ class ItemFieldsSection(QWidget):
                     preview_widget = ScreenshotPreviewWidget(
                         image_path=filepath,
                         label=label,
-                        parent=self
+                        parent=self,
+                        file_stat=file_stat
                     )
 
                     # Conectar señales
@@ -5,14 +5,17 @@ Selector de lista existente o creación de nueva lista
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
-    QPushButton, QFrame
+    QPushButton, QFrame, QListView
 )
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSignalBlocker
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Texto de la opción para crear una lista nueva (dato None)
+_NEW_LIST_TEXT = "➕ Nueva lista..."
+
 
 class ListNameSection(QWidget):
     """
@@ -33,8 +36,67 @@ class ListNameSection(QWidget):
     list_changed = pyqtSignal(object, str)  # (list_id or None, list_name)
     create_list_clicked = pyqtSignal()
 
+    # Hoja de estilos compartida por todas las instancias (combo y botón "+")
+    _STYLE_SHEET = """
+        ListNameSection {
+            background-color: #252525;
+            border-radius: 6px;
+        }
+        QComboBox {
+            background-color: #2d2d2d;
+            color: #ffffff;
+            border: 1px solid #444;
+            border-radius: 4px;
+            padding: 6px 12px;
+            font-size: 11px;
+        }
+        QComboBox:hover {
+            background-color: #353535;
+        }
+        QComboBox:focus {
+            border: 1px solid #2196F3;
+        }
+        QComboBox::drop-down {
+            border: none;
+            width: 20px;
+        }
+        QComboBox::down-arrow {
+            image: none;
+            border-left: 4px solid transparent;
+            border-right: 4px solid transparent;
+            border-top: 6px solid #888;
+            width: 0;
+            height: 0;
+        }
+        QComboBox QAbstractItemView {
+            background-color: #2d2d2d;
+            color: #ffffff;
+            selection-background-color: #2196F3;
+            border: 1px solid #444;
+        }
+        QPushButton {
+            background-color: #2196F3;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            font-weight: bold;
+            font-size: 16px;
+        }
+        QPushButton:hover {
+            background-color: #1976D2;
+        }
+        QPushButton:pressed {
+            background-color: #0D47A1;
+        }
+        QLabel {
+            color: #ffffff;
+            font-size: 11px;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._id_to_index = {}  # list_id -> índice en el combo (evita findData)
         self._setup_ui()
         self._apply_styles()
         self._connect_signals()
@@ -59,6 +121,14 @@ class ListNameSection(QWidget):
         self.list_combo = QComboBox()
         self.list_combo.setPlaceholderText("Seleccionar lista...")
         self.list_combo.setMinimumHeight(30)
+
+        # Vista de lista virtualizada: filas de alto uniforme, layout por lotes
+        view = QListView(self.list_combo)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(50)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_combo.setView(view)
         field_layout.addWidget(self.list_combo, 1)
 
         # Botón crear lista
@@ -71,68 +141,15 @@ class ListNameSection(QWidget):
 
     def _apply_styles(self):
         """Aplica estilos CSS"""
-        self.setStyleSheet("""
-            ListNameSection {
-                background-color: #252525;
-                border-radius: 6px;
-            }
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-            }
-            QComboBox:hover {
-                background-color: #353535;
-            }
-            QComboBox:focus {
-                border: 1px solid #2196F3;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #888;
-                width: 0;
-                height: 0;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                selection-background-color: #2196F3;
-                border: 1px solid #444;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 11px;
-            }
-        """)
+        self.setStyleSheet(self._STYLE_SHEET)
 
     def _connect_signals(self):
-        """Conecta señales internas"""
-        self.list_combo.currentIndexChanged.connect(self._on_list_changed)
-        self.create_btn.clicked.connect(self.create_list_clicked.emit)
+        """Conecta señales internas (todas en el hilo de la GUI: conexión directa)"""
+        direct = Qt.ConnectionType.DirectConnection
+        self.list_combo.currentIndexChanged.connect(self._on_list_changed, direct)
+        self.create_btn.clicked.connect(self.create_list_clicked.emit, direct)
 
+    @pyqtSlot(int)
     def _on_list_changed(self, index: int):
         """Callback cuando cambia la selección"""
         list_id = self.get_selected_list_id()
@@ -148,15 +165,31 @@ class ListNameSection(QWidget):
             lists: Lista de tuplas (id, name)
             include_new_option: Si incluir opción "Nueva lista..." al inicio
         """
-        self.list_combo.clear()
+        offset = 1 if include_new_option else 0
+        self._id_to_index = {}
 
+        # Modelo con todas sus filas reservadas de una vez, llenado en su lugar
+        model = QStandardItemModel(len(lists) + offset, 1, self.list_combo)
         if include_new_option:
-            self.list_combo.addItem("➕ Nueva lista...", None)
-
-        for list_id, list_name in lists:
-            self.list_combo.addItem(list_name, list_id)
-
-        logger.debug(f"Cargadas {len(lists)} listas en selector")
+            model.setItem(0, QStandardItem(_NEW_LIST_TEXT))
+        for row, (list_id, list_name) in enumerate(lists, start=offset):
+            item = QStandardItem(list_name)
+            item.setData(list_id, Qt.ItemDataRole.UserRole)
+            model.setItem(row, item)
+            self._id_to_index[list_id] = row
+
+        # Mismo estado final que clear() + addItem(): sin selección (placeholder).
+        # setModel selecciona la primera fila, así que se instala con señales
+        # bloqueadas y solo se notifica si antes había una selección.
+        previous_index = self.list_combo.currentIndex()
+        with QSignalBlocker(self.list_combo):
+            # El modelo anterior (hijo del combo) lo libera setModel
+            self.list_combo.setModel(model)
+            self.list_combo.setCurrentIndex(-1)
+        if previous_index != -1:
+            self._on_list_changed(-1)
+
+        logger.debug("Cargadas %d listas en selector", len(lists))
 
     def get_selected_list_id(self) -> int | None:
         """
@@ -195,8 +228,8 @@ class ListNameSection(QWidget):
             self.list_combo.setCurrentIndex(0)  # Nueva lista
             return
 
-        index = self.list_combo.findData(list_id)
-        if index >= 0:
+        index = self._id_to_index.get(list_id)
+        if index is not None:
             self.list_combo.setCurrentIndex(index)
         else:
             logger.warning(f"No se encontró lista con ID {list_id}")
@@ -229,14 +262,14 @@ class ListNameSection(QWidget):
             list_id: ID de la nueva lista
             list_name: Nombre de la nueva lista
         """
-        # Agregar al combo
+        # Agregar al combo (queda al final)
+        index = self.list_combo.count()
         self.list_combo.addItem(list_name, list_id)
+        self._id_to_index[list_id] = index
 
         # Seleccionar la lista recién agregada
-        index = self.list_combo.findData(list_id)
-        if index >= 0:
-            self.list_combo.setCurrentIndex(index)
-            logger.info(f"Lista '{list_name}' agregada y seleccionada")
+        self.list_combo.setCurrentIndex(index)
+        logger.info(f"Lista '{list_name}' agregada y seleccionada")
 
     def select_list_by_id(self, list_id: int):
         """
@@ -245,8 +278,8 @@ class ListNameSection(QWidget):
         Args:
             list_id: ID de la lista a seleccionar
         """
-        index = self.list_combo.findData(list_id)
-        if index >= 0:
+        index = self._id_to_index.get(list_id)
+        if index is not None:
             self.list_combo.setCurrentIndex(index)
             logger.debug(f"Lista ID {list_id} seleccionada (index: {index})")
         else:
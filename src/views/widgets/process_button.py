@@ -4,12 +4,40 @@ Process Button Widget - Button for active processes in sidebar
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QFont
-import sys
-from pathlib import Path
+from string import Template
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# "styles" resolves through the src/ entry main.py puts on sys.path; importing it
+# under that same name shares the theme instance with the rest of the views
 from styles.futuristic_theme import get_theme
 
+# Theme shared by every button (see _theme)
+_THEME = None
+
+# Font shared by every button (see _button_font)
+_BUTTON_FONT = None
+
+
+def _theme():
+    """Get the global theme, looked up once for all buttons"""
+    global _THEME
+    if _THEME is None:
+        _THEME = get_theme()
+    return _THEME
+
+
+def _button_font() -> QFont:
+    """
+    Get the button font, built once for all buttons
+
+    Not built at import time: the module can load before the QApplication.
+    """
+    global _BUTTON_FONT
+    if _BUTTON_FONT is None:
+        _BUTTON_FONT = QFont()
+        _BUTTON_FONT.setPointSize(9)
+        _BUTTON_FONT.setBold(False)
+    return _BUTTON_FONT
+
 
 class ProcessButton(QPushButton):
     """Custom process button widget for sidebar"""
@@ -17,18 +45,116 @@ class ProcessButton(QPushButton):
     # Signal emitted when button is clicked
     clicked = pyqtSignal(int)  # process_id
 
+    # Active state - with accent border and gradient background
+    _ACTIVE_STYLE_TEMPLATE = Template("""
+        QPushButton {
+            background-color: #1a3d4d;
+            color: $text_primary;
+            border: 2px solid $primary;
+            border-left: 5px solid $primary;
+            border-radius: 4px;
+            padding: 5px;
+            text-align: center;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 $primary,
+                stop:1 $secondary
+            );
+            border: 2px solid $primary;
+            border-left: 5px solid $primary;
+        }
+    """)
+
+    # Normal state
+    _NORMAL_STYLE_TEMPLATE = Template("""
+        QPushButton {
+            background-color: #2d2d2d;
+            color: $text_secondary;
+            border: 1px solid #3d3d3d;
+            border-radius: 4px;
+            padding: 5px;
+            text-align: center;
+        }
+        QPushButton:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 $primary,
+                stop:1 $secondary
+            );
+            color: $text_primary;
+            border: 2px solid $primary;
+        }
+        QPushButton:pressed {
+            background-color: #1d1d1d;
+        }
+    """)
+
+    # Formatted (active, normal) sheets per theme palette: (id(theme), palette) -> tuple
+    _STYLE_CACHE = {}
+
     def __init__(self, process_id: int, process_name: str, step_count: int = 0, parent=None):
         super().__init__(parent)
         self.process_id = process_id
         self.process_name = process_name
         self.step_count = step_count
         self.is_active = False
-        self.theme = get_theme()
+        self.theme = _theme()
+        self._current_style = None  # Sheet last applied by update_style
 
         self.init_ui()
 
+    @classmethod
+    def build_batch(cls, layout, specs, index: int = -1) -> list:
+        """
+        Create and insert several process buttons in a single layout pass
+
+        Painting and signals of the layout's widget are suspended while the
+        buttons are added, so Qt lays out and repaints once for the whole batch.
+
+        Args:
+            layout: Box layout that receives the buttons
+            specs: Iterable of (process_id, process_name, step_count)
+            index: Layout position of the first button (-1 appends)
+
+        Returns:
+            List of created buttons, in spec order
+        """
+        parent = layout.parentWidget()
+        buttons = []
+        was_blocked = parent.blockSignals(True)
+        parent.setUpdatesEnabled(False)
+        try:
+            for offset, (process_id, process_name, step_count) in enumerate(specs):
+                button = cls(process_id, process_name, step_count, parent)
+                layout.insertWidget(-1 if index < 0 else index + offset, button)
+                buttons.append(button)
+        finally:
+            parent.setUpdatesEnabled(True)
+            parent.blockSignals(was_blocked)
+        parent.update()
+        return buttons
+
     def init_ui(self):
         """Initialize button UI"""
+        self._update_text()
+
+        # Set fixed size - same width as category buttons
+        self.setFixedSize(70, 60)
+
+        # Set font
+        self.setFont(_button_font())
+
+        # Enable cursor change on hover
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        # Apply default style
+        self.update_style()
+
+    def _update_text(self):
+        """Set button text and tooltip from process name and step count"""
         # Set button text with step count if available
         if self.step_count > 0:
             button_text = f"{self.process_name}\n({self.step_count})"
@@ -43,73 +169,53 @@ class ProcessButton(QPushButton):
             tooltip += f"\n{self.step_count} paso{'s' if self.step_count != 1 else ''}"
         self.setToolTip(tooltip)
 
-        # Set fixed size - same width as category buttons
-        self.setFixedSize(70, 60)
-
-        # Set font
-        font = QFont()
-        font.setPointSize(9)
-        font.setBold(False)
-        self.setFont(font)
-
-        # Enable cursor change on hover
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    def set_process_info(self, process_name: str, step_count: int):
+        """
+        Update the process shown by an existing button
 
-        # Apply default style
-        self.update_style()
+        Does nothing when neither value changed, so refreshes leave untouched
+        buttons alone.
+        """
+        if process_name == self.process_name and step_count == self.step_count:
+            return
+        self.process_name = process_name
+        self.step_count = step_count
+        self._update_text()
 
     def update_style(self):
         """Update button style based on state"""
-        if self.is_active:
-            # Active state - with accent border and gradient background
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #1a3d4d;
-                    color: {self.theme.get_color('text_primary')};
-                    border: 2px solid {self.theme.get_color('primary')};
-                    border-left: 5px solid {self.theme.get_color('primary')};
-                    border-radius: 4px;
-                    padding: 5px;
-                    text-align: center;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 {self.theme.get_color('primary')},
-                        stop:1 {self.theme.get_color('secondary')}
-                    );
-                    border: 2px solid {self.theme.get_color('primary')};
-                    border-left: 5px solid {self.theme.get_color('primary')};
-                }}
-            """)
-        else:
-            # Normal state
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #2d2d2d;
-                    color: {self.theme.get_color('text_secondary')};
-                    border: 1px solid #3d3d3d;
-                    border-radius: 4px;
-                    padding: 5px;
-                    text-align: center;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 {self.theme.get_color('primary')},
-                        stop:1 {self.theme.get_color('secondary')}
-                    );
-                    color: {self.theme.get_color('text_primary')};
-                    border: 2px solid {self.theme.get_color('primary')};
-                }}
-                QPushButton:pressed {{
-                    background-color: #1d1d1d;
-                }}
-            """)
+        active_style, normal_style = self._styles_for(self.theme)
+        style = active_style if self.is_active else normal_style
+        # Same cached string as before: skip Qt's CSS reparse and re-polish
+        if style is not self._current_style:
+            self.setStyleSheet(style)
+            self._current_style = style
+
+    @classmethod
+    def _styles_for(cls, theme) -> tuple:
+        """
+        Get the (active, normal) stylesheets for a theme palette
+
+        Both sheets are formatted once per palette and shared by every button.
+        """
+        key = (id(theme), theme.current_palette)
+        styles = cls._STYLE_CACHE.get(key)
+        if styles is None:
+            colors = {
+                name: theme.get_color(name)
+                for name in ('primary', 'secondary', 'text_primary', 'text_secondary')
+            }
+            styles = (
+                cls._ACTIVE_STYLE_TEMPLATE.substitute(colors),
+                cls._NORMAL_STYLE_TEMPLATE.substitute(colors),
+            )
+            cls._STYLE_CACHE[key] = styles
+        return styles
 
     def set_active(self, active: bool):
-        """Set button active state"""
+        """Set button active state (no-op if unchanged)"""
+        if active == self.is_active:
+            return
         self.is_active = active
         self.update_style()
 
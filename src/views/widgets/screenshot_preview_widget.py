@@ -17,11 +17,112 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QLineEdit, QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QFont
+from collections import OrderedDict
 from pathlib import Path
 import os
 
+from src.core.thumbnail_loader import ThumbnailLoader
+
+# Las miniaturas se guardan en QPixmapCache (caché global de Qt, limitada en
+# bytes). Sus dimensiones originales, que QPixmapCache no guarda, viven aquí:
+# {clave: (ancho, alto)}, con el mismo orden LRU
+_THUMB_DIMS: "OrderedDict[str, tuple]" = OrderedDict()
+_THUMB_DIMS_MAX = 1024
+
+# Lado de la miniatura en píxeles lógicos
+_THUMB_SIZE = 100
+
+
+# Fuentes compartidas por todos los previews (ver _preview_fonts)
+_PREVIEW_FONTS = None
+
+
+def _preview_fonts() -> tuple:
+    """
+    Obtener las fuentes del preview, creadas una sola vez
+
+    No se construyen al importar: el módulo puede cargarse antes que la QApplication.
+
+    Returns:
+        (fuente del título en negrita, fuente de la información del archivo)
+    """
+    global _PREVIEW_FONTS
+    if _PREVIEW_FONTS is None:
+        _PREVIEW_FONTS = (
+            QFont("Segoe UI", 9, QFont.Weight.Bold),
+            QFont("Segoe UI", 8),
+        )
+    return _PREVIEW_FONTS
+
+
+def _thumb_cache_key(path: str, st: os.stat_result, dpr: float) -> str:
+    """
+    Clave de caché de una miniatura (cambia si el archivo se modifica)
+
+    Args:
+        path: Ruta de la imagen
+        st: os.stat del archivo
+        dpr: Device pixel ratio con el que se escaló la miniatura
+
+    Returns:
+        Clave para QPixmapCache
+    """
+    return f"screenshot_thumb|{path}|{st.st_mtime_ns}|{st.st_size}|{dpr:g}"
+
+
+def _get_cached_thumb(key: str, path: str):
+    """
+    Buscar una miniatura en la caché
+
+    Si la miniatura sigue en QPixmapCache pero sus dimensiones salieron de
+    _THUMB_DIMS, se leen de la cabecera de la imagen (sin decodificar píxeles)
+    en vez de volver a decodificarla.
+
+    Args:
+        key: Clave de _thumb_cache_key()
+        path: Ruta de la imagen
+
+    Returns:
+        (QPixmap, ancho, alto) o None si no está
+    """
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        # Nunca guardada o descartada por Qt por límite de memoria
+        _THUMB_DIMS.pop(key, None)
+        return None
+
+    dims = _THUMB_DIMS.get(key)
+    if dims is None:
+        size = QImageReader(path).size()
+        if not size.isValid():
+            return None
+        dims = (size.width(), size.height())
+        _THUMB_DIMS[key] = dims
+        if len(_THUMB_DIMS) > _THUMB_DIMS_MAX:
+            _THUMB_DIMS.popitem(last=False)
+    else:
+        _THUMB_DIMS.move_to_end(key)
+    return (pixmap, *dims)
+
+
+def _store_thumb(key: str, entry: tuple):
+    """
+    Guardar una miniatura en la caché
+
+    Args:
+        key: Clave de _thumb_cache_key()
+        entry: (QPixmap, ancho, alto)
+    """
+    pixmap, width, height = entry
+    if not QPixmapCache.insert(key, pixmap):
+        return  # Más grande que el límite de la caché
+    _THUMB_DIMS[key] = (width, height)
+    _THUMB_DIMS.move_to_end(key)
+    if len(_THUMB_DIMS) > _THUMB_DIMS_MAX:
+        _THUMB_DIMS.popitem(last=False)
+
 
 class ScreenshotPreviewWidget(QFrame):
     """
@@ -36,7 +137,53 @@ class ScreenshotPreviewWidget(QFrame):
     remove_requested = pyqtSignal()
     label_changed = pyqtSignal(str)  # new_label
 
-    def __init__(self, image_path: str, label: str = "", parent=None):
+    # Espera tras la última tecla antes de emitir label_changed (ms)
+    LABEL_DEBOUNCE_MS = 150
+
+    # Hoja de estilos compartida por todas las instancias (incluye miniatura y
+    # etiquetas de archivo: una sola hoja que analizar por preview)
+    _STYLE_SHEET = """
+        ScreenshotPreviewWidget {
+            background-color: #2d2d2d;
+            border: 1px solid #444;
+            border-radius: 6px;
+        }
+        QLabel#previewThumbnail {
+            border: 2px solid #555;
+            border-radius: 4px;
+            background-color: #2d2d2d;
+        }
+        QLabel#previewFileInfo {
+            color: #888;
+        }
+        QLineEdit {
+            background-color: #1e1e1e;
+            color: #cccccc;
+            border: 1px solid #3d3d3d;
+            border-radius: 4px;
+            padding: 4px 8px;
+            font-size: 10pt;
+        }
+        QLineEdit:focus {
+            border: 1px solid #007acc;
+        }
+        QPushButton {
+            background-color: #d32f2f;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #b71c1c;
+        }
+        QPushButton:pressed {
+            background-color: #7f0000;
+        }
+    """
+
+    def __init__(self, image_path: str, label: str = "", parent=None,
+                 file_stat: os.stat_result = None):
         """
         Inicializar widget de preview
 
@@ -44,16 +191,27 @@ class ScreenshotPreviewWidget(QFrame):
             image_path: Ruta completa a la imagen
             label: Label inicial de la captura
             parent: Widget padre
+            file_stat: Resultado de os.stat(image_path) si el llamador ya lo tiene
+                (evita repetir la llamada al sistema)
         """
         super().__init__(parent)
 
         self.image_path = image_path
         self._label = label
+        self._basename = os.path.basename(image_path)
+        self._file_size = 0
+        self._thumb_key = None  # Clave de la miniatura en QPixmapCache
+        self._thumb_dpr = 1.0  # Device pixel ratio de la miniatura
+        self._thumb_request = None  # Carga de miniatura en curso (ThumbnailRequest)
+
+        self._file_stat = file_stat
 
         self._setup_ui()
         self._apply_styles()
-        self._load_image()
-        self._load_metadata()
+
+        # Miniatura y metadatos en la siguiente vuelta del event loop: el diálogo
+        # se pinta primero con "Cargando..." y se completa después
+        QTimer.singleShot(0, self._load_image_and_metadata)
 
     def _setup_ui(self):
         """Configurar interfaz del widget"""
@@ -68,16 +226,11 @@ class ScreenshotPreviewWidget(QFrame):
 
         # Miniatura (izquierda)
         self.thumbnail_label = QLabel()
-        self.thumbnail_label.setFixedSize(100, 100)
+        self.thumbnail_label.setFixedSize(_THUMB_SIZE, _THUMB_SIZE)
         self.thumbnail_label.setScaledContents(False)
         self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumbnail_label.setStyleSheet("""
-            QLabel {
-                border: 2px solid #555;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-            }
-        """)
+        self.thumbnail_label.setObjectName("previewThumbnail")
+        self.thumbnail_label.setText("Cargando...")
         layout.addWidget(self.thumbnail_label)
 
         # Contenedor de información (centro)
@@ -89,27 +242,33 @@ class ScreenshotPreviewWidget(QFrame):
         label_layout.setSpacing(5)
 
         label_title = QLabel("Label:")
-        label_title.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        title_font, info_font = _preview_fonts()
+        label_title.setFont(title_font)
         label_layout.addWidget(label_title)
 
         self.label_input = QLineEdit()
         self.label_input.setText(self._label)
         self.label_input.setPlaceholderText("Nombre de la captura...")
         self.label_input.textChanged.connect(self._on_label_changed)
+        # Una sola emisión de label_changed por ráfaga de teclas
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(self.LABEL_DEBOUNCE_MS)
+        self._label_timer.timeout.connect(self._emit_label_changed)
         label_layout.addWidget(self.label_input)
 
         info_layout.addLayout(label_layout)
 
         # Nombre de archivo
-        self.filename_label = QLabel(os.path.basename(self.image_path))
-        self.filename_label.setFont(QFont("Segoe UI", 8))
-        self.filename_label.setStyleSheet("color: #888;")
+        self.filename_label = QLabel(self._basename)
+        self.filename_label.setFont(info_font)
+        self.filename_label.setObjectName("previewFileInfo")
         info_layout.addWidget(self.filename_label)
 
         # Metadatos (dimensiones, tamaño)
         self.metadata_label = QLabel("Cargando...")
-        self.metadata_label.setFont(QFont("Segoe UI", 8))
-        self.metadata_label.setStyleSheet("color: #888;")
+        self.metadata_label.setFont(info_font)
+        self.metadata_label.setObjectName("previewFileInfo")
         info_layout.addWidget(self.metadata_label)
 
         info_layout.addStretch()
@@ -126,97 +285,112 @@ class ScreenshotPreviewWidget(QFrame):
 
     def _apply_styles(self):
         """Aplicar estilos CSS"""
-        self.setStyleSheet("""
-            ScreenshotPreviewWidget {
-                background-color: #2d2d2d;
-                border: 1px solid #444;
-                border-radius: 6px;
-            }
-            QLineEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-            QPushButton {
-                background-color: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-            QPushButton:pressed {
-                background-color: #7f0000;
-            }
-        """)
-
-    def _load_image(self):
-        """Cargar imagen y crear miniatura"""
-        if not os.path.exists(self.image_path):
+        self.setStyleSheet(self._STYLE_SHEET)
+
+    @pyqtSlot()
+    def _load_image_and_metadata(self):
+        """
+        Cargar imagen, crear miniatura y mostrar metadatos
+
+        La imagen se decodifica una sola vez y fuera del hilo de la GUI: la
+        miniatura y las dimensiones llegan juntas en _on_thumb_loaded().
+        Si el mismo archivo ya se decodificó (sin cambios), se usa la caché.
+        Reutiliza el os.stat recibido en el constructor si lo hay.
+        """
+        st, self._file_stat = self._file_stat, None
+        try:
+            if st is None:
+                st = os.stat(self.image_path)
+        except FileNotFoundError:
             self.thumbnail_label.setText("❌\nNo encontrada")
+            self.metadata_label.setText("Archivo no encontrado")
+            return
+        except OSError:
+            self.thumbnail_label.setText("❌\nError carga")
+            self.metadata_label.setText("Error leyendo metadatos")
             return
 
-        try:
-            # Cargar imagen
-            pixmap = QPixmap(self.image_path)
+        self._file_size = st.st_size
 
-            if pixmap.isNull():
-                self.thumbnail_label.setText("❌\nError carga")
-                return
+        # Escalar a píxeles físicos: en pantallas HiDPI Qt pinta la miniatura
+        # tal cual, sin reescalarla en cada repintado
+        self._thumb_dpr = self.thumbnail_label.devicePixelRatioF()
 
-            # Escalar manteniendo aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                100, 100,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        # La clave cambia si el archivo se modifica: nunca se muestra una miniatura vieja
+        self._thumb_key = _thumb_cache_key(self.image_path, st, self._thumb_dpr)
+        cached = _get_cached_thumb(self._thumb_key, self.image_path)
+        if cached is not None:
+            self._show_thumb(*cached)
+            return
 
-            self.thumbnail_label.setPixmap(scaled_pixmap)
+        request = ThumbnailLoader.instance().request(
+            self.image_path, self._on_thumb_loaded,
+            size=round(_THUMB_SIZE * self._thumb_dpr)
+        )
+        self._thumb_request = request
+        # Si el preview se destruye antes, la decodificación pendiente se descarta
+        self.destroyed.connect(lambda *_: request.cancel())
 
-        except Exception as e:
-            self.thumbnail_label.setText(f"❌\n{str(e)[:20]}")
+    @pyqtSlot(QImage, int, int)
+    def _on_thumb_loaded(self, image: QImage, width: int, height: int):
+        """
+        Mostrar la miniatura decodificada en segundo plano
 
-    def _load_metadata(self):
-        """Cargar metadatos de la imagen"""
-        if not os.path.exists(self.image_path):
-            self.metadata_label.setText("Archivo no encontrado")
-            return
+        Args:
+            image: Miniatura ya escalada (nula si falló la carga)
+            width: Ancho original de la imagen
+            height: Alto original de la imagen
+        """
+        self._thumb_request = None
 
-        try:
-            # Obtener dimensiones
-            pixmap = QPixmap(self.image_path)
-            width = pixmap.width()
-            height = pixmap.height()
-
-            # Obtener tamaño de archivo
-            file_size = os.path.getsize(self.image_path)
-            size_kb = file_size / 1024
-
-            # Formatear
-            if size_kb < 1024:
-                size_str = f"{size_kb:.0f}KB"
-            else:
-                size_mb = size_kb / 1024
-                size_str = f"{size_mb:.1f}MB"
-
-            metadata_text = f"{width}×{height} • {size_str}"
-            self.metadata_label.setText(metadata_text)
-
-        except Exception as e:
+        if image.isNull():
+            self.thumbnail_label.setText("❌\nError carga")
             self.metadata_label.setText("Error leyendo metadatos")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self._thumb_dpr)
+        entry = (pixmap, width, height)
+        _store_thumb(self._thumb_key, entry)
+        self._show_thumb(*entry)
+
+    def _show_thumb(self, pixmap: QPixmap, width: int, height: int):
+        """
+        Mostrar miniatura y metadatos
+
+        Args:
+            pixmap: Miniatura ya escalada
+            width: Ancho original de la imagen
+            height: Alto original de la imagen
+        """
+        self.thumbnail_label.setPixmap(pixmap)
+        self.metadata_label.setText(f"{width}×{height} • {self._format_size(self._file_size)}")
+
+    @staticmethod
+    def _format_size(file_size: int) -> str:
+        """
+        Formatear tamaño de archivo
+
+        Args:
+            file_size: Tamaño en bytes
+
+        Returns:
+            Tamaño en KB o MB (ej: "480KB", "1.2MB")
+        """
+        size_kb = file_size / 1024
+        if size_kb < 1024:
+            return f"{size_kb:.0f}KB"
+        size_mb = size_kb / 1024
+        return f"{size_mb:.1f}MB"
 
     def _on_label_changed(self, new_text: str):
-        """Callback cuando cambia el label"""
+        """Callback cuando cambia el label (la señal sale al dejar de escribir)"""
         self._label = new_text
-        self.label_changed.emit(new_text)
+        self._label_timer.start()
+
+    def _emit_label_changed(self):
+        """Emitir label_changed con el label final de la ráfaga de teclas"""
+        self.label_changed.emit(self._label)
 
     def _on_remove_clicked(self):
         """Callback cuando se hace clic en eliminar"""
@@ -232,4 +406,4 @@ class ScreenshotPreviewWidget(QFrame):
 
     def get_filename(self) -> str:
         """Obtener solo nombre de archivo"""
-        return os.path.basename(self.image_path)
+        return self._basename
@@ -0,0 +1,68 @@
+"""
+Regresiones de DANGEROUS_PATTERNS
+
+Los patrones reescritos para escanear en tiempo lineal deben detectar lo mismo
+que los originales ([^>]* / .*).
+"""
+
+import re
+import time
+
+import pytest
+
+from src.utils.constants import DANGEROUS_PATTERN_LABELS, find_dangerous
+
+DANGEROUS_SAMPLES = [
+    # '<' dentro de un atributo entrecomillado previo
+    "<img alt='<' src='http://x'>",
+    '<script data-x="<" src="http://evil/x.js">',
+    "<link title='a<b' rel='stylesheet' href='https://x/a.css'>",
+    # Otro inicio del mismo tag dentro del atributo
+    "<img alt='<img' src='http://x'>",
+    "<script data-x='<scrip<' src='x.js'>",
+    # Atributos largos antes del atributo peligroso
+    '<img alt="' + 'a' * 5000 + '" src="http://x">',
+    '<link ' + 'data-x="y" ' * 1000 + 'href="http://x/a.css">',
+    # Casos ordinarios
+    '<script src="app.js"></script>',
+    '<SCRIPT\nsrc="app.js">',
+    'import x from "y"',
+    'import\n\n  { a, b } from "y"',
+    'import { ' + 'a, ' * 1000 + '} from "y"',
+    'import x importfrom',
+]
+
+SAFE_SAMPLES = [
+    '<img src="local.png">',
+    '<img alt=">" src="http://x">',
+    '<link href="styles.css">',
+    '<script>console.log(1)</script>',
+    'important\nfrom',
+    '<p>hola</p>',
+]
+
+
+@pytest.mark.parametrize('text', DANGEROUS_SAMPLES)
+def test_dangerous_samples_detected(text):
+    assert find_dangerous(text) is not None
+
+
+@pytest.mark.parametrize('text', SAFE_SAMPLES)
+def test_safe_samples_not_detected(text):
+    assert find_dangerous(text) is None
+
+
+@pytest.mark.parametrize('text', DANGEROUS_SAMPLES + SAFE_SAMPLES)
+def test_rewritten_patterns_match_baseline(text):
+    # Las etiquetas son los patrones originales ([^>]* / .*)
+    for pattern, original in DANGEROUS_PATTERN_LABELS.items():
+        expected = re.search(original, text, re.IGNORECASE) is not None
+        assert (re.search(pattern, text, re.IGNORECASE) is not None) == expected
+
+
+@pytest.mark.parametrize('unit', ['<img', '<img<im', '<script ', 'import ', "<link '<"])
+def test_scan_is_linear_on_crafted_input(unit):
+    text = unit * (500 * 1024 // len(unit))
+    start = time.perf_counter()
+    find_dangerous(text)
+    assert time.perf_counter() - start < 2.0